@@ -1,4 +1,4 @@
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
 
 from common.models import BaseModel
@@ -20,6 +20,9 @@ class AuthUser(BaseModel, AbstractUser):
     )
     locale = models.CharField(max_length=10, blank=True)
 
+    # BaseModel 의 objects 가 AbstractUser 의 UserManager 를 가리지 않도록 다시 선언합니다.
+    objects = UserManager()
+
     class Meta:
         db_table = "user"
         indexes = [models.Index(fields=["social_id", "social_provider"])]
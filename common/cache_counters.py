@@ -0,0 +1,43 @@
+from django.core.cache import cache
+
+
+def incr_counter(key: str):
+    # 버전/카운터 키는 만료되지 않아야 하므로 timeout=None 으로 생성합니다.
+    cache.add(key, 0, timeout=None)
+    cache.incr(key)
+
+
+async def aincr_counter(key: str):
+    await cache.aadd(key, 0, timeout=None)
+    await cache.aincr(key)
+
+
+class CacheHitCounter:
+    """
+    캐시의 hit/miss 횟수를 default 캐시에 저장합니다.
+    """
+
+    def __init__(self, key_prefix: str):
+        self.hits_key = f"{key_prefix}:hits"
+        self.misses_key = f"{key_prefix}:misses"
+
+    def record(self, hit: bool):
+        incr_counter(self.hits_key if hit else self.misses_key)
+
+    async def arecord(self, hit: bool):
+        await aincr_counter(self.hits_key if hit else self.misses_key)
+
+    def stats(self) -> dict:
+        counters = cache.get_many([self.hits_key, self.misses_key])
+        hits = counters.get(self.hits_key, 0)
+        misses = counters.get(self.misses_key, 0)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def reset(self):
+        cache.delete_many([self.hits_key, self.misses_key])
+
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from common.cache_counters import CacheHitCounter
+
+
+class CacheStatsCommand(BaseCommand):
+    """
+    counter 의 hit/miss 카운터를 출력하는 관리 명령의 기반 클래스입니다.
+    """
+
+    counter: CacheHitCounter = None
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="출력 후 카운터를 초기화합니다."
+        )
+
+    def handle(self, *args, **options):
+        for key, value in self.counter.stats().items():
+            self.stdout.write(f"{key}: {value}")
+
+        if options["reset"]:
+            self.counter.reset()
+
+
+class Command(CacheStatsCommand):
+    help = "key_prefix 로 지정한 캐시의 hit/miss 카운터를 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("key_prefix", help="CacheHitCounter 의 key prefix")
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.counter = CacheHitCounter(options["key_prefix"])
+        super().handle(*args, **options)
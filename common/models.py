@@ -2,11 +2,37 @@ from django.db import models
 from django.utils import timezone
 
 
+class SoftDeleteQuerySet(models.QuerySet):
+    def live(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def soft_delete(self) -> int:
+        """
+        삭제되지 않은 행의 deleted_at 을 한 번의 UPDATE 로 설정합니다.
+        :return: 삭제 처리된 행 수
+        """
+        now = timezone.now()
+        return self.live().update(deleted_at=now, updated_at=now)
+
+
+class LiveManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    삭제되지 않은(deleted_at IS NULL) 행만 조회하는 매니저입니다.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().live()
+
+
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True)
 
+    # objects 가 기본 매니저(삭제된 행 포함)이고, live 는 삭제된 행을 제외합니다.
+    objects = models.Manager.from_queryset(SoftDeleteQuerySet)()
+    live = LiveManager()
+
     @property
     def is_deleted(self):
         return self.deleted_at is not None
@@ -17,5 +43,4 @@ class BaseModel(models.Model):
         indexes = [
             models.Index(fields=["created_at"]),
             models.Index(fields=["updated_at"]),
-            models.Index(fields=["deleted_at"]),
         ]
@@ -2,6 +2,7 @@ import os
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
@@ -23,14 +24,40 @@ app.conf.beat_schedule = {
         "schedule": crontab(hour=0, minute=0),  # 매일 자정에 실행
         "args": (10,),  # 검색어 개수
     },
+    "expire-jobs": {
+        "task": "jobs.tasks.expire_jobs",
+        "schedule": crontab(minute="*/10"),  # 10분마다 실행
+        "args": (),
+    },
     "process_insights_to_structured_info": {
         "task": "insights.tasks.process_insights_to_structured_info",
         "schedule": crontab(day_of_week=1, hour=0, minute=0),  # 매주 월요일 자정에 실행
         "args": (),  # 인자 없음
     },
+    "poll-structured-info-batches": {
+        "task": "insights.tasks.poll_structured_info_batches",
+        "schedule": crontab(minute="*/10"),  # 10분마다 제출한 Batch 결과 확인
+        "args": (),
+    },
 }
 
 
+@worker_process_init.connect
+def warm_up_llm_processors(**kwargs):
+    """
+    워커 프로세스마다 OpenAI 클라이언트와 tiktoken 인코더를 미리 만들어 둡니다.
+    """
+    from django.conf import settings
+
+    from insights.processors.registry import processor_registry
+
+    try:
+        processor_registry.warm_up(settings.INSIGHT_LLM_MODELS)
+    except Exception as e:
+        # 실패해도 처음 사용할 때 다시 만듭니다.
+        print(f"Error warming up LLM processors: {e}")
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
@@ -119,6 +119,24 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Cache
+# GPT 응답 캐시 유지 기간(초). 0 이면 캐시 사용 안 함
+LLM_CACHE_TIMEOUT = int(os.getenv("LLM_CACHE_TIMEOUT", 60 * 60 * 24 * 90))
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("CACHE_URL", "redis://redis:6379/1"),
+    },
+    # GPT 응답 캐시. 크기 제한과 LRU 삭제는 전용 Redis(llm-cache)의 maxmemory 설정이 담당합니다.
+    "llm": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("LLM_CACHE_URL", "redis://llm-cache:6379/0"),
+        "TIMEOUT": LLM_CACHE_TIMEOUT or None,
+    },
+}
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 LANGUAGE_CODE = "en-us"
@@ -144,6 +162,34 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Job search
+# "database": MySQL FULLTEXT(SQLite 는 icontains) 검색, "inverted_index": 프로세스 내 역색인 검색
+JOB_SEARCH_ENGINE = os.getenv("JOB_SEARCH_ENGINE", "database")
+JOB_SEARCH_INDEX_SYNC_INTERVAL = 60  # 다른 프로세스의 변경사항을 반영하는 주기(초)
+JOB_SEARCH_INDEX_SYNC_MARGIN = 300  # 늦게 커밋된 변경을 놓치지 않도록 겹쳐 읽는 구간(초)
+JOB_LIST_CACHE_TIMEOUT = int(os.getenv("JOB_LIST_CACHE_TIMEOUT", 60))  # 0 이면 캐시 사용 안 함
+
+# Insights
+INSIGHT_COLLECTION_CONCURRENCY = int(os.getenv("INSIGHT_COLLECTION_CONCURRENCY", 3))
+# 검색어 하나의 수집 시간 제한 (초). CELERY_TASK_TIME_LIMIT 보다 짧아야 오류 결과로 끝납니다.
+INSIGHT_COLLECTION_SOFT_TIME_LIMIT = 25 * 60
+INSIGHT_LLM_CONCURRENCY = 5  # 검색어 하나에서 동시에 LLM 처리하는 페이지 수
+INSIGHT_LLM_REQUESTS_PER_SECOND = 2.0
+# 워커 시작 시 tiktoken 인코더를 미리 불러올 모델
+INSIGHT_LLM_MODELS = ["gpt-3.5-turbo", "gpt-4", "gpt-4o-2024-08-06"]
+# GptProcessor 의 HTML 텍스트 추출기 (insights.processors.text_extractors.TEXT_EXTRACTORS)
+INSIGHT_TEXT_EXTRACTOR = os.getenv("INSIGHT_TEXT_EXTRACTOR", "streaming")
+# "combined": 요약 + 카테고리를 한 번에 (structured output), "three_step": 추출 → 요약 → 분류
+INSIGHT_EXTRACTION_MODE = os.getenv("INSIGHT_EXTRACTION_MODE", "combined")
+INSIGHT_EXTRACTION_MODEL = "gpt-4o-2024-08-06"  # combined 모드 (json_schema 지원 모델)
+# 인사이트/정보 테이블의 Chroma collection 을 저장하는 디렉터리
+INSIGHT_VECTOR_STORE_DIR = os.getenv("INSIGHT_VECTOR_STORE_DIR", BASE_DIR / "chroma")
+# 구조화된 정보(본문 필드)가 이 코사인 유사도 이상이면 같은 정보로 보고 기존 행을 갱신합니다.
+# text-embedding-ada-002 는 관련 없는 문장끼리도 0.7~0.8 정도가 나오므로 거의 같은 문장만 묶도록 높게 둡니다.
+INSIGHT_DEDUP_SIMILARITY_THRESHOLD = 0.92
+# 주간 구조화 정보 생성 방식: "batch" (OpenAI Batch API) 또는 "sync" (즉시 호출)
+INSIGHT_STRUCTURED_INFO_BACKEND = os.getenv("INSIGHT_STRUCTURED_INFO_BACKEND", "batch")
+
 # Celery
 CELERY_TIMEZONE = "Asia/Seoul"
 CELERY_TASK_TRACK_STARTED = True
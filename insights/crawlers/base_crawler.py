@@ -1,4 +1,10 @@
+import asyncio
+import codecs
+import importlib.util
+import threading
+import weakref
 from dataclasses import dataclass
+from urllib.parse import urlparse
 
 import httpx
 
@@ -10,26 +16,153 @@ class CrawlTemplate:
     search_word: str
     link: str
     html: str = ""
+    # 조건부 요청에 사용하고, 응답의 값으로 갱신됩니다.
+    etag: str = ""
+    last_modified: str = ""
+    # 서버가 304 Not Modified 로 응답한 경우
+    not_modified: bool = False
 
     def __repr__(self):
         return f"search_word: {self.search_word}, link: {self.link}\n"
 
 
+_thread_local = threading.local()
+
+
+def run_async(coro):
+    """
+    스레드마다 재사용하는 이벤트 루프에서 코루틴을 실행합니다.
+    asyncio.run 과 달리 루프를 닫지 않으므로 루프에 묶인 커넥션 풀이 작업 간에 유지됩니다.
+    :param coro: 실행할 코루틴
+    :return: 코루틴의 결과
+    """
+    loop = getattr(_thread_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _thread_local.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
 class BaseCrawler(object):
     """
     Base class for crawlers.
+    httpx.AsyncClient 와 도메인별 semaphore 는 이벤트 루프마다 하나씩 만들어 모든 크롤러가 공유합니다.
     """
 
-    async def crawl_async(self, url, client):
+    # h2 패키지(requirements.txt)가 설치되어 있으면 HTTP/2 를 사용합니다.
+    HTTP2 = importlib.util.find_spec("h2") is not None
+    TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+    LIMITS = httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+    )
+    # 한 도메인에 동시에 보내는 요청 수
+    MAX_REQUESTS_PER_HOST = 4
+    # 페이지마다 내려받는 최대 바이트 수 (LLM 입력은 어차피 max_tokens 로 잘립니다)
+    MAX_CONTENT_BYTES = 1024 * 1024
+    # Content-Type 이 없으면 HTML 로 간주합니다.
+    ALLOWED_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+    _clients = weakref.WeakKeyDictionary()
+    _host_semaphores = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        현재 이벤트 루프의 공유 클라이언트를 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        client = cls._clients.get(loop)
+        if client is None or client.is_closed:
+            client = cls._clients[loop] = httpx.AsyncClient(
+                http2=cls.HTTP2,
+                timeout=cls.TIMEOUT,
+                limits=cls.LIMITS,
+                follow_redirects=True,
+            )
+        return client
+
+    @classmethod
+    def get_host_semaphore(cls, url: str) -> asyncio.Semaphore:
+        semaphores = cls._host_semaphores.setdefault(asyncio.get_running_loop(), {})
+        host = urlparse(url).netloc
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(cls.MAX_REQUESTS_PER_HOST)
+        return semaphores[host]
+
+    async def crawl_async(self, url, client: httpx.AsyncClient = None):
         """
         비동기로 URL을 크롤링합니다.
         :param url:
-        :param client:
+        :param client: 사용할 클라이언트 (기본값: 공유 클라이언트)
         :return:
         """
+        template = CrawlTemplate("", url)
+        await self.crawl_template_async(template, client)
+        return template.html
+
+    async def crawl_template_async(
+        self, template: CrawlTemplate, client: httpx.AsyncClient = None
+    ):
+        """
+        template.link 를 크롤링하여 html, etag, last_modified 를 채웁니다.
+        template 에 etag/last_modified 가 있으면 조건부 요청을 보내고,
+        304 로 응답하면 html 없이 not_modified 를 설정합니다.
+        :param template: 크롤링할 템플릿
+        :param client: 사용할 클라이언트 (기본값: 공유 클라이언트)
+        """
+        url = template.link
+        client = client or self.get_client()
+        headers = {}
+        if template.etag:
+            headers["If-None-Match"] = template.etag
+        if template.last_modified:
+            headers["If-Modified-Since"] = template.last_modified
+
         try:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+            async with self.get_host_semaphore(url):
+                async with client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == httpx.codes.NOT_MODIFIED:
+                        template.not_modified = True
+                        return
+                    response.raise_for_status()
+                    self._check_content_type(url, response)
+                    template.html = await self._read_text(response)
+                    template.etag = response.headers.get("etag", "")
+                    template.last_modified = response.headers.get("last-modified", "")
         except (httpx.RequestError, httpx.HTTPStatusError) as e:
             raise CrawlError(f"Error fetching {url}: {e}") from e
+
+    async def crawl_templates_async(self, crawl_templates: list[CrawlTemplate]):
+        """
+        여러 템플릿을 동시에 크롤링합니다. 실패한 템플릿의 html 은 빈 문자열로 남습니다.
+        """
+        results = await asyncio.gather(
+            *[self.crawl_template_async(template) for template in crawl_templates],
+            return_exceptions=True,
+        )
+        for template, result in zip(crawl_templates, results):
+            if isinstance(result, Exception):
+                template.html = ""
+
+    def _check_content_type(self, url: str, response: httpx.Response):
+        content_type = response.headers.get("content-type", "")
+        media_type = content_type.split(";")[0].strip().lower()
+        if media_type and media_type not in self.ALLOWED_CONTENT_TYPES:
+            raise CrawlError(f"Unsupported content type for {url}: {media_type}")
+
+    async def _read_text(self, response: httpx.Response) -> str:
+        """
+        MAX_CONTENT_BYTES 까지만 내려받으며 점진적으로 디코딩합니다.
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+            errors="replace"
+        )
+        chunks = []
+        remaining = self.MAX_CONTENT_BYTES
+        async for chunk in response.aiter_bytes():
+            chunk = chunk[:remaining]
+            chunks.append(decoder.decode(chunk))
+            remaining -= len(chunk)
+            if remaining <= 0:
+                break
+        chunks.append(decoder.decode(b"", final=True))
+        return "".join(chunks)
@@ -1,7 +1,5 @@
-import asyncio
 import os
 
-import httpx
 from dotenv import load_dotenv
 
 from insights.crawlers.base_crawler import BaseCrawler, CrawlTemplate
@@ -32,25 +30,21 @@ class GoogleCrawler(BaseCrawler):
         :param params:
         :return:
         """
-        google_response = await self.google_search_async(query, **params)
-        links = self.get_links(google_response)
-
+        links = await self.google_search_links_async(query, **params)
         crawl_templates = [CrawlTemplate(query, link, "") for link in links]
-
-        async with httpx.AsyncClient() as client:
-            tasks = [
-                self.crawl_async(template.link, client) for template in crawl_templates
-            ]
-            html_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for template, html in zip(crawl_templates, html_results):
-            if isinstance(html, Exception):
-                template.html = ""
-            else:
-                template.html = html
-
+        await self.crawl_templates_async(crawl_templates)
         return crawl_templates
 
+    async def google_search_links_async(self, query: str, **params) -> list[str]:
+        """
+        Google Custom Search API의 검색 결과 링크만 가져옵니다.
+        :param query:
+        :param params:
+        :return:
+        """
+        google_response = await self.google_search_async(query, **params)
+        return self.get_links(google_response)
+
     def get_links(self, google_response: dict) -> list[str]:
         """
         Google Custom Search API의 응답에서 링크를 추출합니다.
@@ -75,7 +69,7 @@ class GoogleCrawler(BaseCrawler):
             "q": query,
             **params,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.get(base_url, params=params)
-            response.raise_for_status()
-            return response.json()
+        async with self.get_host_semaphore(base_url):
+            response = await self.get_client().get(base_url, params=params)
+        response.raise_for_status()
+        return response.json()
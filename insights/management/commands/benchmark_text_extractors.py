@@ -0,0 +1,64 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from insights.processors.html_llm_processor import preprocess_html
+from insights.processors.registry import processor_registry
+from insights.processors.text_extractors import (TEXT_EXTRACTORS,
+                                                 SoupTextExtractor)
+
+
+class Command(BaseCommand):
+    help = (
+        "저장된 HTML 페이지로 GptProcessor 전처리(텍스트 추출 + 토큰 제한) 속도를 비교합니다. "
+        "baseline 은 전체 텍스트를 추출하고 전체를 인코딩하던 기존 방식입니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("pages_dir", help="*.html 파일이 있는 디렉터리")
+        parser.add_argument("--model", default="gpt-3.5-turbo")
+        parser.add_argument("--max-tokens", type=int, default=4000)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        pages = [
+            path.read_text(encoding="utf-8", errors="replace")
+            for path in sorted(Path(options["pages_dir"]).glob("*.htm*"))
+        ]
+        if not pages:
+            raise CommandError(f"No HTML files in {options['pages_dir']}")
+
+        encoding = processor_registry.get_encoding(options["model"])
+        max_tokens = options["max_tokens"]
+
+        def baseline(html):
+            tokens = encoding.encode(SoupTextExtractor().extract(html))
+            return encoding.decode(tokens[:max_tokens])
+
+        runners = {"baseline": baseline}
+        for name, extractor_class in TEXT_EXTRACTORS.items():
+            extractor = extractor_class()
+            runners[name] = lambda html, extractor=extractor: preprocess_html(
+                html, extractor, encoding, max_tokens
+            )
+
+        expected = [baseline(html) for html in pages]
+        self.stdout.write(
+            f"pages: {len(pages)}, bytes: {sum(len(html) for html in pages)}"
+        )
+
+        baseline_seconds = None
+        for name, runner in runners.items():
+            started_at = time.perf_counter()
+            for _ in range(options["repeat"]):
+                results = [runner(html) for html in pages]
+            seconds = (time.perf_counter() - started_at) / options["repeat"]
+            baseline_seconds = baseline_seconds or seconds
+
+            same = sum(result == text for result, text in zip(results, expected))
+            self.stdout.write(
+                f"{name}: {seconds * 1000 / len(pages):.2f} ms/page, "
+                f"x{baseline_seconds / seconds:.1f}, "
+                f"same output: {same}/{len(pages)}"
+            )
@@ -0,0 +1,7 @@
+from common.management.commands.cache_stats import CacheStatsCommand
+from insights.processors.llm_cache import LLMResultCache
+
+
+class Command(CacheStatsCommand):
+    help = "GPT 응답 캐시의 hit/miss 카운터를 출력합니다."
+    counter = LLMResultCache.counter
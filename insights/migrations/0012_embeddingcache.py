@@ -0,0 +1,41 @@
+# Generated by Django 5.1.7 on 2026-10-17 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0011_alter_cultureinfo_culture_type_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmbeddingCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("model", models.CharField(max_length=100)),
+                ("content_hash", models.CharField(max_length=64)),
+                ("vector", models.BinaryField()),
+            ],
+            options={
+                "db_table": "embedding_cache",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("model", "content_hash"), name="embedding_cache_unique"
+                    )
+                ],
+            },
+        ),
+    ]
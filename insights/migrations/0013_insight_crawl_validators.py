@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-17 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0012_embeddingcache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="insight",
+            name="content_fingerprint",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="insight",
+            name="etag",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="insight",
+            name="last_modified",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
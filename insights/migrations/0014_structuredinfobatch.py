@@ -0,0 +1,61 @@
+# Generated by Django 5.1.7 on 2026-10-17 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insights", "0013_insight_crawl_validators"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StructuredInfoBatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("deleted_at", models.DateTimeField(null=True)),
+                ("batch_id", models.CharField(max_length=100, unique=True)),
+                ("input_file_id", models.CharField(max_length=100)),
+                (
+                    "output_file_id",
+                    models.CharField(blank=True, default="", max_length=100),
+                ),
+                (
+                    "error_file_id",
+                    models.CharField(blank=True, default="", max_length=100),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("validating", "검증 중"),
+                            ("failed", "실패"),
+                            ("in_progress", "진행 중"),
+                            ("finalizing", "마무리 중"),
+                            ("completed", "완료"),
+                            ("expired", "만료"),
+                            ("cancelling", "취소 중"),
+                            ("cancelled", "취소됨"),
+                        ],
+                        default="validating",
+                        max_length=20,
+                    ),
+                ),
+                ("ingested_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "structured_info_batches",
+            },
+        ),
+    ]
@@ -25,6 +25,10 @@ class Insight(BaseModel):
     category = models.CharField(max_length=50, choices=CategoryEnum.choices)
     content = models.TextField()
     source_url = models.CharField(max_length=512, unique=True)
+    # 재수집 시 조건부 요청과 변경 여부 판단에 사용합니다.
+    etag = models.CharField(max_length=255, blank=True, default="")
+    last_modified = models.CharField(max_length=64, blank=True, default="")
+    content_fingerprint = models.CharField(max_length=64, blank=True, default="")
 
     class Meta:
         db_table = "insights"
@@ -85,3 +89,51 @@ class IndustryInfo(BaseModel):
         indexes = [
             models.Index(fields=["industry_type"], name="industry_type_idx"),
         ]
+
+
+class EmbeddingCache(BaseModel):
+    """
+    임베딩 모델별 (텍스트 sha256 -> float32 벡터) 캐시입니다.
+    """
+
+    model = models.CharField(max_length=100)
+    content_hash = models.CharField(max_length=64)
+    vector = models.BinaryField()
+
+    class Meta:
+        db_table = "embedding_cache"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model", "content_hash"], name="embedding_cache_unique"
+            ),
+        ]
+
+
+class StructuredInfoBatch(BaseModel):
+    """
+    구조화 정보(비자/문화/산업) 생성을 위해 제출한 OpenAI Batch 작업입니다.
+    """
+
+    class StatusEnum(models.TextChoices):
+        # OpenAI Batch 의 status 값
+        VALIDATING = "validating", "검증 중"
+        FAILED = "failed", "실패"
+        IN_PROGRESS = "in_progress", "진행 중"
+        FINALIZING = "finalizing", "마무리 중"
+        COMPLETED = "completed", "완료"
+        EXPIRED = "expired", "만료"
+        CANCELLING = "cancelling", "취소 중"
+        CANCELLED = "cancelled", "취소됨"
+
+    batch_id = models.CharField(max_length=100, unique=True)
+    input_file_id = models.CharField(max_length=100)
+    output_file_id = models.CharField(max_length=100, blank=True, default="")
+    error_file_id = models.CharField(max_length=100, blank=True, default="")
+    status = models.CharField(
+        max_length=20, choices=StatusEnum.choices, default=StatusEnum.VALIDATING
+    )
+    # 결과를 저장한 시각 (결과를 두 번 저장하지 않도록 사용합니다)
+    ingested_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "structured_info_batches"
@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Type
+
+import numpy as np
+from django.conf import settings
+from langchain_core.embeddings import Embeddings
+
+from common.models import BaseModel
+from insights.processors.vector_stores import get_content_fields
+
+
+@dataclass
+class DeduplicatedInfo:
+    info: Dict[str, Any]
+    # 코사인 유사도가 threshold 이상인 기존 행 (없으면 새로 생성)
+    existing: Optional[BaseModel] = None
+    similarity: float = 0.0
+
+
+class VectorDeduplicator:
+    """
+    LLM 이 만든 정보 목록을 기존 행 및 같은 목록 안의 다른 항목과 비교해 중복을 제거합니다.
+    후보/기존 행의 임베딩을 행렬로 쌓아 코사인 유사도를 한 번의 행렬곱으로 계산합니다.
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        embeddings: Embeddings,
+        threshold: float = None,
+        fields: List[str] = None,
+    ):
+        """
+        :param model: 기존 행을 조회할 모델
+        :param embeddings: 임베딩 (CachedEmbeddings 를 사용하면 기존 행은 다시 임베딩하지 않습니다)
+        :param threshold: 중복으로 판단할 코사인 유사도
+        :param fields: 임베딩할 필드 (기본값: 모델의 모든 내용 필드)
+        """
+        self.model = model
+        self.embeddings = embeddings
+        self.threshold = (
+            settings.INSIGHT_DEDUP_SIMILARITY_THRESHOLD
+            if threshold is None
+            else threshold
+        )
+        self.fields = fields or get_content_fields(model)
+
+    def deduplicate(self, info_list: List[Dict[str, Any]]) -> List[DeduplicatedInfo]:
+        """
+        :param info_list: 후보 정보 목록
+        :return: 남길 정보 목록. 기존 행과 중복이면 existing 에 그 행이 담깁니다.
+        목록 안에서 중복된 항목과, 앞선 항목과 같은 기존 행에 매칭된 항목은 제외합니다.
+        """
+        if not info_list:
+            return []
+
+        candidates = self._embed([self._get_document(info) for info in info_list])
+
+        # 목록 안의 중복: 앞에서 남긴 항목과 유사하면 제외합니다.
+        pairwise = candidates @ candidates.T
+        kept = np.zeros(len(info_list), dtype=bool)
+        for idx in range(len(info_list)):
+            kept[idx] = not np.any(pairwise[idx, :idx][kept[:idx]] >= self.threshold)
+
+        existing_rows = list(self.model.live.order_by("id"))
+        if existing_rows:
+            existing = self._embed(
+                [self._get_document(row.__dict__) for row in existing_rows]
+            )
+            similarities = candidates @ existing.T
+            best_indexes = similarities.argmax(axis=1)
+            best_similarities = similarities[np.arange(len(info_list)), best_indexes]
+
+        results = []
+        matched_row_ids = set()
+        for idx in np.flatnonzero(kept):
+            result = DeduplicatedInfo(info=info_list[idx])
+            if existing_rows and best_similarities[idx] >= self.threshold:
+                row = existing_rows[best_indexes[idx]]
+                if row.id in matched_row_ids:
+                    continue
+                matched_row_ids.add(row.id)
+                result.existing = row
+                result.similarity = float(best_similarities[idx])
+            results.append(result)
+        return results
+
+    def _get_document(self, values: dict) -> str:
+        # "필드: 값" 템플릿은 항목끼리 유사도를 높이므로 값만 임베딩합니다.
+        return "\n".join(str(values.get(field, "")) for field in self.fields)
+
+    def _embed(self, documents: List[str]) -> np.ndarray:
+        """
+        :return: 행마다 L2 정규화된 (len(documents), dim) float32 행렬
+        """
+        vectors = np.asarray(
+            self.embeddings.embed_documents(documents), dtype=np.float32
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+
+class KeyDeduplicator:
+    """
+    자연 키(예: VisaInfo.visa_type)가 있는 모델은 임베딩 대신 키가 같은 행을 중복으로 판단합니다.
+    """
+
+    def __init__(self, model: Type[BaseModel], key_field: str):
+        """
+        :param model: 기존 행을 조회할 모델
+        :param key_field: 중복 판단에 사용할 unique 필드
+        """
+        self.model = model
+        self.key_field = key_field
+
+    def deduplicate(self, info_list: List[Dict[str, Any]]) -> List[DeduplicatedInfo]:
+        """
+        :param info_list: 후보 정보 목록
+        :return: 키마다 첫 항목만 남깁니다. 같은 키의 기존 행이 있으면 existing 에 담깁니다.
+        """
+        keys = {info.get(self.key_field) for info in info_list} - {None}
+        # unique 제약은 삭제된 행에도 걸리므로 삭제된 행까지 조회합니다.
+        existing_rows = {
+            getattr(row, self.key_field): row
+            for row in self.model.objects.filter(**{f"{self.key_field}__in": keys})
+        }
+
+        results = []
+        seen_keys = set()
+        for info in info_list:
+            key = info.get(self.key_field)
+            if key is not None:
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+            existing = existing_rows.get(key)
+            results.append(
+                DeduplicatedInfo(
+                    info=info,
+                    existing=existing,
+                    similarity=1.0 if existing else 0.0,
+                )
+            )
+        return results
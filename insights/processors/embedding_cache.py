@@ -0,0 +1,83 @@
+import hashlib
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from insights.models import EmbeddingCache
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    텍스트의 sha256 으로 임베딩을 캐시하는 Embeddings 래퍼입니다.
+    실행 중에는 메모리에, 실행 간에는 embedding_cache 테이블(float32 blob)에 보관하며,
+    캐시에 없는 텍스트만 중복을 제거하여 batch_size 개씩 한 번에 요청합니다.
+    """
+
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, embeddings: Embeddings, batch_size: int = 1000):
+        """
+        :param embeddings: 실제 임베딩을 계산할 Embeddings (예: OpenAIEmbeddings)
+        :param batch_size: 임베딩 요청 한 번에 보낼 최대 텍스트 수
+        """
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.model = getattr(embeddings, "model", type(embeddings).__name__)
+        self._vectors: dict[str, List[float]] = {}
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        hashes = [self._hash(text) for text in texts]
+        self._load(set(hashes) - self._vectors.keys())
+
+        missing = {}
+        for content_hash, text in zip(hashes, texts):
+            if content_hash not in self._vectors:
+                missing.setdefault(content_hash, text)
+
+        missing_items = list(missing.items())
+        for idx in range(0, len(missing_items), self.batch_size):
+            batch = missing_items[idx : idx + self.batch_size]
+            vectors = self.embeddings.embed_documents([text for _, text in batch])
+            self._save(
+                {
+                    content_hash: vector
+                    for (content_hash, _), vector in zip(batch, vectors)
+                }
+            )
+
+        return [self._vectors[content_hash] for content_hash in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def _load(self, hashes: set):
+        hashes = list(hashes)
+        for idx in range(0, len(hashes), self.LOOKUP_CHUNK_SIZE):
+            rows = EmbeddingCache.objects.filter(
+                model=self.model,
+                content_hash__in=hashes[idx : idx + self.LOOKUP_CHUNK_SIZE],
+            ).values_list("content_hash", "vector")
+            for content_hash, vector in rows:
+                self._vectors[content_hash] = np.frombuffer(
+                    vector, dtype=np.float32
+                ).tolist()
+
+    def _save(self, vectors: dict):
+        self._vectors.update(vectors)
+        EmbeddingCache.objects.bulk_create(
+            [
+                EmbeddingCache(
+                    model=self.model,
+                    content_hash=content_hash,
+                    vector=np.asarray(vector, dtype=np.float32).tobytes(),
+                )
+                for content_hash, vector in vectors.items()
+            ],
+            batch_size=self.LOOKUP_CHUNK_SIZE,
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
@@ -1,49 +1,169 @@
+import hashlib
+import json
 import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Union
 
 import openai
-import tiktoken
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-from openai import OpenAI
 from openai.types.responses import Response
 
 from insights.processors.base_processors import BaseProcessor
+from insights.processors.llm_cache import LLMResultCache
+from insights.processors.rate_limiters import AsyncTokenBucket
+from insights.processors.registry import processor_registry
+from insights.processors.text_extractors import (BaseTextExtractor,
+                                                 get_text_extractor)
 
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 
-class GptProcessor(BaseProcessor):
+# 토큰 하나가 이보다 긴 경우는 드물므로, max_tokens * 이 값 글자까지만 추출합니다.
+MAX_CHARS_PER_TOKEN = 8
+DEFAULT_MAX_TOKENS = 4000
+
+
+def get_text_fingerprint(text: str) -> str:
+    """
+    extract_page_text 로 추출한 텍스트의 sha256 입니다. 마크업이나 공백만 바뀐 페이지는 같은 값을 가집니다.
+    LLM 에 보내는 텍스트로 계산하므로 추출 한도 뒤쪽만 바뀐 페이지도 같은 값을 가집니다.
+    """
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+@dataclass
+class ProcessedText:
+    """
+    파이프라인 단계 사이에 전달하는 텍스트입니다.
+    token_count 를 알고 있으면 (이전 단계의 output_tokens 등) 다시 인코딩하지 않습니다.
+    """
+
+    text: str
+    token_count: Optional[int] = None
+
+
+def truncate_text(
+    text: str, encoding, max_tokens: int, token_count: int = None
+) -> ProcessedText:
+    """
+    텍스트를 max_tokens 토큰으로 자릅니다. 확실히 예산 안이면 인코딩하지 않습니다.
+    :param text: 텍스트
+    :param encoding: tiktoken 인코더
+    :param max_tokens: 최대 토큰 수
+    :param token_count: 이미 알고 있는 토큰 수
+    :return: 잘린 텍스트와 (알고 있다면) 토큰 수
+    """
+    if token_count is not None and token_count <= max_tokens:
+        return ProcessedText(text, token_count)
+    # 토큰은 최소 1바이트이므로 UTF-8 로 max_tokens 바이트 이하면 인코딩할 필요가 없습니다.
+    # 한글 한 글자는 3바이트이고 보통 2~3 토큰이므로 글자 수로는 판단할 수 없습니다.
+    if token_count is None and len(text.encode("utf-8")) <= max_tokens:
+        return ProcessedText(text)
+
+    tokens = encoding.encode(text)
+    if len(tokens) > max_tokens:
+        return ProcessedText(encoding.decode(tokens[:max_tokens]), max_tokens)
+    return ProcessedText(text, len(tokens))
+
+
+def extract_page_text(
+    html: str,
+    text_extractor: BaseTextExtractor = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> str:
+    """
+    HTML 에서 max_tokens 토큰 예산만큼의 텍스트를 추출합니다. 예산을 넘는 부분은 파싱하지 않습니다.
+    :param html: HTML 문자열
+    :param text_extractor: 텍스트 추출기 (기본값: settings.INSIGHT_TEXT_EXTRACTOR)
+    :param max_tokens: 최대 토큰 수
+    :return: 추출한 텍스트 (토큰 수는 아직 제한하지 않습니다)
+    """
+    text_extractor = text_extractor or get_text_extractor()
+    return text_extractor.extract(html, max_chars=max_tokens * MAX_CHARS_PER_TOKEN)
+
+
+def preprocess_html(
+    html: str, text_extractor: BaseTextExtractor, encoding, max_tokens: int
+) -> str:
+    """
+    HTML 에서 텍스트를 추출하고 max_tokens 토큰으로 자릅니다.
+    :param html: HTML 문자열
+    :param text_extractor: 텍스트 추출기
+    :param encoding: tiktoken 인코더
+    :param max_tokens: 최대 토큰 수
+    :return: 전처리된 텍스트
+    """
+    text = extract_page_text(html, text_extractor, max_tokens)
+    return truncate_text(text, encoding, max_tokens).text
+
+
+class BaseGptProcessor(ABC):
+    """
+    GptProcessor 와 AsyncGptProcessor 가 공유하는 프롬프트, 입력 전처리, 캐시 키, 요청 생성 로직입니다.
+    API 호출 방식(동기/비동기)은 하위 클래스가 구현합니다.
+    """
+
+    INPUT_HTML = "html"
+    INPUT_TEXT = "text"
+
     def __init__(
         self,
         model: str = "gpt-3.5-turbo",
         system_prompt: str = "You are a helpful assistant.",
-        max_tokens: int = 4000,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        use_cache: bool = True,
+        text_extractor: BaseTextExtractor = None,
+        input_type: str = INPUT_HTML,
+        text_format: dict = None,
     ):
         """
-        Initialize the GptProcessor with the specified model.
+        Initialize the processor with the specified model.
         :param model: The model to use for processing.
         :param system_prompt: The system prompt to use.
         :param max_tokens: Maximum number of tokens to process.
+        :param use_cache: Reuse cached responses for identical inputs (LLMResultCache).
+        :param text_extractor: HTML to text extractor (default: settings.INSIGHT_TEXT_EXTRACTOR).
+        :param input_type: INPUT_HTML parses the input, INPUT_TEXT only truncates it.
+        :param text_format: Responses API text.format (e.g. a json_schema for structured output).
         """
-        self.client = OpenAI()
+        if input_type not in (self.INPUT_HTML, self.INPUT_TEXT):
+            raise ValueError(f"Invalid input_type: {input_type}")
+
+        self.client = self._create_client()
         self.model = model
         self.system_prompt = system_prompt
         self.max_tokens = max_tokens
-        self.encoding = tiktoken.encoding_for_model(model)
+        self.use_cache = use_cache and LLMResultCache.is_enabled()
+        self.text_extractor = text_extractor or get_text_extractor()
+        self.input_type = input_type
+        self.text_format = text_format
+        self.encoding = processor_registry.get_encoding(model)
 
-    def process(self, data: str):
+    @abstractmethod
+    def _create_client(self):
+        pass
+
+    def _get_cache_key(self, processed_text: str):
+        if not self.use_cache:
+            return None
+        prompt = self.system_prompt
+        if self.text_format:
+            prompt += json.dumps(self.text_format, sort_keys=True)
+        return LLMResultCache.get_key(self.model, prompt, processed_text)
+
+    def _prepare_input(self, data: Union[str, ProcessedText]) -> str:
         """
-        데이터를 처리하고 결과를 반환합니다.
-        :param data: 처리할 데이터
-        :return:
+        입력 종류에 맞게 전처리합니다. 텍스트 입력은 파싱하지 않고 토큰 수만 제한합니다.
         """
-        processed_text = self._preprocess_html(data)
-        openai_response = self._call_openai_api(processed_text)
-        if openai_response and openai_response.output_text:
-            return openai_response.output_text
-        else:
-            raise ValueError("No response from OpenAI API or invalid response format.")
+        if isinstance(data, ProcessedText):
+            return truncate_text(
+                data.text, self.encoding, self.max_tokens, data.token_count
+            ).text
+        if self.input_type == self.INPUT_TEXT:
+            return truncate_text(data, self.encoding, self.max_tokens).text
+        return self._preprocess_html(data)
 
     def _preprocess_html(self, html: str) -> str:
         """
@@ -51,23 +171,64 @@ class GptProcessor(BaseProcessor):
         :param html: HTML 문자열
         :return: 전처리된 텍스트
         """
-        # HTML 파싱
-        soup = BeautifulSoup(html, "html.parser")
+        return preprocess_html(
+            html, self.text_extractor, self.encoding, self.max_tokens
+        )
 
-        # 불필요한 태그 제거
-        for tag in soup(["script", "style", "meta", "link", "header", "footer", "nav"]):
-            tag.decompose()
+    @staticmethod
+    def _to_processed_text(response: Response) -> ProcessedText:
+        if not (response and response.output_text):
+            raise ValueError("No response from OpenAI API or invalid response format.")
+        usage = getattr(response, "usage", None)
+        return ProcessedText(
+            response.output_text, getattr(usage, "output_tokens", None)
+        )
 
-        # 텍스트 추출 및 정리
-        text = " ".join(soup.stripped_strings)
-        text = " ".join(text.split())
+    def _build_request(self, user_prompt: str) -> dict:
+        request = {"model": self.model, "input": self._build_input(user_prompt)}
+        if self.text_format:
+            request["text"] = {"format": self.text_format}
+        return request
 
-        # 토큰 수 제한
-        tokens = self.encoding.encode(text)
-        if len(tokens) > self.max_tokens:
-            text = self.encoding.decode(tokens[: self.max_tokens])
+    def _build_input(self, user_prompt: str) -> str:
+        return f"""
+                system: {self.system_prompt}
+                ===========================
+                user: {user_prompt}
+                ===========================
+                assistant:
+            """
 
-        return text
+
+class GptProcessor(BaseGptProcessor, BaseProcessor):
+    def _create_client(self):
+        return processor_registry.get_client()
+
+    def process(self, data: str):
+        """
+        데이터를 처리하고 결과를 반환합니다.
+        :param data: 처리할 데이터
+        :return:
+        """
+        return self.process_text(data).text
+
+    def process_text(self, data: Union[str, ProcessedText]) -> ProcessedText:
+        """
+        데이터를 처리하고 결과 텍스트를 output 토큰 수와 함께 반환합니다.
+        :param data: 처리할 데이터 (이전 단계의 ProcessedText 도 받습니다)
+        :return:
+        """
+        processed_text = self._prepare_input(data)
+        cache_key = self._get_cache_key(processed_text)
+        if cache_key:
+            cached = LLMResultCache.get(cache_key)
+            if cached is not None:
+                return ProcessedText(cached)
+
+        result = self._to_processed_text(self._call_openai_api(processed_text))
+        if cache_key:
+            LLMResultCache.set(cache_key, result.text)
+        return result
 
     def _call_openai_api(self, user_prompt: str) -> Response:
         """
@@ -76,14 +237,93 @@ class GptProcessor(BaseProcessor):
         :return:
         """
         openai.api_key = OPENAI_API_KEY
-        response = self.client.responses.create(
-            model=self.model,
-            input=f"""
-                system: {self.system_prompt}
-                ===========================
-                user: {user_prompt}
-                ===========================
-                assistant:
-            """,
-        )
+        response = self.client.responses.create(**self._build_request(user_prompt))
         return response
+
+
+class AsyncGptProcessor(BaseGptProcessor):
+    """
+    AsyncOpenAI 를 사용하는 GPT processor 입니다.
+    여러 페이지를 asyncio 로 동시에 처리할 때 사용하며,
+    rate_limiter 가 주어지면 API 호출마다 토큰을 얻은 뒤 요청합니다.
+    """
+
+    def __init__(
+        self,
+        model: str = "gpt-3.5-turbo",
+        system_prompt: str = "You are a helpful assistant.",
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        use_cache: bool = True,
+        text_extractor: BaseTextExtractor = None,
+        input_type: str = BaseGptProcessor.INPUT_HTML,
+        text_format: dict = None,
+        rate_limiter: AsyncTokenBucket = None,
+    ):
+        super().__init__(
+            model,
+            system_prompt,
+            max_tokens,
+            use_cache,
+            text_extractor,
+            input_type,
+            text_format,
+        )
+        self.rate_limiter = rate_limiter
+
+    def _create_client(self):
+        return processor_registry.get_async_client()
+
+    async def process_async(self, data: str) -> str:
+        """
+        데이터를 비동기로 처리하고 결과를 반환합니다.
+        :param data: 처리할 데이터
+        :return:
+        """
+        return (await self.process_text_async(data)).text
+
+    async def process_text_async(
+        self, data: Union[str, ProcessedText]
+    ) -> ProcessedText:
+        processed_text = self._prepare_input(data)
+        cache_key = self._get_cache_key(processed_text)
+        if cache_key:
+            cached = await LLMResultCache.aget(cache_key)
+            if cached is not None:
+                return ProcessedText(cached)
+
+        result = self._to_processed_text(
+            await self._call_openai_api_async(processed_text)
+        )
+        if cache_key:
+            await LLMResultCache.aset(cache_key, result.text)
+        return result
+
+    async def _call_openai_api_async(self, user_prompt: str) -> Response:
+        if self.rate_limiter:
+            await self.rate_limiter.acquire()
+        return await self.client.responses.create(**self._build_request(user_prompt))
+
+
+class GptPipeline:
+    """
+    여러 GptProcessor 를 순서대로 실행합니다.
+    단계 사이에는 ProcessedText 를 넘기므로 이전 단계의 출력을 다시 파싱하지 않고,
+    output 토큰 수를 알면 다시 인코딩하지도 않습니다.
+    첫 단계 이후의 processor 는 input_type=INPUT_TEXT 로 만들어야 합니다.
+    process 는 GptProcessor, process_async 는 AsyncGptProcessor 목록에 사용합니다.
+    """
+
+    def __init__(self, processors: list[BaseGptProcessor]):
+        self.processors = processors
+
+    def process(self, data: str) -> str:
+        result = data
+        for processor in self.processors:
+            result = processor.process_text(result)
+        return result.text
+
+    async def process_async(self, data: str) -> str:
+        result = data
+        for processor in self.processors:
+            result = await processor.process_text_async(result)
+        return result.text
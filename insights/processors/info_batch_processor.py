@@ -0,0 +1,103 @@
+import json
+from typing import Dict, List
+
+from insights.models import StructuredInfoBatch
+from insights.processors.deduplicators import DeduplicatedInfo
+from insights.processors.insight_llm_processor import InfoProcessor
+
+
+def get_output_text(body: dict) -> str:
+    """
+    Batch 출력 파일의 response body(Response JSON)에서 output_text 를 모읍니다.
+    (SDK 의 Response.output_text 와 같은 규칙)
+    """
+    return "".join(
+        content["text"]
+        for item in body.get("output", [])
+        if item.get("type") == "message"
+        for content in item.get("content", [])
+        if content.get("type") == "output_text"
+    )
+
+
+class InfoBatchProcessor(InfoProcessor):
+    """
+    InfoProcessor 의 Batch API 백엔드입니다.
+    비자/문화/산업 요청을 하나의 Batch 로 제출하고 batch ID 를 StructuredInfoBatch 에 저장합니다.
+    결과는 Batch 가 완료된 뒤 poll_structured_info_batches 태스크가 가져와 저장합니다.
+    """
+
+    ENDPOINT = "/v1/responses"
+    COMPLETION_WINDOW = "24h"
+
+    def submit(self, categories: List[str] = None) -> StructuredInfoBatch:
+        """
+        :param categories: 제출할 카테고리 (기본값: 전체)
+        :return: 저장된 StructuredInfoBatch
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": category,
+                    "method": "POST",
+                    "url": self.ENDPOINT,
+                    "body": self.build_request(category),
+                },
+                ensure_ascii=False,
+            )
+            for category in categories or self.INFO_TYPES
+        ]
+        input_file = self.client.files.create(
+            file=("structured_info.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.ENDPOINT,
+            completion_window=self.COMPLETION_WINDOW,
+        )
+        return StructuredInfoBatch.objects.create(
+            batch_id=batch.id, input_file_id=input_file.id, status=batch.status
+        )
+
+    def refresh(self, info_batch: StructuredInfoBatch) -> StructuredInfoBatch:
+        """
+        Batch 의 현재 상태와 출력 파일 ID 를 저장합니다.
+        """
+        batch = self.client.batches.retrieve(info_batch.batch_id)
+        info_batch.status = batch.status
+        info_batch.output_file_id = batch.output_file_id or ""
+        info_batch.error_file_id = batch.error_file_id or ""
+        info_batch.save(
+            update_fields=["status", "output_file_id", "error_file_id", "updated_at"]
+        )
+        return info_batch
+
+    def get_results(
+        self, info_batch: StructuredInfoBatch
+    ) -> Dict[str, List[DeduplicatedInfo]]:
+        """
+        완료된 Batch 의 출력 파일을 읽어 카테고리별로 파싱하고 중복을 제거합니다.
+        :return: 카테고리 -> 저장할 정보 목록 (실패한 요청의 카테고리는 제외)
+        """
+        if not info_batch.output_file_id:
+            return {}
+
+        results = {}
+        output = self.client.files.content(info_batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            category = record["custom_id"]
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                print(
+                    f"Error in batch request {category}: "
+                    f"{record.get('error') or response.get('body')}"
+                )
+                continue
+            results[category] = self.parse_output(
+                category, get_output_text(response["body"])
+            )
+        return results
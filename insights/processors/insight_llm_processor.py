@@ -1,29 +1,57 @@
 import json
 from typing import Any, Dict, List, Type
 
-from langchain_community.document_loaders import SQLDatabaseLoader
 from langchain_community.embeddings import OpenAIEmbeddings
-from langchain_community.utilities import SQLDatabase
-from langchain_community.vectorstores import Chroma
-from langchain_text_splitters import CharacterTextSplitter
+from langchain_core.embeddings import Embeddings
 from openai import OpenAI
-from sqlalchemy import create_engine
 
 from common.models import BaseModel
-from config.settings import DATABASE_URL
-from insights.models import IndustryInfo, CultureInfo, VisaInfo
+from insights.models import CultureInfo, IndustryInfo, Insight, VisaInfo
+from insights.processors.deduplicators import (DeduplicatedInfo,
+                                               KeyDeduplicator,
+                                               VectorDeduplicator)
+from insights.processors.embedding_cache import CachedEmbeddings
+from insights.processors.registry import processor_registry
+from insights.processors.vector_stores import IncrementalVectorStore
 
 
 class InfoProcessor:
-    def __init__(self, model: str = "gpt-4o-2024-08-06"):
-        self.client = OpenAI()
+    # 카테고리 -> (요청을 만드는 메서드, 응답의 목록 키, 저장할 모델)
+    INFO_TYPES = {
+        "visa": ("_build_visa_request", "visa_list", VisaInfo),
+        "culture": ("_build_culture_request", "culture_list", CultureInfo),
+        "industry": ("_build_industry_request", "industry_list", IndustryInfo),
+    }
+    # 자연 키가 있는 카테고리는 키가 같은 행을 중복으로 판단합니다.
+    DEDUP_KEY_FIELDS = {"visa": "visa_type"}
+    # 나머지 카테고리는 이 필드들의 임베딩 유사도로 판단합니다.
+    DEDUP_CONTENT_FIELDS = {
+        "culture": ["title", "content"],
+        "industry": ["industry_type", "description"],
+    }
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-2024-08-06",
+        client: OpenAI = None,
+        embeddings: Embeddings = None,
+    ):
+        """
+        :param model: 구조화에 사용할 모델
+        :param client: OpenAI 클라이언트 (기본값: 워커 공유 클라이언트)
+        :param embeddings: 임베딩 (기본값: CachedEmbeddings(OpenAIEmbeddings()))
+        """
+        self.client = client or processor_registry.get_client()
         self.model = model
+        self.embeddings = embeddings or CachedEmbeddings(OpenAIEmbeddings())
+        self._vector_stores = {}
 
-    def process_visa_info(self) -> List[Dict[str, Any]]:
+    def process_visa_info(self) -> List[DeduplicatedInfo]:
         """비자 관련 인사이트를 구조화된 정보로 변환"""
-        combined_content = self._combine_insights('visa')
+        return self.process_info("visa")
 
-        response = self.client.responses.create(
+    def _build_visa_request(self, combined_content: str) -> dict:
+        return dict(
             model=self.model,
             input=[
                 {
@@ -83,17 +111,12 @@ class InfoProcessor:
             },
         )
 
-        try:
-            result = json.loads(response.output_text)
-            return self._deduplicate_by_vector_store(result.get("visa_list", []), VisaInfo)
-        except json.JSONDecodeError:
-            return []
-
-    def process_culture_info(self) -> List[Dict[str, Any]]:
+    def process_culture_info(self) -> List[DeduplicatedInfo]:
         """문화 관련 인사이트를 구조화된 정보로 변환"""
-        combined_content = self._combine_insights('culture')
+        return self.process_info("culture")
 
-        response = self.client.responses.create(
+    def _build_culture_request(self, combined_content: str) -> dict:
+        return dict(
             model=self.model,
             input=[
                 {
@@ -158,17 +181,12 @@ class InfoProcessor:
             },
         )
 
-        try:
-            result = json.loads(response.output_text)
-            return self._deduplicate_by_vector_store(result.get("culture_list", []), CultureInfo)
-        except json.JSONDecodeError:
-            return []
-
-    def process_industry_info(self) -> List[Dict[str, Any]]:
+    def process_industry_info(self) -> List[DeduplicatedInfo]:
         """산업 관련 인사이트를 구조화된 정보로 변환"""
-        combined_content = self._combine_insights('industry')
+        return self.process_info("industry")
 
-        response = self.client.responses.create(
+    def _build_industry_request(self, combined_content: str) -> dict:
+        return dict(
             model=self.model,
             input=[
                 {
@@ -228,62 +246,57 @@ class InfoProcessor:
             },
         )
 
+    def build_request(self, category: str) -> dict:
+        """
+        카테고리의 인사이트를 모아 responses.create 요청 본문을 만듭니다.
+        :param category: Insight.CategoryEnum 값
+        """
+        build_method, _, _ = self.INFO_TYPES[category]
+        return getattr(self, build_method)(self._combine_insights(category))
+
+    def process_info(self, category: str) -> List[DeduplicatedInfo]:
+        response = self.client.responses.create(**self.build_request(category))
+        return self.parse_output(category, response.output_text)
+
+    def parse_output(self, category: str, output_text: str) -> List[DeduplicatedInfo]:
+        """
+        구조화된 응답을 파싱하고 중복을 제거합니다.
+        :param category: Insight.CategoryEnum 값
+        :param output_text: 응답의 output_text (JSON)
+        """
+        _, list_key, model = self.INFO_TYPES[category]
         try:
-            result = json.loads(response.output_text)
-            return self._deduplicate_by_vector_store(result.get("industry_list", []), IndustryInfo)
+            result = json.loads(output_text)
         except json.JSONDecodeError:
             return []
+        info_list = result.get(list_key, [])
+        if category in self.DEDUP_KEY_FIELDS:
+            return KeyDeduplicator(model, self.DEDUP_KEY_FIELDS[category]).deduplicate(info_list)
+        return self._deduplicate_by_vector_store(info_list, model, self.DEDUP_CONTENT_FIELDS.get(category))
+
+    def _get_vector_store(self, model: Type[BaseModel]) -> IncrementalVectorStore:
+        """
+        모델의 영구 벡터 스토어를 변경된 행만 반영하여 반환합니다. (processor 당 한 번만 동기화)
+        """
+        if model not in self._vector_stores:
+            vector_store = IncrementalVectorStore(model, self.embeddings)
+            vector_store.sync()
+            self._vector_stores[model] = vector_store
+        return self._vector_stores[model]
 
     def _combine_insights(self, query: str) -> str:
-        engine = create_engine(DATABASE_URL)
-        loader = SQLDatabaseLoader(
-            db=SQLDatabase(
-                engine=engine,
-            ),
-            query="SELECT * FROM insights",
-        )
-        documents = loader.load()
-        text_splitter = CharacterTextSplitter(chunk_size=100, chunk_overlap=0)
-        texts = text_splitter.split_documents(documents)
-        embeddings = OpenAIEmbeddings()
-        vectorstore = Chroma.from_documents(texts, embeddings)
+        vectorstore = self._get_vector_store(Insight).store
         docs = vectorstore.similarity_search(query, k=10)
         context = "\n".join([doc.page_content for doc in docs])
         return context
 
     def _deduplicate_by_vector_store(
-        self, info_list: List[Dict[str, Any]], model: Type[BaseModel]
-    ) -> List[Dict[str, Any]]:
+        self, info_list: List[Dict[str, Any]], model: Type[BaseModel], fields: List[str] = None
+    ) -> List[DeduplicatedInfo]:
         """
-        중복된 정보를 벡터 스토어를 사용하여 제거합니다. 벡터유사도가 높은 정보가 있으면 제거합니다.
+        목록 안의 중복을 제거하고, 벡터유사도가 높은 기존 행이 있으면 그 행을 함께 반환합니다.
         :param info_list:
-        :return:
+        :param fields: 임베딩할 필드 (기본값: 모델의 모든 내용 필드)
+        :return: 기존 행과 중복인 정보는 existing 에 기존 행이 담깁니다. (새로 만들지 않고 갱신)
         """
-        engine = create_engine(DATABASE_URL)
-        sql_query = f"SELECT * FROM {model._meta.db_table}"
-        loader = SQLDatabaseLoader(
-            db=SQLDatabase(
-                engine=engine,
-            ),
-            query=sql_query,
-        )
-
-        documents = loader.load()
-        text_splitter = CharacterTextSplitter(chunk_size=100, chunk_overlap=0)
-        texts = text_splitter.split_documents(documents)
-        embeddings = OpenAIEmbeddings()
-
-        try:
-            vectorstore = Chroma.from_documents(texts, embeddings)
-        except ValueError:
-            # If the vectorstore is empty, return the original list
-            return info_list
-
-        results = []
-        for info in info_list:
-            text = json.dumps(info)
-            doc, score = vectorstore.similarity_search_with_score(text, k=1)[0]
-            if score < 0.8:
-                results.append(info)
-
-        return results
+        return VectorDeduplicator(model, self.embeddings, fields=fields).deduplicate(info_list)
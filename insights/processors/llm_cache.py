@@ -0,0 +1,64 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+from common.cache_counters import CacheHitCounter
+
+
+class LLMResultCache:
+    """
+    GPT 응답(output_text)을 (model, system_prompt 해시, 입력 텍스트 해시) 키로 캐시합니다.
+    원본 페이지의 텍스트가 바뀌지 않았다면 OpenAI 를 다시 호출하지 않습니다.
+    저장소는 CACHES["llm"] (전용 Redis) 이며 TTL 과 메모리 한도 초과 시 LRU 삭제는 Redis 가 처리합니다.
+    LLM 단계에서 DB 커넥션을 사용하지 않도록 DB 캐시를 사용하지 않습니다.
+    hit/miss 카운터는 default 캐시에 저장합니다.
+    """
+
+    ALIAS = "llm"
+    KEY_PREFIX = "insights:llm"
+    counter = CacheHitCounter(KEY_PREFIX)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return settings.LLM_CACHE_TIMEOUT > 0
+
+    @classmethod
+    def get_key(cls, model: str, system_prompt: str, text: str) -> str:
+        return (
+            f"{cls.KEY_PREFIX}:{model}"
+            f":{cls._digest(system_prompt)}:{cls._digest(text)}"
+        )
+
+    @classmethod
+    def get(cls, key: str):
+        data = caches[cls.ALIAS].get(key)
+        cls.counter.record(hit=data is not None)
+        return data
+
+    @classmethod
+    def set(cls, key: str, data: str):
+        caches[cls.ALIAS].set(key, data, timeout=settings.LLM_CACHE_TIMEOUT)
+
+    @classmethod
+    async def aget(cls, key: str):
+        data = await caches[cls.ALIAS].aget(key)
+        await cls.counter.arecord(hit=data is not None)
+        return data
+
+    @classmethod
+    async def aset(cls, key: str, data: str):
+        await caches[cls.ALIAS].aset(key, data, timeout=settings.LLM_CACHE_TIMEOUT)
+
+    @classmethod
+    def stats(cls) -> dict:
+        return cls.counter.stats()
+
+    @classmethod
+    def reset_stats(cls):
+        cls.counter.reset()
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        # 공백 차이만 있는 입력은 같은 키를 사용합니다.
+        return hashlib.sha256(" ".join(text.split()).encode()).hexdigest()
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    asyncio 용 token bucket 입니다.
+    초당 rate 개의 토큰이 채워지며, 최대 capacity 개까지 한 번에 사용할 수 있습니다.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        :param rate: 초당 채워지는 토큰 수
+        :param capacity: 버킷 크기 (순간적으로 허용되는 최대 요청 수)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 1):
+        """
+        토큰을 얻을 때까지 기다립니다.
+        :param tokens: 사용할 토큰 수
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
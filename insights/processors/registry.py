@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import weakref
+
+import tiktoken
+from openai import AsyncOpenAI, OpenAI
+
+
+class ProcessorRegistry:
+    """
+    워커 프로세스 안에서 OpenAI 클라이언트와 tiktoken 인코더를 공유합니다.
+    프로세서를 페이지마다 만들어도 커넥션 풀과 인코더를 다시 만들지 않습니다.
+    AsyncOpenAI 의 커넥션 풀은 이벤트 루프에 묶이므로 루프마다 하나씩 만듭니다.
+    """
+
+    FALLBACK_ENCODING = "o200k_base"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._encodings = {}
+
+    def get_client(self) -> OpenAI:
+        with self._lock:
+            if self._client is None:
+                self._client = OpenAI()
+            return self._client
+
+    def get_async_client(self) -> AsyncOpenAI:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖에서는 공유하지 않습니다.
+            return AsyncOpenAI()
+
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = AsyncOpenAI()
+            return client
+
+    def get_encoding(self, model: str) -> tiktoken.Encoding:
+        with self._lock:
+            if model not in self._encodings:
+                try:
+                    encoding = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    # tiktoken 이 아직 모르는 모델은 최신 모델의 인코딩으로 계산합니다.
+                    encoding = tiktoken.get_encoding(self.FALLBACK_ENCODING)
+                self._encodings[model] = encoding
+            return self._encodings[model]
+
+    def warm_up(self, models: list[str]):
+        """
+        워커 프로세스 시작 시 클라이언트와 인코더를 미리 만듭니다.
+        """
+        self.get_client()
+        for model in models:
+            self.get_encoding(model)
+
+    def clear(self):
+        with self._lock:
+            self._client = None
+            self._async_clients = weakref.WeakKeyDictionary()
+            self._encodings = {}
+
+
+processor_registry = ProcessorRegistry()
@@ -0,0 +1,103 @@
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+
+# 본문이 아닌 태그 (내용까지 제외합니다)
+BOILERPLATE_TAGS = ("script", "style", "meta", "link", "header", "footer", "nav")
+
+
+class BaseTextExtractor(ABC):
+    @abstractmethod
+    def extract(self, html: str, max_chars: int = None) -> str:
+        """
+        HTML 에서 본문 텍스트만 추출하고 공백을 정리합니다.
+        :param html: HTML 문자열
+        :param max_chars: 이 길이까지만 추출합니다. (None 이면 전체)
+        :return: 정리된 텍스트
+        """
+        pass
+
+
+class SoupTextExtractor(BaseTextExtractor):
+    """
+    BeautifulSoup(html.parser) 로 전체 트리를 만든 뒤 텍스트를 추출합니다.
+    """
+
+    def extract(self, html: str, max_chars: int = None) -> str:
+        # HTML 파싱
+        soup = BeautifulSoup(html, "html.parser")
+
+        # 불필요한 태그 제거
+        for tag in soup(BOILERPLATE_TAGS):
+            tag.decompose()
+
+        # 텍스트 추출 및 정리
+        text = " ".join(soup.stripped_strings)
+        text = " ".join(text.split())
+        return text[:max_chars] if max_chars else text
+
+
+class _StopParsing(Exception):
+    pass
+
+
+class _TextCollector(HTMLParser):
+    def __init__(self, max_chars: int = None):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.parts = []
+        self.length = 0
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in BOILERPLATE_TAGS and tag not in ("meta", "link"):
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in BOILERPLATE_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        text = " ".join(data.split())
+        if not text:
+            return
+        self.parts.append(text)
+        self.length += len(text) + 1
+        if self.max_chars and self.length >= self.max_chars:
+            raise _StopParsing
+
+
+class StreamingTextExtractor(BaseTextExtractor):
+    """
+    트리를 만들지 않고 HTMLParser 로 순서대로 읽으며 텍스트를 모읍니다.
+    max_chars 에 도달하면 나머지 HTML 은 파싱하지 않습니다.
+    """
+
+    def extract(self, html: str, max_chars: int = None) -> str:
+        collector = _TextCollector(max_chars)
+        try:
+            # 나눠서 feed 하면 텍스트 노드가 중간에 잘리므로 한 번에 넘깁니다.
+            collector.feed(html)
+            collector.close()
+        except _StopParsing:
+            pass
+
+        text = " ".join(collector.parts)
+        return text[:max_chars] if max_chars else text
+
+
+TEXT_EXTRACTORS = {
+    "soup": SoupTextExtractor,
+    "streaming": StreamingTextExtractor,
+}
+
+
+def get_text_extractor(name: str = None) -> BaseTextExtractor:
+    """
+    :param name: TEXT_EXTRACTORS 의 키 (기본값: settings.INSIGHT_TEXT_EXTRACTOR)
+    """
+    return TEXT_EXTRACTORS[name or settings.INSIGHT_TEXT_EXTRACTOR]()
@@ -0,0 +1,149 @@
+import hashlib
+from typing import Type
+
+from django.conf import settings
+from langchain_community.vectorstores import Chroma
+from langchain_core.embeddings import Embeddings
+from langchain_text_splitters import CharacterTextSplitter
+
+from common.models import BaseModel
+
+# BaseModel 의 타임스탬프는 내용이 아니므로 문서와 content hash 에서 제외합니다.
+EXCLUDED_FIELDS = ("id", "created_at", "updated_at", "deleted_at")
+# 재크롤링 조건부 요청에 쓰는 값도 내용이 아니며, 바뀌지 않은 페이지에서도 갱신됩니다.
+CRAWL_VALIDATOR_FIELDS = ("etag", "last_modified", "content_fingerprint")
+
+
+def get_content_fields(model: Type[BaseModel]) -> list[str]:
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if field.attname not in EXCLUDED_FIELDS
+        and field.attname not in CRAWL_VALIDATOR_FIELDS
+    ]
+
+
+def build_document(content_fields: list[str], values: dict) -> str:
+    """
+    임베딩할 문서를 "필드: 값" 줄로 만듭니다.
+    """
+    return "\n".join(f"{field}: {values.get(field)}" for field in content_fields)
+
+
+class IncrementalVectorStore:
+    """
+    테이블(모델)마다 디스크에 유지되는 Chroma collection 입니다.
+    sync() 는 updated_at 이 바뀐 행 중 내용(content hash)이 달라진 행만 다시 임베딩하고,
+    삭제된 행의 chunk 는 collection 에서 제거합니다.
+    """
+
+    # 한 번에 임베딩/저장할 chunk 수
+    ADD_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        embedding_function: Embeddings,
+        persist_directory: str = None,
+    ):
+        self.model = model
+        self.store = Chroma(
+            collection_name=model._meta.db_table,
+            embedding_function=embedding_function,
+            persist_directory=str(
+                persist_directory or settings.INSIGHT_VECTOR_STORE_DIR
+            ),
+        )
+        self.text_splitter = CharacterTextSplitter(chunk_size=100, chunk_overlap=0)
+        self.content_fields = get_content_fields(model)
+
+    def count(self) -> int:
+        return self._get_collection().count()
+
+    def sync(self) -> dict:
+        """
+        DB 의 활성 행과 collection 을 맞춥니다.
+        :return: 새로 임베딩한 행 수(embedded), 내용이 같아 건너뛴 행 수(unchanged), 제거한 행 수(removed)
+        """
+        indexed = self._get_indexed_rows()
+        live_updated_at = dict(self.model.live.values_list("id", "updated_at"))
+
+        removed_ids = [row_id for row_id in indexed if row_id not in live_updated_at]
+        changed_ids = [
+            row_id
+            for row_id, updated_at in live_updated_at.items()
+            if row_id not in indexed
+            or indexed[row_id]["updated_at"] != updated_at.isoformat()
+        ]
+
+        stats = {"embedded": 0, "unchanged": 0, "removed": len(removed_ids)}
+        chunks, metadatas, chunk_ids = [], [], []
+        for row_id in removed_ids:
+            self.store.delete(ids=indexed[row_id]["chunk_ids"])
+
+        for row in self.model.objects.filter(id__in=changed_ids).only(
+            "id", "updated_at", *self.content_fields
+        ):
+            document = self.get_document(row)
+            content_hash = hashlib.sha256(document.encode()).hexdigest()
+            metadata = {
+                "row_id": row.id,
+                "updated_at": row.updated_at.isoformat(),
+                "content_hash": content_hash,
+            }
+
+            previous = indexed.get(row.id)
+            if previous and previous["content_hash"] == content_hash:
+                # 내용이 같으면 임베딩 없이 updated_at 만 갱신합니다.
+                self._get_collection().update(
+                    ids=previous["chunk_ids"],
+                    metadatas=[metadata] * len(previous["chunk_ids"]),
+                )
+                stats["unchanged"] += 1
+                continue
+
+            if previous:
+                self.store.delete(ids=previous["chunk_ids"])
+            row_chunks = self.text_splitter.split_text(document) or [document]
+            chunks.extend(row_chunks)
+            metadatas.extend([metadata] * len(row_chunks))
+            chunk_ids.extend(f"{row.id}:{idx}" for idx in range(len(row_chunks)))
+            stats["embedded"] += 1
+
+        # 변경된 행의 chunk 를 모아 큰 batch 로 임베딩합니다.
+        for idx in range(0, len(chunks), self.ADD_BATCH_SIZE):
+            self.store.add_texts(
+                chunks[idx : idx + self.ADD_BATCH_SIZE],
+                metadatas=metadatas[idx : idx + self.ADD_BATCH_SIZE],
+                ids=chunk_ids[idx : idx + self.ADD_BATCH_SIZE],
+            )
+        return stats
+
+    def get_document(self, row: BaseModel) -> str:
+        return build_document(self.content_fields, row.__dict__)
+
+    def _get_collection(self):
+        """
+        langchain Chroma 는 임베딩 없이 metadata 만 갱신하거나 개수를 세는 공개 API 가 없으므로
+        내부 chromadb Collection 을 사용합니다. (langchain-community 0.3.21 의 Chroma._collection,
+        chromadb 1.0.5 의 Collection.update/count) 버전을 올릴 때 이 메서드만 확인하면 됩니다.
+        """
+        return self.store._collection
+
+    def _get_indexed_rows(self) -> dict:
+        """
+        :return: row_id -> {"chunk_ids", "updated_at", "content_hash"}
+        """
+        indexed = {}
+        collection = self.store.get(include=["metadatas"])
+        for chunk_id, metadata in zip(collection["ids"], collection["metadatas"]):
+            row = indexed.setdefault(
+                metadata["row_id"],
+                {
+                    "chunk_ids": [],
+                    "updated_at": metadata["updated_at"],
+                    "content_hash": metadata["content_hash"],
+                },
+            )
+            row["chunk_ids"].append(chunk_id)
+        return indexed
@@ -1,25 +1,40 @@
 import asyncio
+import json
+import uuid
 from datetime import timedelta
 from typing import List
 
 from celery import shared_task
-from django.db import transaction
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.utils import timezone
 
+from insights.crawlers.base_crawler import CrawlTemplate, run_async
 from insights.crawlers.google_crawler import GoogleCrawler
 from insights.models import (CultureInfo, IndustryInfo, Insight, SearchKeyword,
-                             VisaInfo)
-from insights.processors.html_llm_processor import GptProcessor
+                             StructuredInfoBatch, VisaInfo)
+from insights.processors.deduplicators import DeduplicatedInfo
+from insights.processors.html_llm_processor import (AsyncGptProcessor,
+                                                    GptPipeline,
+                                                    extract_page_text,
+                                                    get_text_fingerprint)
+from insights.processors.info_batch_processor import InfoBatchProcessor
 from insights.processors.insight_llm_processor import InfoProcessor
+from insights.processors.rate_limiters import AsyncTokenBucket
 
 
-def _categorize_insight(content: str) -> str:
+async def _categorize_insight(
+    content: str, rate_limiter: AsyncTokenBucket = None
+) -> str:
     """
     컨텐츠를 분석하여 카테고리를 결정합니다.
     :param content: GPT가 추출한 컨텐츠
+    :param rate_limiter: OpenAI 호출에 사용할 rate limiter
     :return: 카테고리
     """
-    gpt_processor = GptProcessor(
+    gpt_processor = AsyncGptProcessor(
         model="gpt-3.5-turbo",
         system_prompt="""
         Classify the given text into one of the following categories:
@@ -29,170 +44,625 @@ def _categorize_insight(content: str) -> str:
         
         Please respond with only the category code. (visa/culture/industry)
         """,
+        input_type=AsyncGptProcessor.INPUT_TEXT,
+        rate_limiter=rate_limiter,
     )
 
-    category = gpt_processor.process(content).strip().lower()
+    category = (await gpt_processor.process_async(content)).strip().lower()
     if category not in [choice[0] for choice in Insight.CategoryEnum.choices]:
         return Insight.CategoryEnum.INDUSTRY  # 기본값
     return category
 
 
+# 이 기간 안에 갱신된 인사이트는 다시 처리하지 않습니다.
+INSIGHT_REFRESH_INTERVAL = timedelta(days=30)
+# 수집 실행의 검색어 목록과 커서를 캐시에 보관하는 기간 (초)
+INSIGHT_COLLECTION_RUN_TIMEOUT = 60 * 60 * 24
+
+
 @shared_task
-@transaction.atomic
 def get_infos(search_word: str, num: int = 5) -> List[dict]:
     """
     Google Custom Search API를 사용하여 검색 결과를 가져오고,
     해당 링크를 크롤링하여 정보를 추출합니다.
+    검색 → 갱신 대상 선별 → (조건부) 크롤링 → LLM 추출 → 인사이트별 짧은 쓰기 트랜잭션 순서로 처리하며,
+    네트워크 호출 중에는 트랜잭션이나 DB 커넥션을 잡고 있지 않습니다.
+    기존 인사이트의 페이지가 바뀌지 않았으면(304 또는 같은 텍스트 fingerprint) LLM 을 호출하지 않고
+    updated_at 만 갱신합니다.
     :param search_word: 검색어
     :param num: 검색 결과 개수
     :return: 저장된 인사이트 목록
     """
     google_crawler = GoogleCrawler()
-    gpt_3_5_processor = GptProcessor(
+
+    # 1. 검색
+    links = run_async(google_crawler.google_search_links_async(search_word, num=num))
+
+    # 2. 갱신 대상 선별 (한 번의 조회)
+    existing = {
+        insight.source_url: insight
+        for insight in Insight.objects.filter(source_url__in=links).only(
+            "id",
+            "source_url",
+            "updated_at",
+            "etag",
+            "last_modified",
+            "content_fingerprint",
+        )
+    }
+    refresh_before = timezone.now() - INSIGHT_REFRESH_INTERVAL
+    crawl_templates = []
+    for link in dict.fromkeys(links):
+        insight = existing.get(link)
+        if insight is None:
+            crawl_templates.append(CrawlTemplate(search_word, link))
+        elif insight.updated_at <= refresh_before:
+            crawl_templates.append(
+                CrawlTemplate(
+                    search_word,
+                    link,
+                    etag=insight.etag,
+                    last_modified=insight.last_modified,
+                )
+            )
+    _release_db_connection()
+
+    # 3. 크롤링 (기존 인사이트는 조건부 요청)
+    run_async(google_crawler.crawl_templates_async(crawl_templates))
+    # 페이지마다 한 번만 (토큰 예산만큼) 추출하고, 같은 텍스트로 fingerprint 와 LLM 입력을 만듭니다.
+    texts = {
+        template.link: extract_page_text(template.html)
+        for template in crawl_templates
+        if template.html
+    }
+    fingerprints = {link: get_text_fingerprint(text) for link, text in texts.items()}
+    unchanged = [
+        template
+        for template in crawl_templates
+        if template.link in existing
+        and (
+            template.not_modified
+            or fingerprints.get(template.link)
+            == existing[template.link].content_fingerprint
+        )
+    ]
+    _touch_insights(unchanged, existing)
+    _release_db_connection()
+
+    unchanged_links = set(template.link for template in unchanged)
+    crawl_templates = [
+        template
+        for template in crawl_templates
+        if template.html and template.link not in unchanged_links
+    ]
+
+    # 4. LLM 추출 (DB 접근 없음, 페이지별 동시 처리)
+    extracted = run_async(
+        _extract_insights(
+            search_word,
+            crawl_templates,
+            texts,
+            new_links=set(template.link for template in crawl_templates)
+            - set(existing),
+        )
+    )
+
+    # 5. 인사이트별 짧은 쓰기 트랜잭션
+    insights = []
+    for template, content, category in extracted:
+        try:
+            insight = _save_insight(
+                search_word,
+                template.link,
+                content,
+                category,
+                validators={
+                    "etag": template.etag,
+                    "last_modified": template.last_modified,
+                    "content_fingerprint": fingerprints[template.link],
+                },
+            )
+        except SoftTimeLimitExceeded:
+            raise
+        except Exception as e:
+            print(f"Error saving insight {template}: {e}")
+            continue
+
+        insights.append(
+            {
+                "id": insight.id,
+                "search_word": insight.search_word,
+                "category": insight.category,
+                "content": insight.content,
+                "source_url": insight.source_url,
+            }
+        )
+
+    return insights
+
+
+# 요약과 카테고리를 한 번의 structured output 으로 받기 위한 형식
+INSIGHT_EXTRACTION_FORMAT = {
+    "type": "json_schema",
+    "name": "Insight",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "Key points of the page related to the search term",
+            },
+            "category": {
+                "type": "string",
+                "enum": [choice[0] for choice in Insight.CategoryEnum.choices],
+                "description": "visa: visas, residence and entry / "
+                "culture: Korean culture, lifestyle and customs / "
+                "industry: industries, companies and economy",
+            },
+        },
+        "required": ["content", "category"],
+        "additionalProperties": False,
+    },
+    "strict": True,
+}
+
+
+async def _extract_insights(
+    search_word: str,
+    crawl_templates: List[CrawlTemplate],
+    texts: dict,
+    new_links: set,
+) -> List[tuple]:
+    """
+    모든 페이지를 동시에 추출합니다. texts 는 source_url -> extract_page_text 로 추출한 텍스트입니다.
+    INSIGHT_EXTRACTION_MODE 가 "combined" 이면 한 번의 호출로 요약과 카테고리를 받고,
+    "three_step" 이면 GPT-3.5 추출 → GPT-4 요약 → (새 페이지만) 카테고리 분류를 합니다.
+    동시에 처리하는 페이지 수는 INSIGHT_LLM_CONCURRENCY 로,
+    OpenAI 호출 빈도는 INSIGHT_LLM_REQUESTS_PER_SECOND 의 token bucket 으로 제한합니다.
+    :return: (template, content, category) 목록. 기존 인사이트의 category 는 None 입니다.
+    """
+    semaphore = asyncio.Semaphore(settings.INSIGHT_LLM_CONCURRENCY)
+    rate_limiter = AsyncTokenBucket(
+        rate=settings.INSIGHT_LLM_REQUESTS_PER_SECOND,
+        capacity=settings.INSIGHT_LLM_CONCURRENCY,
+    )
+    if settings.INSIGHT_EXTRACTION_MODE == "combined":
+        extract_page = _create_combined_extractor(search_word, rate_limiter)
+    else:
+        extract_page = _create_three_step_extractor(search_word, rate_limiter)
+
+    async def extract(template: CrawlTemplate):
+        async with semaphore:
+            is_new = template.link in new_links
+            content, category = await extract_page(texts[template.link], is_new)
+            return template, content, category
+
+    results = await asyncio.gather(
+        *[extract(template) for template in crawl_templates], return_exceptions=True
+    )
+
+    extracted = []
+    for template, result in zip(crawl_templates, results):
+        # soft time limit 은 페이지 하나의 실패가 아니라 검색어 작업 전체를 멈춰야 합니다.
+        if isinstance(result, SoftTimeLimitExceeded):
+            raise result
+        if isinstance(result, Exception):
+            print(f"Error processing template {template}: {result}")
+            continue
+        extracted.append(result)
+    return extracted
+
+
+def _create_combined_extractor(search_word: str, rate_limiter: AsyncTokenBucket):
+    """
+    :return: (text, is_new) -> (content, category) 코루틴 함수. 페이지당 호출 1번
+    """
+    processor = AsyncGptProcessor(
+        model=settings.INSIGHT_EXTRACTION_MODEL,
+        system_prompt=f"""
+        Read the HTML content and extract information related to the search term ({search_word}).
+        Exclude unnecessary information and extract only the key points.
+        Focus on extracting information that would be helpful for foreigners who want to work in Korea.
+        Then classify the extracted information into one of the categories.
+        """,
+        text_format=INSIGHT_EXTRACTION_FORMAT,
+        input_type=AsyncGptProcessor.INPUT_TEXT,
+        rate_limiter=rate_limiter,
+    )
+
+    async def extract_page(text: str, is_new: bool):
+        result = json.loads(await processor.process_async(text))
+        return result["content"], result["category"] if is_new else None
+
+    return extract_page
+
+
+def _create_three_step_extractor(search_word: str, rate_limiter: AsyncTokenBucket):
+    """
+    :return: (text, is_new) -> (content, category) 코루틴 함수. 페이지당 호출 2~3번
+    """
+    gpt_3_5_processor = AsyncGptProcessor(
         model="gpt-3.5-turbo",
         system_prompt=f"""
         Read the HTML content and extract information related to the search term ({search_word}).
         """,
+        input_type=AsyncGptProcessor.INPUT_TEXT,
+        rate_limiter=rate_limiter,
     )
-    gpt_4_processor = GptProcessor(
+    gpt_4_processor = AsyncGptProcessor(
         model="gpt-4",
         system_prompt=f"""
         Exclude unnecessary information and extract only the key points.
         Focus on extracting information that would be helpful for foreigners who want to work in Korea.
         """,
+        input_type=AsyncGptProcessor.INPUT_TEXT,
+        rate_limiter=rate_limiter,
     )
+    # GPT-3.5 의 출력은 HTML 로 다시 파싱하지 않고 토큰 수와 함께 GPT-4 로 넘깁니다.
+    pipeline = GptPipeline([gpt_3_5_processor, gpt_4_processor])
 
-    crawl_templates = asyncio.run(
-        google_crawler.google_crawl_async(search_word, num=num)
+    async def extract_page(text: str, is_new: bool):
+        content = await pipeline.process_async(text)
+        category = None
+        if is_new:
+            category = await _categorize_insight(content, rate_limiter)
+        return content, category
+
+    return extract_page
+
+
+def _save_insight(
+    search_word: str,
+    source_url: str,
+    content: str,
+    category: str = None,
+    validators: dict = None,
+) -> Insight:
+    """
+    인사이트를 저장합니다. 이미 있으면 내용만 갱신하고, 없으면 새로 만듭니다.
+    다른 검색어의 작업이 같은 URL 을 동시에 저장해도 unique 제약에 걸리지 않도록
+    update_or_create 를 사용합니다.
+    :param validators: etag, last_modified, content_fingerprint
+    """
+    validators = validators or {}
+    insight, _ = Insight.objects.update_or_create(
+        source_url=source_url,
+        defaults={"content": content, **validators},
+        create_defaults={
+            "search_word": search_word,
+            "category": category or Insight.CategoryEnum.INDUSTRY,
+            "content": content,
+            **validators,
+        },
     )
+    return insight
+
+
+def _touch_insights(crawl_templates: List[CrawlTemplate], existing: dict):
+    """
+    페이지가 바뀌지 않은 인사이트는 updated_at (과 새 etag/last_modified) 만 갱신합니다.
+    :param crawl_templates: 바뀌지 않은 페이지의 템플릿
+    :param existing: source_url -> Insight
+    """
+    now = timezone.now()
     insights = []
+    for template in crawl_templates:
+        insight = existing[template.link]
+        insight.updated_at = now
+        if not template.not_modified:
+            insight.etag = template.etag
+            insight.last_modified = template.last_modified
+        insights.append(insight)
+    Insight.objects.bulk_update(insights, ["updated_at", "etag", "last_modified"])
 
-    with transaction.atomic():
-        for template in crawl_templates:
-            try:
-                if not template.html:
-                    continue
-
-                already_exist_insight = Insight.objects.filter(source_url=template.link)
-                already_exist_insight_exists = already_exist_insight.exists()
-
-                if (
-                    already_exist_insight.exists()
-                    and already_exist_insight.first().updated_at
-                    > timezone.now() - timedelta(days=30)
-                ):
-                    continue
-
-                content = gpt_3_5_processor.process(template.html)
-                content = gpt_4_processor.process(content)
-
-                if already_exist_insight_exists:
-                    insight = already_exist_insight.first()
-                    insight.content = content
-                    insight.updated_at = timezone.now()
-                    insight.save()
-                else:
-                    category = _categorize_insight(content)
-
-                    insight = Insight.objects.create(
-                        search_word=search_word,
-                        category=category,
-                        content=content,
-                        source_url=template.link,
-                    )
-
-                insights.append(
-                    {
-                        "id": insight.id,
-                        "search_word": insight.search_word,
-                        "category": insight.category,
-                        "content": insight.content,
-                        "source_url": insight.source_url,
-                    }
-                )
 
-            except Exception as e:
-                print(f"Error processing template {template}: {e}")
-                continue
+def _release_db_connection():
+    # LLM 호출이 끝날 때까지 유휴 커넥션을 잡고 있지 않도록 닫습니다.
+    # (트랜잭션 안에서 호출된 경우에는 닫지 않습니다.)
+    if not connection.in_atomic_block:
+        connection.close()
 
-    return insights
+
+@shared_task(soft_time_limit=settings.INSIGHT_COLLECTION_SOFT_TIME_LIMIT)
+def collect_keyword_insights(keyword_id: int, num: int = 5, run_id: str = None) -> dict:
+    """
+    한 검색어에 대한 인사이트를 수집합니다.
+    soft time limit(SoftTimeLimitExceeded)을 포함한 예외는 결과로 반환합니다.
+    수집 실행(run_id)의 일부이면 결과를 캐시에 남기고, last_searched_at 은
+    finish_insight_collection 이 한 번에 갱신합니다. 단독으로 실행되면 바로 갱신합니다.
+    :param keyword_id: SearchKeyword id
+    :param num: 검색 결과 개수
+    :param run_id: _start_insight_collection 이 만든 수집 실행 id
+    :return: 수집 결과
+    """
+    keyword = SearchKeyword.objects.get(id=keyword_id)
+    try:
+        insights = get_infos(keyword.keyword, num=num)
+        result = {
+            "keyword_id": keyword.id,
+            "keyword": keyword.keyword,
+            "insights_count": len(insights),
+            "status": "success",
+        }
+    except Exception as e:
+        result = {
+            "keyword_id": keyword.id,
+            "keyword": keyword.keyword,
+            "error": str(e),
+            "status": "error",
+        }
+
+    if run_id is not None:
+        cache.set(
+            _get_collection_result_key(run_id, keyword.id),
+            result,
+            timeout=INSIGHT_COLLECTION_RUN_TIMEOUT,
+        )
+    elif result["status"] == "success":
+        SearchKeyword.objects.filter(id=keyword.id).update(
+            last_searched_at=timezone.now()
+        )
+    return result
 
 
 @shared_task
-def daily_insight_collection(num: int = 5) -> List[dict]:
+def collect_next_keyword_insights(
+    run_id: str, num: int = 5, finished_keyword_id: int = None
+):
     """
-    매일 실행되어 활성화된 모든 검색어에 대해 인사이트를 수집합니다.
+    수집 lane 하나를 진행합니다. 공유 커서에서 다음 검색어를 가져와 수집하고,
+    수집이 끝나면 (실패하거나 hard time limit 으로 종료되어도) 다음 검색어로 넘어갑니다.
+    lane 들이 같은 커서를 사용하므로 느린 검색어가 다른 lane 을 기다리게 하지 않습니다.
+    마지막 검색어를 끝낸 lane 이 finish_insight_collection 을 한 번 실행합니다.
+    :param run_id: _start_insight_collection 이 만든 수집 실행 id
+    :param num: 검색 결과 개수
+    :param finished_keyword_id: 이 lane 이 방금 끝낸 검색어 id (lane 시작 시 None)
     """
-    keywords = SearchKeyword.objects.filter(is_active=True)
-    results = []
+    if finished_keyword_id is not None and _mark_keyword_finished(run_id):
+        # 마지막 검색어까지 끝났으면 커서도 이미 끝에 도달해 있습니다.
+        finish_insight_collection.delay(run_id)
+        return
 
-    for keyword in keywords:
-        try:
-            insights = get_infos(keyword.keyword, num=num)
-            keyword.last_searched_at = timezone.now()
-            keyword.save()
-
-            results.append(
-                {
-                    "keyword": keyword.keyword,
-                    "insights_count": len(insights),
-                    "status": "success",
-                }
-            )
-        except Exception as e:
-            results.append(
-                {"keyword": keyword.keyword, "error": str(e), "status": "error"}
-            )
+    keyword_id = _claim_next_keyword(run_id)
+    if keyword_id is None:
+        return
+
+    next_lane = collect_next_keyword_insights.si(run_id, num, keyword_id)
+    collect_keyword_insights.apply_async(
+        (keyword_id, num, run_id), link=next_lane, link_error=next_lane
+    )
+
+
+@shared_task
+def finish_insight_collection(run_id: str) -> dict:
+    """
+    수집 실행의 검색어별 결과를 모아 성공한 검색어의 last_searched_at 을 한 번에 갱신하고
+    요약을 남깁니다. 결과가 없는 검색어는 (hard time limit 등으로) 종료된 것으로 봅니다.
+    :param run_id: _start_insight_collection 이 만든 수집 실행 id
+    :return: 수집 요약
+    """
+    keyword_ids_key, _, _ = _get_collection_keys(run_id)
+    keyword_ids = cache.get(keyword_ids_key)
+    if keyword_ids is None:
+        print(f"Insight collection {run_id} expired before it was aggregated")
+        return {"run_id": run_id, "status": "expired"}
+
+    result_keys = {
+        keyword_id: _get_collection_result_key(run_id, keyword_id)
+        for keyword_id in keyword_ids
+    }
+    results = cache.get_many(result_keys.values())
+    succeeded = [
+        keyword_id
+        for keyword_id, key in result_keys.items()
+        if results.get(key, {}).get("status") == "success"
+    ]
+    SearchKeyword.objects.filter(id__in=succeeded).update(
+        last_searched_at=timezone.now()
+    )
+
+    summary = {
+        "run_id": run_id,
+        "status": "finished",
+        "keywords": len(keyword_ids),
+        "succeeded": len(succeeded),
+        "failed": [
+            results[key]["keyword"]
+            for key in result_keys.values()
+            if key in results and results[key]["status"] == "error"
+        ],
+        "lost": [
+            keyword_id for keyword_id, key in result_keys.items() if key not in results
+        ],
+        "insights_count": sum(
+            result.get("insights_count", 0) for result in results.values()
+        ),
+    }
+    print(f"Insight collection finished: {summary}")
+    # 검색어 목록과 커서는 아직 커서를 확인하는 lane 이 있을 수 있으므로 만료되도록 둡니다.
+    cache.delete_many(result_keys.values())
+    return summary
+
+
+def _get_collection_keys(run_id: str) -> tuple[str, str, str]:
+    prefix = f"insights:collection:{run_id}"
+    return f"{prefix}:keyword_ids", f"{prefix}:cursor", f"{prefix}:finished"
+
+
+def _get_collection_result_key(run_id: str, keyword_id: int) -> str:
+    return f"insights:collection:{run_id}:result:{keyword_id}"
 
-    return results
+
+def _start_insight_collection(keyword_ids: List[int], num: int):
+    # 동시에 실행되는 get_infos 수를 제한하여 Google/OpenAI 할당량을 넘지 않도록 합니다.
+    run_id = uuid.uuid4().hex
+    keyword_ids_key, cursor_key, finished_key = _get_collection_keys(run_id)
+    cache.set_many(
+        {keyword_ids_key: keyword_ids, cursor_key: 0, finished_key: 0},
+        timeout=INSIGHT_COLLECTION_RUN_TIMEOUT,
+    )
+    for _ in range(min(settings.INSIGHT_COLLECTION_CONCURRENCY, len(keyword_ids))):
+        collect_next_keyword_insights.delay(run_id, num)
+    return run_id
+
+
+def _claim_next_keyword(run_id: str):
+    """
+    :return: 다음으로 수집할 검색어 id (모두 가져갔으면 None)
+    """
+    keyword_ids_key, cursor_key, _ = _get_collection_keys(run_id)
+    keyword_ids = cache.get(keyword_ids_key)
+    if keyword_ids is None:
+        # 캐시가 비워지면 (eviction, Redis 재시작) 모든 lane 이 여기서 멈춥니다.
+        print(f"Insight collection {run_id} state is missing; stopping lane")
+        return None
+    # incr 은 원자적이므로 여러 lane 이 같은 검색어를 가져가지 않습니다.
+    index = cache.incr(cursor_key) - 1
+    if index >= len(keyword_ids):
+        return None
+    return keyword_ids[index]
+
+
+def _mark_keyword_finished(run_id: str) -> bool:
+    """
+    :return: 방금 끝난 검색어가 수집 실행의 마지막 검색어이면 True
+    """
+    keyword_ids_key, _, finished_key = _get_collection_keys(run_id)
+    keyword_ids = cache.get(keyword_ids_key)
+    if keyword_ids is None:
+        return False
+    try:
+        # incr 은 원자적이므로 마지막 검색어를 끝낸 lane 하나만 True 를 받습니다.
+        return cache.incr(finished_key) == len(keyword_ids)
+    except ValueError:
+        return False
+
+
+@shared_task
+def daily_insight_collection(num: int = 5) -> int:
+    """
+    매일 실행되어 활성화된 모든 검색어에 대해 인사이트를 수집합니다.
+    INSIGHT_COLLECTION_CONCURRENCY 개의 lane 이 검색어를 하나씩 가져가
+    collect_keyword_insights 작업으로 수집하고, 모두 끝나면 finish_insight_collection 이
+    결과를 모아 last_searched_at 을 갱신합니다.
+    :param num: 검색 결과 개수
+    :return: 수집을 시작한 검색어 수
+    """
+    keyword_ids = list(
+        SearchKeyword.objects.filter(is_active=True)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    if keyword_ids:
+        _start_insight_collection(keyword_ids, num)
+    return len(keyword_ids)
 
 
 @shared_task
 def process_insights_to_structured_info():
     """수집된 인사이트를 구조화된 정보로 변환"""
+    if settings.INSIGHT_STRUCTURED_INFO_BACKEND == "batch":
+        # 결과는 Batch 가 완료된 뒤 poll_structured_info_batches 가 저장합니다.
+        InfoBatchProcessor().submit()
+        return
+
     processor = InfoProcessor()
+    for category in InfoProcessor.INFO_TYPES:
+        _save_structured_info_results(category, processor.process_info(category))
 
-    # 비자 정보 처리
-    visa_data_list = processor.process_visa_info()
-    for visa_data in visa_data_list:
-        try:
-            VisaInfo.objects.update_or_create(
-                visa_type=visa_data["visa_type"],
-                defaults={
-                    "requirements": visa_data["requirements"],
-                    "process": visa_data["process"],
-                    "duration": visa_data["duration"],
-                },
-            )
-        except KeyError as e:
-            print(f"Error processing visa data: {e}")
-            continue
 
-    # 문화 정보 처리
-    culture_data_list = processor.process_culture_info()
-    for culture_data in culture_data_list:
-        try:
-            CultureInfo.objects.create(
-                culture_type=culture_data["culture_type"],
-                title=culture_data["title"],
-                content=culture_data["content"],
-                tags=culture_data["tags"],
-                source_urls=culture_data["source_urls"],
-            )
-        except KeyError as e:
-            print(f"Error processing culture data: {e}")
+@shared_task
+def poll_structured_info_batches():
+    """
+    제출한 구조화 정보 Batch 의 상태를 확인하고, 완료된 Batch 의 결과를 저장합니다.
+    """
+    pending = StructuredInfoBatch.live.filter(ingested_at__isnull=True).exclude(
+        status__in=[
+            StructuredInfoBatch.StatusEnum.FAILED,
+            StructuredInfoBatch.StatusEnum.EXPIRED,
+            StructuredInfoBatch.StatusEnum.CANCELLED,
+        ]
+    )
+    if not pending.exists():
+        return
+
+    processor = InfoBatchProcessor()
+    for info_batch in pending:
+        info_batch = processor.refresh(info_batch)
+        if info_batch.status != StructuredInfoBatch.StatusEnum.COMPLETED:
             continue
 
-    # 산업 정보 처리
-    industry_data_list = processor.process_industry_info()
-    for industry_data in industry_data_list:
-        try:
-            IndustryInfo.objects.create(
-                industry_type=industry_data["industry_type"],
-                description=industry_data["description"],
-                trends=industry_data["trends"],
-                opportunities=industry_data["opportunities"],
+        results = processor.get_results(info_batch)
+        with transaction.atomic():
+            # 다른 워커가 먼저 저장했으면 건너뜁니다.
+            locked = (
+                StructuredInfoBatch.objects.select_for_update()
+                .filter(id=info_batch.id, ingested_at__isnull=True)
+                .first()
             )
-        except KeyError as e:
-            print(f"Error processing industry data: {e}")
-            continue
+            if locked is None:
+                continue
+            for category, category_results in results.items():
+                _save_structured_info_results(category, category_results)
+            locked.ingested_at = timezone.now()
+            locked.save(update_fields=["ingested_at", "updated_at"])
+
+
+def _save_structured_info_results(category: str, results: List[DeduplicatedInfo]):
+    if category == Insight.CategoryEnum.VISA:
+        # 비자 정보 처리 (visa_type 이 같은 기존 행이 있으면 갱신)
+        for result in results:
+            try:
+                _save_structured_info(
+                    VisaInfo,
+                    result,
+                    ["visa_type", "requirements", "process", "duration"],
+                )
+            except KeyError as e:
+                print(f"Error processing visa data: {e}")
+                continue
+
+    elif category == Insight.CategoryEnum.CULTURE:
+        # 문화 정보 처리
+        for result in results:
+            try:
+                _save_structured_info(
+                    CultureInfo,
+                    result,
+                    ["culture_type", "title", "content", "tags", "source_urls"],
+                )
+            except KeyError as e:
+                print(f"Error processing culture data: {e}")
+                continue
+
+    elif category == Insight.CategoryEnum.INDUSTRY:
+        # 산업 정보 처리
+        for result in results:
+            try:
+                _save_structured_info(
+                    IndustryInfo,
+                    result,
+                    ["industry_type", "description", "trends", "opportunities"],
+                )
+            except KeyError as e:
+                print(f"Error processing industry data: {e}")
+                continue
+
+
+def _save_structured_info(model, result: DeduplicatedInfo, fields: List[str]):
+    """
+    중복으로 판단된 기존 행이 있으면 그 행을 갱신하고, 없으면 새로 생성합니다.
+    기존 행이 삭제된(soft delete) 행이면 복구합니다.
+    """
+    values = {field: result.info[field] for field in fields}
+    if result.existing is None:
+        return model.objects.create(**values)
+
+    for field, value in values.items():
+        setattr(result.existing, field, value)
+    update_fields = [*fields, "updated_at"]
+    if result.existing.deleted_at is not None:
+        result.existing.deleted_at = None
+        update_fields.append("deleted_at")
+    result.existing.save(update_fields=update_fields)
+    return result.existing
@@ -1,9 +1,50 @@
 import asyncio
+import json
+import tempfile
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import numpy as np
+import tiktoken
+import tiktoken_ext.openai_public
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from langchain_community.embeddings import FakeEmbeddings
+from openai import OpenAI
 from rest_framework.test import APITestCase
 
+from common.errors import CrawlError
+
+from .crawlers.base_crawler import BaseCrawler, CrawlTemplate, run_async
 from .crawlers.google_crawler import GoogleCrawler
-from .tasks import get_infos
+from .models import (CultureInfo, IndustryInfo, Insight, SearchKeyword,
+                     StructuredInfoBatch, VisaInfo)
+from .processors.deduplicators import KeyDeduplicator, VectorDeduplicator
+from .processors.embedding_cache import CachedEmbeddings
+from .processors.html_llm_processor import (MAX_CHARS_PER_TOKEN, GptPipeline,
+                                            GptProcessor, ProcessedText,
+                                            extract_page_text,
+                                            get_text_fingerprint,
+                                            truncate_text)
+from .processors.info_batch_processor import InfoBatchProcessor
+from .processors.llm_cache import LLMResultCache
+from .processors.rate_limiters import AsyncTokenBucket
+from .processors.registry import processor_registry
+from .processors.text_extractors import (SoupTextExtractor,
+                                         StreamingTextExtractor)
+from .processors.vector_stores import IncrementalVectorStore
+from .tasks import (_create_combined_extractor, _extract_insights,
+                    _save_structured_info_results, _start_insight_collection,
+                    collect_keyword_insights, daily_insight_collection,
+                    finish_insight_collection, get_infos,
+                    poll_structured_info_batches,
+                    process_insights_to_structured_info)
 
 
 class InsightsTest(APITestCase):
@@ -28,3 +69,941 @@ class InsightsTest(APITestCase):
     def test_get_infos_task(self):
         result = get_infos.apply_async(args=["한국 비자 정보", 5])
         self.assertEqual(result.status, "SUCCESS")
+
+
+class InsightCollectionTest(TestCase):
+    def collect_summaries(self):
+        # finish_insight_collection 이 반환한 요약을 모읍니다.
+        summaries = []
+        finish = finish_insight_collection.delay
+        patcher = patch.object(
+            finish_insight_collection,
+            "delay",
+            side_effect=lambda run_id: summaries.append(finish(run_id).result),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return summaries
+
+    @override_settings(INSIGHT_COLLECTION_CONCURRENCY=2)
+    def test_daily_insight_collection_fan_out(self):
+        summaries = self.collect_summaries()
+        keywords = [
+            SearchKeyword.objects.create(keyword=f"keyword{idx}") for idx in range(5)
+        ]
+        SearchKeyword.objects.create(keyword="inactive", is_active=False)
+
+        def fake_get_infos(search_word, num=5):
+            if search_word == "keyword3":
+                raise ValueError("quota exceeded")
+            return [{"search_word": search_word}] * num
+
+        with patch("insights.tasks.get_infos", side_effect=fake_get_infos) as mocked:
+            self.assertEqual(daily_insight_collection(num=2), 5)
+
+        self.assertEqual(mocked.call_count, 5)
+        for keyword in keywords:
+            keyword.refresh_from_db()
+            if keyword.keyword == "keyword3":
+                self.assertIsNone(keyword.last_searched_at)
+            else:
+                self.assertIsNotNone(keyword.last_searched_at)
+        # last_searched_at 은 마지막 lane 이 한 번에 갱신합니다.
+        self.assertEqual(
+            SearchKeyword.objects.filter(last_searched_at__isnull=False)
+            .values("last_searched_at")
+            .distinct()
+            .count(),
+            1,
+        )
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0]["succeeded"], 4)
+        self.assertEqual(summaries[0]["failed"], ["keyword3"])
+        self.assertEqual(summaries[0]["insights_count"], 8)
+
+    @override_settings(INSIGHT_COLLECTION_CONCURRENCY=1)
+    def test_collection_lane_continues_after_task_failure(self):
+        summaries = self.collect_summaries()
+        keywords = [
+            SearchKeyword.objects.create(keyword=f"keyword{idx}") for idx in range(2)
+        ]
+        # 없는 검색어는 collect_keyword_insights 자체가 실패합니다. (hard time limit 과 같은 경우)
+        keyword_ids = [keywords[0].id, 0, keywords[1].id]
+
+        with patch("insights.tasks.get_infos", return_value=[]) as mocked:
+            _start_insight_collection(keyword_ids, num=1)
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertFalse(
+            SearchKeyword.objects.filter(last_searched_at__isnull=True).exists()
+        )
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0]["lost"], [0])
+
+    def test_finish_reports_expired_collection(self):
+        run_id = _start_insight_collection([], num=1)
+        # eviction 이나 Redis 재시작으로 수집 상태가 사라진 경우입니다.
+        cache.clear()
+        self.assertEqual(
+            finish_insight_collection(run_id),
+            {"run_id": run_id, "status": "expired"},
+        )
+
+    def test_soft_time_limit_stops_extraction(self):
+        async def extract_page(text, is_new):
+            if text == "b":
+                raise SoftTimeLimitExceeded()
+            return text, None
+
+        templates = [
+            CrawlTemplate("visa", "https://a", html="<p>a</p>"),
+            CrawlTemplate("visa", "https://b", html="<p>b</p>"),
+        ]
+        texts = {"https://a": "a", "https://b": "b"}
+        with patch(
+            "insights.tasks._create_combined_extractor", return_value=extract_page
+        ):
+            with self.assertRaises(SoftTimeLimitExceeded):
+                run_async(_extract_insights("visa", templates, texts, new_links=set()))
+
+        # 검색어 작업은 soft time limit 을 실패 결과로 반환합니다.
+        keyword = SearchKeyword.objects.create(keyword="visa")
+        with patch("insights.tasks.get_infos", side_effect=SoftTimeLimitExceeded()):
+            result = collect_keyword_insights(keyword.id, num=1)
+        self.assertEqual(result["status"], "error")
+
+    @override_settings(INSIGHT_EXTRACTION_MODE="three_step")
+    def test_get_infos_pipeline(self):
+        stale_at = timezone.now() - timedelta(days=31)
+        fresh = self.create_insight("https://a")
+        changed = self.create_insight("https://b", updated_at=stale_at, etag="b1")
+        not_modified = self.create_insight("https://d", updated_at=stale_at, etag="d1")
+        same_text = self.create_insight(
+            "https://e",
+            updated_at=stale_at,
+            content_fingerprint=get_text_fingerprint(extract_page_text("<p>same</p>")),
+        )
+
+        requested = []
+
+        def handler(request):
+            url = str(request.url)
+            requested.append(url)
+            if url == "https://d" and request.headers.get("if-none-match") == "d1":
+                return httpx.Response(304)
+            body = {
+                "https://b": "<p>https://b new</p>",
+                "https://c": "<p>https://c</p>",
+                "https://e": "<div> same </div>",
+            }.get(url, "")
+            return httpx.Response(200, headers={"etag": url[-1] + "2"}, text=body)
+
+        links = ["https://a", "https://b", "https://c", "https://d", "https://e"]
+        with patch.object(
+            GoogleCrawler,
+            "google_search_links_async",
+            new=AsyncMock(return_value=links + ["https://empty"]),
+        ), patch.object(
+            BaseCrawler,
+            "get_client",
+            return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ), patch(
+            "insights.tasks.AsyncGptProcessor"
+        ) as gpt_processor, patch(
+            "insights.tasks._categorize_insight",
+            new=AsyncMock(return_value="culture"),
+        ):
+            process = gpt_processor.return_value.process_text_async = AsyncMock(
+                side_effect=lambda data: ProcessedText(getattr(data, "text", data))
+            )
+            insights = get_infos("visa", num=6)
+
+        self.assertNotIn(
+            "https://a", requested
+        )  # 최근에 갱신된 인사이트는 요청하지 않음
+        self.assertEqual(process.call_count, 4)  # https://b, https://c 각각 2단계
+        self.assertEqual(
+            {insight["source_url"] for insight in insights}, {"https://b", "https://c"}
+        )
+        for insight in [fresh, changed, not_modified, same_text]:
+            insight.refresh_from_db()
+        self.assertEqual(fresh.content, "content")
+        # 추출한 텍스트가 그대로 LLM 입력이 됩니다.
+        self.assertEqual(changed.content, "https://b new")
+        self.assertEqual(changed.category, "visa")
+        self.assertEqual(changed.etag, "b2")
+        self.assertEqual(
+            changed.content_fingerprint,
+            get_text_fingerprint(extract_page_text("<p>https://b new</p>")),
+        )
+        self.assertEqual(
+            Insight.objects.get(source_url="https://c").category, "culture"
+        )
+
+        # 바뀌지 않은 페이지는 updated_at 만 갱신됩니다.
+        for insight in [not_modified, same_text]:
+            self.assertEqual(insight.content, "content")
+            self.assertGreater(insight.updated_at, stale_at)
+        self.assertEqual(not_modified.etag, "d1")
+        self.assertEqual(same_text.etag, "e2")
+
+    @override_settings(INSIGHT_EXTRACTION_MODE="combined")
+    def test_get_infos_combined_extraction(self):
+        existing = self.create_insight(
+            "https://a", updated_at=timezone.now() - timedelta(days=31)
+        )
+
+        async def fake_crawl(crawl_templates):
+            for template in crawl_templates:
+                template.html = f"<p>{template.link}</p>"
+
+        async def fake_process(text):
+            return json.dumps({"content": text, "category": "culture"})
+
+        with patch.object(
+            GoogleCrawler,
+            "google_search_links_async",
+            new=AsyncMock(return_value=["https://a", "https://b"]),
+        ), patch.object(
+            GoogleCrawler, "crawl_templates_async", side_effect=fake_crawl
+        ), patch(
+            "insights.tasks.AsyncGptProcessor"
+        ) as gpt_processor:
+            process = gpt_processor.return_value.process_async = AsyncMock(
+                side_effect=fake_process
+            )
+            get_infos("visa", num=2)
+
+        self.assertEqual(process.call_count, 2)  # 페이지당 한 번
+        self.assertEqual(
+            gpt_processor.call_args.kwargs["text_format"]["type"], "json_schema"
+        )
+        existing.refresh_from_db()
+        self.assertEqual(existing.content, "https://a")
+        self.assertEqual(existing.category, "visa")  # 기존 인사이트의 카테고리는 유지
+        self.assertEqual(
+            Insight.objects.get(source_url="https://b").category, "culture"
+        )
+
+    @patch(
+        "tiktoken_ext.openai_public.load_tiktoken_bpe",
+        return_value={bytes([i]): i for i in range(256)},
+    )
+    @patch("insights.processors.registry.OpenAI")
+    @patch("insights.processors.registry.AsyncOpenAI")
+    def test_combined_extractor_with_real_processor(
+        self, async_openai, openai, load_bpe
+    ):
+        # BPE 파일 다운로드만 막고, 모델 -> 인코딩 매핑과 워밍업은 실제 tiktoken 을 사용합니다.
+        processor_registry.clear()
+        self.addCleanup(processor_registry.clear)
+        processor_registry.warm_up(settings.INSIGHT_LLM_MODELS)
+
+        async def extract():
+            extract_page = _create_combined_extractor("visa", rate_limiter=None)
+            return await extract_page("<p>E-7 visa</p>", is_new=True)
+
+        async_openai.return_value.responses.create = AsyncMock(
+            return_value=MagicMock(
+                output_text=json.dumps({"content": "E-7", "category": "visa"}),
+                usage=None,
+            )
+        )
+        self.assertEqual(run_async(extract()), ("E-7", "visa"))
+        request = async_openai.return_value.responses.create.call_args.kwargs
+        self.assertEqual(request["model"], settings.INSIGHT_EXTRACTION_MODEL)
+        self.assertEqual(
+            processor_registry.get_encoding(settings.INSIGHT_EXTRACTION_MODEL).name,
+            "o200k_base",
+        )
+        # tiktoken 이 모르는 모델은 FALLBACK_ENCODING 을 사용합니다.
+        self.assertEqual(
+            processor_registry.get_encoding("unknown-model").name, "o200k_base"
+        )
+
+    def create_insight(self, source_url, updated_at=None, **fields):
+        insight = Insight.objects.create(
+            search_word="visa",
+            category="visa",
+            content="content",
+            source_url=source_url,
+            **fields,
+        )
+        if updated_at:
+            Insight.objects.filter(id=insight.id).update(updated_at=updated_at)
+        return insight
+
+    def test_token_bucket_limits_rate(self):
+        async def acquire_all():
+            bucket = AsyncTokenBucket(rate=20, capacity=2)
+            started_at = asyncio.get_running_loop().time()
+            await asyncio.gather(*[bucket.acquire() for _ in range(4)])
+            return asyncio.get_running_loop().time() - started_at
+
+        # 2개는 즉시, 나머지 2개는 초당 20개 속도로 채워질 때까지 기다립니다.
+        self.assertGreaterEqual(asyncio.run(acquire_all()), 0.09)
+
+
+@patch("insights.processors.registry.tiktoken.encoding_for_model")
+@patch("insights.processors.registry.OpenAI")
+class LLMResultCacheTest(TestCase):
+    def setUp(self):
+        processor_registry.clear()
+        self.addCleanup(processor_registry.clear)
+        caches[LLMResultCache.ALIAS].clear()
+        LLMResultCache.reset_stats()
+
+    def test_same_text_reuses_response(self, openai, encoding_for_model):
+        create = openai.return_value.responses.create
+        create.return_value = MagicMock(output_text="summary")
+        processor = GptProcessor(model="gpt-4", system_prompt="summarize")
+
+        self.assertEqual(processor.process("<p>hello   world</p>"), "summary")
+        # 마크업/공백만 다른 페이지는 같은 텍스트이므로 캐시된 응답을 사용합니다.
+        self.assertEqual(processor.process("<div>hello world</div>"), "summary")
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(LLMResultCache.stats()["hits"], 1)
+        self.assertEqual(LLMResultCache.stats()["misses"], 1)
+
+        # 모델이나 system prompt 가 다르면 다시 요청합니다.
+        GptProcessor(model="gpt-4", system_prompt="translate").process("hello world")
+        GptProcessor(model="gpt-4", system_prompt="summarize").process("hello there")
+        self.assertEqual(create.call_count, 3)
+
+    def test_processors_share_client_and_encoding(self, openai, encoding_for_model):
+        processor_registry.warm_up(["gpt-4"])
+        first = GptProcessor(model="gpt-4", system_prompt="a")
+        second = GptProcessor(model="gpt-4", system_prompt="b")
+        GptProcessor(model="gpt-3.5-turbo")
+
+        self.assertIs(first.client, second.client)
+        self.assertIs(first.encoding, second.encoding)
+        self.assertEqual(openai.call_count, 1)
+        self.assertEqual(encoding_for_model.call_count, 2)
+
+    def test_pipeline_passes_text_without_reparsing(self, openai, encoding_for_model):
+        create = openai.return_value.responses.create
+        create.side_effect = [
+            MagicMock(output_text="<b>E-7</b> visa", usage=MagicMock(output_tokens=3)),
+            MagicMock(output_text="summary", usage=MagicMock(output_tokens=1)),
+        ]
+        encode = encoding_for_model.return_value.encode
+        encode.side_effect = lambda text: text.split()
+        extractor = MagicMock(wraps=SoupTextExtractor())
+        pipeline = GptPipeline(
+            [
+                GptProcessor(max_tokens=2, text_extractor=extractor),
+                GptProcessor(
+                    max_tokens=3,
+                    text_extractor=extractor,
+                    input_type=GptProcessor.INPUT_TEXT,
+                ),
+            ]
+        )
+
+        self.assertEqual(pipeline.process("<p>a b c</p>"), "summary")
+        self.assertEqual(
+            extractor.extract.call_count, 1
+        )  # 두 번째 단계는 파싱하지 않음
+        self.assertEqual(encode.call_count, 1)  # 두 번째 단계는 output_tokens 를 사용
+        self.assertIn("<b>E-7</b> visa", create.call_args_list[1].kwargs["input"])
+
+    def test_use_cache_false(self, openai, encoding_for_model):
+        create = openai.return_value.responses.create
+        create.return_value = MagicMock(output_text="summary")
+        processor = GptProcessor(use_cache=False)
+
+        processor.process("hello")
+        processor.process("hello")
+        self.assertEqual(create.call_count, 2)
+
+
+class CountingEmbeddings(FakeEmbeddings):
+    embedded_texts: list = []
+    batches: list = []
+
+    def embed_documents(self, texts):
+        self.embedded_texts.extend(texts)
+        self.batches.append(texts)
+        return super().embed_documents(texts)
+
+
+class IncrementalVectorStoreTest(TestCase):
+    def setUp(self):
+        persist_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(persist_directory.cleanup)
+        self.embeddings = CountingEmbeddings(size=8, embedded_texts=[])
+        self.vector_store = IncrementalVectorStore(
+            VisaInfo, self.embeddings, persist_directory=persist_directory.name
+        )
+
+    def create_visa_info(self, visa_type):
+        return VisaInfo.objects.create(
+            visa_type=visa_type, requirements=[], process=[], duration="1 year"
+        )
+
+    def test_sync_embeds_only_changed_rows(self):
+        e7 = self.create_visa_info("E-7")
+        f4 = self.create_visa_info("F-4")
+        self.assertEqual(
+            self.vector_store.sync(), {"embedded": 2, "unchanged": 0, "removed": 0}
+        )
+        chunk_count = self.vector_store.count()
+        self.assertGreater(chunk_count, 0)
+
+        # 변경이 없으면 임베딩하지 않습니다.
+        self.embeddings.embedded_texts.clear()
+        self.assertEqual(
+            self.vector_store.sync(), {"embedded": 0, "unchanged": 0, "removed": 0}
+        )
+        self.assertEqual(self.embeddings.embedded_texts, [])
+
+        # updated_at 만 바뀐 행은 content hash 가 같으므로 다시 임베딩하지 않습니다.
+        e7.save()
+        f4.duration = "2 years"
+        f4.save()
+        self.assertEqual(
+            self.vector_store.sync(), {"embedded": 1, "unchanged": 1, "removed": 0}
+        )
+        self.assertTrue(
+            all(
+                "F-4" in text or "2 years" in text
+                for text in self.embeddings.embedded_texts
+            )
+        )
+        self.assertEqual(self.vector_store.count(), chunk_count)
+
+        VisaInfo.objects.filter(id=e7.id).soft_delete()
+        self.assertEqual(
+            self.vector_store.sync(), {"embedded": 0, "unchanged": 0, "removed": 1}
+        )
+        self.assertEqual(
+            {
+                doc.metadata["row_id"]
+                for doc in self.vector_store.store.similarity_search("visa", k=10)
+            },
+            {f4.id},
+        )
+
+    def test_crawl_validators_are_not_content(self):
+        persist_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(persist_directory.cleanup)
+        vector_store = IncrementalVectorStore(
+            Insight, self.embeddings, persist_directory=persist_directory.name
+        )
+        insight = Insight.objects.create(
+            search_word="visa",
+            category="visa",
+            content="E-7 visa",
+            source_url="https://a",
+            etag='W/"a1"',
+            content_fingerprint="a" * 64,
+        )
+        self.assertEqual(
+            vector_store.sync(), {"embedded": 1, "unchanged": 0, "removed": 0}
+        )
+        self.assertFalse(any("etag" in text for text in self.embeddings.embedded_texts))
+
+        # 바뀌지 않은 페이지를 다시 크롤링하면 (_touch_insights) 검증 값만 바뀝니다.
+        insight.etag = 'W/"a2"'
+        insight.last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+        insight.save()
+        self.assertEqual(
+            vector_store.sync(), {"embedded": 0, "unchanged": 1, "removed": 0}
+        )
+
+
+class CachedEmbeddingsTest(TestCase):
+    def test_embeds_missing_texts_once_in_batches(self):
+        embeddings = CountingEmbeddings(size=8, embedded_texts=[], batches=[])
+        cached = CachedEmbeddings(embeddings, batch_size=2)
+
+        vectors = cached.embed_documents(["a", "b", "a", "c"])
+        self.assertEqual(embeddings.batches, [["a", "b"], ["c"]])
+        self.assertEqual(vectors[0], vectors[2])
+        self.assertEqual(cached.embed_query("b"), vectors[1])
+        self.assertEqual(len(embeddings.batches), 2)
+
+        # 새 실행에서도 DB 에 저장된 벡터를 사용합니다.
+        embeddings.batches.clear()
+        next_run = CachedEmbeddings(embeddings)
+        next_vectors = next_run.embed_documents(["c", "d"])
+        self.assertEqual(embeddings.batches, [["d"]])
+        self.assertEqual(next_vectors[0], np.float32(vectors[3]).tolist())
+
+
+class KeywordEmbeddings(FakeEmbeddings):
+    """
+    문서에 포함된 키워드로 벡터를 만드는 결정적 임베딩입니다.
+    """
+
+    keywords: list = ["kimchi", "bow", "subway"]
+
+    def embed_documents(self, texts):
+        return [
+            [float(keyword in text) for keyword in self.keywords] + [0.1]
+            for text in texts
+        ]
+
+
+class VectorDeduplicatorTest(TestCase):
+    def create_culture_info(self, title):
+        return CultureInfo.objects.create(
+            culture_type="food", title=title, content=title, tags=[], source_urls=[]
+        )
+
+    def culture_data(self, title):
+        return {
+            "culture_type": "food",
+            "title": title,
+            "content": title,
+            "tags": [],
+            "source_urls": [],
+        }
+
+    def test_deduplicate(self):
+        kimchi = self.create_culture_info("kimchi")
+        deduplicator = VectorDeduplicator(
+            CultureInfo, KeywordEmbeddings(size=4), threshold=0.9
+        )
+
+        results = deduplicator.deduplicate(
+            [
+                self.culture_data("kimchi stew"),
+                self.culture_data("bow"),
+                self.culture_data("bow greeting"),  # 목록 안의 중복
+                self.culture_data("subway"),
+            ]
+        )
+
+        self.assertEqual(
+            [result.info["title"] for result in results],
+            ["kimchi stew", "bow", "subway"],
+        )
+        self.assertEqual(results[0].existing, kimchi)
+        self.assertGreaterEqual(results[0].similarity, 0.9)
+        self.assertIsNone(results[1].existing)
+        self.assertIsNone(results[2].existing)
+
+    def test_deduplicate_empty(self):
+        deduplicator = VectorDeduplicator(CultureInfo, KeywordEmbeddings(size=4))
+        self.assertEqual(deduplicator.deduplicate([]), [])
+        self.assertIsNone(
+            deduplicator.deduplicate([self.culture_data("kimchi")])[0].existing
+        )
+
+
+class KeyDeduplicatorTest(TestCase):
+    def visa_data(self, visa_type, duration="1 year"):
+        return {
+            "visa_type": visa_type,
+            "requirements": [],
+            "process": [],
+            "duration": duration,
+        }
+
+    def test_deduplicate_by_key(self):
+        e7 = VisaInfo.objects.create(
+            visa_type="E-7", requirements=[], process=[], duration="1 year"
+        )
+        results = KeyDeduplicator(VisaInfo, "visa_type").deduplicate(
+            [
+                self.visa_data("E-7", "2 years"),
+                self.visa_data("D-10"),
+                self.visa_data("E-7", "3 years"),  # 목록 안의 중복
+            ]
+        )
+
+        self.assertEqual(
+            [(result.info["visa_type"], result.existing) for result in results],
+            [("E-7", e7), ("D-10", None)],
+        )
+        self.assertEqual(results[0].info["duration"], "2 years")
+
+    def test_reingest_restores_soft_deleted_row(self):
+        e7 = VisaInfo.objects.create(
+            visa_type="E-7", requirements=[], process=[], duration="1 year"
+        )
+        VisaInfo.objects.filter(id=e7.id).soft_delete()
+
+        results = KeyDeduplicator(VisaInfo, "visa_type").deduplicate(
+            [self.visa_data("E-7", "2 years")]
+        )
+        _save_structured_info_results(Insight.CategoryEnum.VISA, results)
+
+        restored = VisaInfo.live.get(visa_type="E-7")
+        self.assertEqual(restored.id, e7.id)
+        self.assertEqual(restored.duration, "2 years")
+
+
+class BaseCrawlerTest(TestCase):
+    def test_shared_client_is_reused_across_runs(self):
+        async def get_client():
+            return BaseCrawler.get_client()
+
+        client = run_async(get_client())
+        self.assertIs(run_async(get_client()), client)
+        self.assertFalse(client.is_closed)
+
+    def test_limits_concurrent_requests_per_host(self):
+        active = {"a.com": 0, "b.com": 0}
+        max_active = dict(active)
+
+        async def handler(request):
+            host = request.url.host
+            active[host] += 1
+            max_active[host] = max(max_active[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, text=host)
+
+        async def crawl_all():
+            crawler = BaseCrawler()
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                return await asyncio.gather(
+                    *[
+                        crawler.crawl_async(f"https://{host}/{idx}", client)
+                        for idx in range(10)
+                        for host in active
+                    ]
+                )
+
+        results = asyncio.run(crawl_all())
+        self.assertEqual(results.count("a.com"), 10)
+        self.assertEqual(max_active["a.com"], BaseCrawler.MAX_REQUESTS_PER_HOST)
+        self.assertEqual(max_active["b.com"], BaseCrawler.MAX_REQUESTS_PER_HOST)
+
+    def crawl(self, handler, url="https://a.com/"):
+        async def crawl():
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                return await BaseCrawler().crawl_async(url, client)
+
+        return asyncio.run(crawl())
+
+    def test_crawl_stops_after_byte_budget(self):
+        sent = []
+
+        async def body():
+            for _ in range(100):
+                chunk = "가나다".encode() * 1000  # 9000 bytes
+                sent.append(chunk)
+                yield chunk
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html; charset=utf-8"},
+                content=body(),
+            )
+
+        with patch.object(BaseCrawler, "MAX_CONTENT_BYTES", 20000):
+            html = self.crawl(handler)
+
+        self.assertLess(len(sent), 100)
+        # 잘린 멀티바이트 문자는 대체 문자로 디코딩됩니다.
+        self.assertTrue(html.startswith("가나다"))
+        self.assertLessEqual(len(html.encode()), 20000 + 3)
+
+    def test_crawl_rejects_binary_content(self):
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": "application/pdf"}, content=b"%PDF"
+            )
+
+        with self.assertRaises(CrawlError):
+            self.crawl(handler)
+
+
+class TextExtractorTest(TestCase):
+    HTML = """
+        <!DOCTYPE html>
+        <html><head><title>비자  안내</title><meta charset="utf-8">
+        <style>p { color: red; }</style><script>var a = "<p>x</p>";</script></head>
+        <body><header><nav><a href="/">Home</a></nav></header>
+        <!-- comment -->
+        <div><p>E-7 &amp; F-4
+            visa</p><p>체류 <b>기간</b></p></div>
+        <footer>copyright</footer></body></html>
+    """
+
+    def test_streaming_matches_soup(self):
+        self.assertEqual(
+            StreamingTextExtractor().extract(self.HTML),
+            SoupTextExtractor().extract(self.HTML),
+        )
+        self.assertEqual(
+            StreamingTextExtractor().extract(self.HTML),
+            "비자 안내 E-7 & F-4 visa 체류 기간",
+        )
+
+    def test_fingerprint_ignores_markup(self):
+        self.assertEqual(
+            get_text_fingerprint(
+                extract_page_text("<div><p>a  b</p><script>x()</script></div>")
+            ),
+            get_text_fingerprint(extract_page_text("<p>a b</p>")),
+        )
+
+    def test_page_text_is_bounded_by_token_budget(self):
+        html = "<p>" + "가나다 " * 100000 + "</p>"
+        extractor = MagicMock(wraps=StreamingTextExtractor())
+        text = extract_page_text(html, extractor, max_tokens=10)
+        self.assertEqual(len(text), 10 * MAX_CHARS_PER_TOKEN)
+        extractor.extract.assert_called_once_with(
+            html, max_chars=10 * MAX_CHARS_PER_TOKEN
+        )
+
+    def test_streaming_stops_at_max_chars(self):
+        html = "<p>" + "가나다 " * 100000 + "</p>" + "<p>tail</p>"
+        text = StreamingTextExtractor().extract(html, max_chars=100)
+        self.assertEqual(len(text), 100)
+        self.assertTrue(text.startswith("가나다 가나다"))
+
+    @patch(
+        "tiktoken_ext.openai_public.load_tiktoken_bpe",
+        return_value={bytes([i]): i for i in range(256)},
+    )
+    def test_truncate_korean_text_over_token_budget(self, load_bpe):
+        # 바이트 단위 BPE 를 쓰는 cl100k_base 에서 한글 한 글자는 3 토큰입니다.
+        encoding = tiktoken.Encoding(**tiktoken_ext.openai_public.cl100k_base())
+        text = "비자 정보 " * 4
+        self.assertGreater(len(encoding.encode(text)), len(text))
+
+        truncated = truncate_text(text, encoding, max_tokens=len(text))
+        self.assertEqual(truncated.token_count, len(text))
+        self.assertEqual(len(encoding.encode(truncated.text)), len(text))
+        self.assertLess(len(truncated.text), len(text))
+
+
+class StubBatchHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.calls.append(("POST", self.path))
+        if self.path == "/v1/files":
+            # multipart 본문에서 JSONL 줄만 꺼냅니다.
+            self.server.requests = [
+                json.loads(line)
+                for line in body.decode().splitlines()
+                if line.startswith('{"custom_id"')
+            ]
+            return self.send_json(
+                {
+                    "id": "file-in",
+                    "object": "file",
+                    "bytes": len(body),
+                    "created_at": 0,
+                    "filename": "structured_info.jsonl",
+                    "purpose": "batch",
+                    "status": "processed",
+                }
+            )
+        if self.path == "/v1/batches":
+            return self.send_json(self.get_batch("validating"))
+        self.send_error(404)
+
+    def do_GET(self):
+        self.server.calls.append(("GET", self.path))
+        if self.path == "/v1/batches/batch-1":
+            return self.send_json(self.get_batch(self.server.statuses.pop(0)))
+        if self.path == "/v1/files/file-out/content":
+            lines = [
+                json.dumps(self.get_output_line(request["custom_id"]))
+                for request in self.server.requests
+            ]
+            return self.send_body("\n".join(lines).encode())
+        self.send_error(404)
+
+    def get_batch(self, status):
+        return {
+            "id": "batch-1",
+            "object": "batch",
+            "endpoint": "/v1/responses",
+            "input_file_id": "file-in",
+            "completion_window": "24h",
+            "created_at": 0,
+            "status": status,
+            "output_file_id": "file-out" if status == "completed" else None,
+        }
+
+    def get_output_line(self, custom_id):
+        output_text = self.server.outputs[custom_id]
+        if output_text is None:
+            response = {"status_code": 500, "body": {"error": {"message": "error"}}}
+        else:
+            response = {
+                "status_code": 200,
+                "body": {
+                    "id": f"resp-{custom_id}",
+                    "object": "response",
+                    "output": [
+                        {
+                            "type": "message",
+                            "role": "assistant",
+                            "content": [{"type": "output_text", "text": output_text}],
+                        }
+                    ],
+                },
+            }
+        return {"id": f"req-{custom_id}", "custom_id": custom_id, "response": response}
+
+    def send_json(self, data):
+        self.send_body(json.dumps(data).encode(), "application/json")
+
+    def send_body(self, body, content_type="application/octet-stream"):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubBatchServer(ThreadingHTTPServer):
+    """
+    OpenAI 의 files/batches 엔드포인트를 흉내 내는 로컬 서버입니다.
+    """
+
+    def __init__(self, outputs, statuses):
+        """
+        :param outputs: custom_id -> output_text (None 이면 실패 응답)
+        :param statuses: batches.retrieve 가 차례로 반환할 status
+        """
+        super().__init__(("127.0.0.1", 0), StubBatchHandler)
+        self.outputs = outputs
+        self.statuses = list(statuses)
+        self.requests = []
+        self.calls = []
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_port}/v1"
+
+
+class StructuredInfoBatchTest(TestCase):
+    def setUp(self):
+        persist_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(persist_directory.cleanup)
+        settings_override = override_settings(
+            INSIGHT_VECTOR_STORE_DIR=persist_directory.name,
+            INSIGHT_STRUCTURED_INFO_BACKEND="batch",
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        Insight.objects.create(
+            search_word="kimchi",
+            category=Insight.CategoryEnum.CULTURE,
+            content="kimchi is a korean side dish",
+            source_url="https://example.com/kimchi",
+        )
+        self.kimchi = CultureInfo.objects.create(
+            culture_type="food", title="kimchi", content="old", tags=[], source_urls=[]
+        )
+
+    def start_server(self, outputs, statuses):
+        server = StubBatchServer(outputs, statuses)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        processor = InfoBatchProcessor(
+            client=OpenAI(base_url=server.base_url, api_key="test", max_retries=0),
+            embeddings=KeywordEmbeddings(size=4),
+        )
+        processor_patch = patch(
+            "insights.tasks.InfoBatchProcessor", return_value=processor
+        )
+        processor_patch.start()
+        self.addCleanup(processor_patch.stop)
+        return server
+
+    def test_submit_and_ingest_batch(self):
+        visa_list = [
+            {
+                "visa_type": "E-7",
+                "requirements": ["degree"],
+                "process": ["apply"],
+                "duration": "1 year",
+            }
+        ]
+        culture_list = [
+            {
+                "culture_type": "food",
+                "title": "kimchi",
+                "content": "new",
+                "tags": ["food"],
+                "source_urls": [],
+            }
+        ]
+        # 다른 visa_type 의 기존 비자가 있어도 새 비자를 추가합니다.
+        VisaInfo.objects.create(
+            visa_type="D-2", requirements=["degree"], process=["apply"], duration="1 year"
+        )
+        server = self.start_server(
+            outputs={
+                "visa": json.dumps({"visa_list": visa_list}),
+                "culture": json.dumps({"culture_list": culture_list}),
+                "industry": None,
+            },
+            statuses=["in_progress", "completed"],
+        )
+
+        process_insights_to_structured_info()
+        info_batch = StructuredInfoBatch.objects.get()
+        self.assertEqual(info_batch.batch_id, "batch-1")
+        self.assertEqual(info_batch.input_file_id, "file-in")
+        self.assertEqual(
+            [request["custom_id"] for request in server.requests],
+            ["visa", "culture", "industry"],
+        )
+        request = server.requests[1]
+        self.assertEqual(request["url"], "/v1/responses")
+        self.assertEqual(request["body"]["text"]["format"]["name"], "CultureInfoList")
+        self.assertIn("kimchi is a korean side dish", json.dumps(request["body"]))
+
+        # 진행 중이면 상태만 저장합니다.
+        poll_structured_info_batches()
+        info_batch.refresh_from_db()
+        self.assertEqual(info_batch.status, "in_progress")
+        self.assertFalse(VisaInfo.objects.filter(visa_type="E-7").exists())
+
+        poll_structured_info_batches()
+        info_batch.refresh_from_db()
+        self.assertEqual(info_batch.status, "completed")
+        self.assertEqual(info_batch.output_file_id, "file-out")
+        self.assertIsNotNone(info_batch.ingested_at)
+        self.assertEqual(
+            VisaInfo.objects.get(visa_type="E-7").requirements, ["degree"]
+        )
+        # 유사한 기존 행은 갱신하고, 실패한 요청의 카테고리는 건너뜁니다.
+        self.kimchi.refresh_from_db()
+        self.assertEqual(self.kimchi.content, "new")
+        self.assertEqual(CultureInfo.objects.count(), 1)
+        self.assertFalse(IndustryInfo.objects.exists())
+
+        # 저장이 끝난 Batch 는 다시 조회하지 않습니다.
+        calls = len(server.calls)
+        poll_structured_info_batches()
+        self.assertEqual(len(server.calls), calls)
+
+    def test_failed_batch_is_not_polled_again(self):
+        server = self.start_server(
+            outputs={"visa": None, "culture": None, "industry": None},
+            statuses=["failed"],
+        )
+        process_insights_to_structured_info()
+
+        poll_structured_info_batches()
+        info_batch = StructuredInfoBatch.objects.get()
+        self.assertEqual(info_batch.status, "failed")
+        self.assertIsNone(info_batch.ingested_at)
+
+        calls = len(server.calls)
+        poll_structured_info_batches()
+        self.assertEqual(len(server.calls), calls)
@@ -2,6 +2,9 @@ from django.contrib import admin
 from django.utils import timezone
 
 from jobs.models import Job, JobApplication, JobBookmark, JobPostingRequest
+from jobs.services.job_posting_request_services import \
+    JobPostingApprovalService
+from jobs.tasks import approve_job_posting_requests
 
 
 @admin.register(JobPostingRequest)
@@ -27,30 +30,27 @@ class JobPostingRequestAdmin(admin.ModelAdmin):
     ]
     actions = ["approve_requests", "reject_requests"]
 
+    # 이 개수를 넘는 승인 요청은 Celery 작업으로 처리합니다.
+    async_approval_threshold = 100
+
     def approve_requests(self, request, queryset):
-        for posting_request in queryset.filter(
-            status=JobPostingRequest.StatusEnum.PENDING
-        ):
-            # Create a new job posting
-            job = Job.objects.create(
-                title=posting_request.title,
-                description=posting_request.description,
-                company_name=posting_request.company_name,
-                location=posting_request.location,
-                requirements=posting_request.requirements,
-                salary_range=posting_request.salary_range,
-                category=posting_request.category,
-                industry=posting_request.industry,
-                created_by=posting_request.requested_by,
+        request_ids = list(
+            queryset.filter(status=JobPostingRequest.StatusEnum.PENDING).values_list(
+                "id", flat=True
             )
+        )
 
-            # Update the request
-            posting_request.status = JobPostingRequest.StatusEnum.APPROVED
-            posting_request.reviewed_by = request.user
-            posting_request.reviewed_at = timezone.now()
-            posting_request.created_job = job
-            posting_request.review_comment = "관리자에 의해 승인되었습니다."
-            posting_request.save()
+        if len(request_ids) > self.async_approval_threshold:
+            approve_job_posting_requests.delay(request_ids, request.user.id)
+            self.message_user(
+                request, f"{len(request_ids)}건의 요청 승인을 백그라운드에서 진행합니다."
+            )
+            return
+
+        approved_count = JobPostingApprovalService(reviewer=request.user).approve(
+            request_ids
+        )
+        self.message_user(request, f"{approved_count}건의 요청을 승인했습니다.")
 
     approve_requests.short_description = "선택된 요청을 승인"
 
@@ -77,13 +77,14 @@ class JobAdmin(admin.ModelAdmin):
         "category",
         "industry",
         "is_hiring",
+        "bookmark_count",
         "posted_at",
         "expired_at",
         "created_by",
     ]
     list_filter = ["category", "industry", "is_hiring"]
     search_fields = ["title", "company_name", "description"]
-    readonly_fields = ["posted_at", "created_by"]
+    readonly_fields = ["posted_at", "created_by", "bookmark_count"]
 
 
 @admin.register(JobApplication)
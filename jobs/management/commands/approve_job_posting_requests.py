@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import AuthUser
+from jobs.models import JobPostingRequest
+from jobs.services.job_posting_request_services import \
+    JobPostingApprovalService
+
+
+class Command(BaseCommand):
+    help = "대기중인 채용공고 요청을 일괄 승인합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reviewer-id", type=int, required=True)
+        parser.add_argument(
+            "--ids",
+            type=int,
+            nargs="+",
+            help="승인할 요청 id (생략하면 대기중인 요청 전체)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            reviewer = AuthUser.objects.get(id=options["reviewer_id"], is_staff=True)
+        except AuthUser.DoesNotExist:
+            raise CommandError("관리자 계정을 찾을 수 없습니다.")
+
+        request_ids = options["ids"]
+        if not request_ids:
+            request_ids = JobPostingRequest.objects.filter(
+                status=JobPostingRequest.StatusEnum.PENDING
+            ).values_list("id", flat=True)
+
+        service = JobPostingApprovalService(
+            reviewer=reviewer,
+            chunk_size=options["chunk_size"],
+            progress_callback=lambda processed, total: self.stdout.write(
+                f"{processed}/{total}"
+            ),
+        )
+        approved_count = service.approve(request_ids)
+        self.stdout.write(f"approved: {approved_count}")
@@ -0,0 +1,7 @@
+from common.management.commands.cache_stats import CacheStatsCommand
+from jobs.services.job_cache_services import JobListCacheService
+
+
+class Command(CacheStatsCommand):
+    help = "채용공고 목록 캐시의 hit/miss 카운터를 출력합니다."
+    counter = JobListCacheService.counter
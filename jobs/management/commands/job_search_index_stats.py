@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.search.inverted_index import JobSearchIndex
+
+
+class Command(BaseCommand):
+    help = "채용공고 역색인을 빌드하고 소요 시간과 메모리 사용량을 출력합니다."
+
+    def handle(self, *args, **options):
+        index = JobSearchIndex()
+
+        started_at = time.perf_counter()
+        index.build()
+        elapsed = time.perf_counter() - started_at
+
+        self.stdout.write(f"build: {elapsed:.3f}s")
+        for key, value in index.memory_usage().items():
+            self.stdout.write(f"{key}: {value}")
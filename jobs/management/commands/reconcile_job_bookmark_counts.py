@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from jobs.models import Job, JobBookmark
+
+
+class Command(BaseCommand):
+    help = "Job.bookmark_count 를 삭제되지 않은 북마크 수와 비교하여 어긋난 값을 바로잡습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 어긋난 개수만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        live_bookmark_count = (
+            JobBookmark.live.filter(job=OuterRef("pk"))
+            .values("job")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        actual_count = Coalesce(Subquery(live_bookmark_count), 0)
+        drifted_job_ids = list(
+            Job.objects.annotate(actual_count=actual_count)
+            .exclude(bookmark_count=F("actual_count"))
+            .values_list("id", flat=True)
+        )
+
+        if not options["dry_run"]:
+            batch_size = options["batch_size"]
+            for idx in range(0, len(drifted_job_ids), batch_size):
+                # 조회 이후의 북마크 변경도 반영되도록 UPDATE 시점에 다시 계산합니다.
+                Job.objects.filter(
+                    id__in=drifted_job_ids[idx : idx + batch_size]
+                ).update(bookmark_count=actual_count)
+
+        self.stdout.write(f"drifted jobs: {len(drifted_job_ids)}")
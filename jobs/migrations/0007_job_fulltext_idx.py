@@ -0,0 +1,30 @@
+from django.db import migrations
+
+FULLTEXT_INDEX_NAME = "job_fulltext_idx"
+
+
+def create_fulltext_index(apps, schema_editor):
+    # FULLTEXT + ngram parser 는 MySQL 전용이므로 다른 DB(SQLite 테스트 등)에서는 건너뜁니다.
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute(
+        f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX_NAME} "
+        "ON job (title, description, company_name) WITH PARSER ngram"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute(f"DROP INDEX {FULLTEXT_INDEX_NAME} ON job")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0006_jobpostingrequest"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:34
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_bookmark_count(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    JobBookmark = apps.get_model("jobs", "JobBookmark")
+    live_bookmark_count = (
+        JobBookmark.objects.filter(job=OuterRef("pk"), deleted_at__isnull=True)
+        .values("job")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    Job.objects.update(bookmark_count=Coalesce(Subquery(live_bookmark_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0007_job_fulltext_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="bookmark_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_bookmark_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["bookmark_count", "id"], name="job_bookmar_436ee8_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0008_job_bookmark_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="job",
+            name="job_posted__6fe414_idx",
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["posted_at", "id"], name="job_posted__b2dc27_idx"
+            ),
+        ),
+    ]
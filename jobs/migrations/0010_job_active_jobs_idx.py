@@ -0,0 +1,35 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:52
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def close_expired_jobs(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.filter(is_hiring=True, expired_at__lt=timezone.now()).update(
+        is_hiring=False
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0009_job_posted_at_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(close_expired_jobs, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="job",
+            name="job_is_hiri_02cb61_idx",
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["is_hiring", "deleted_at", "posted_at"],
+                name="job_is_hiri_b1afd2_idx",
+            ),
+        ),
+    ]
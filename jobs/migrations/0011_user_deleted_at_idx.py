@@ -0,0 +1,32 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0010_job_active_jobs_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="jobbookmark",
+            name="job_bookmar_user_id_455d0b_idx",
+        ),
+        migrations.AddIndex(
+            model_name="jobapplication",
+            index=models.Index(
+                fields=["user", "deleted_at"], name="job_applica_user_id_5f3bdd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobbookmark",
+            index=models.Index(
+                fields=["user", "deleted_at", "bookmarked_at"],
+                name="job_bookmar_user_id_de0709_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-17 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0011_user_deleted_at_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="source_request_id",
+            field=models.BigIntegerField(editable=False, null=True, unique=True),
+        ),
+    ]
@@ -43,22 +43,27 @@ class Job(BaseModel):
     posted_at = models.DateTimeField(auto_now_add=True)
     expired_at = models.DateTimeField(null=True)
     is_hiring = models.BooleanField(default=True)
+    bookmark_count = models.PositiveIntegerField(default=0)
+    # 삭제되지 않은 북마크 수 (JobBookmarkService 에서 갱신)
     created_by = models.ForeignKey(
         "authentication.AuthUser",
         on_delete=models.SET_NULL,
         null=True,
         related_name="created_jobs",
     )
+    source_request_id = models.BigIntegerField(null=True, unique=True, editable=False)
+    # 이 공고를 만든 JobPostingRequest id (일괄 승인 후 생성된 Job 을 다시 찾는 데 사용)
 
     class Meta:
         db_table = "job"
         indexes = [
             models.Index(fields=["category"]),
             models.Index(fields=["industry"]),
-            models.Index(fields=["posted_at"]),
+            models.Index(fields=["posted_at", "id"]),
             models.Index(fields=["expired_at"]),
-            models.Index(fields=["is_hiring"]),
+            models.Index(fields=["is_hiring", "deleted_at", "posted_at"]),
             models.Index(fields=["created_by"]),
+            models.Index(fields=["bookmark_count", "id"]),
         ]
 
 
@@ -85,6 +90,7 @@ class JobApplication(BaseModel):
         db_table = "job_application"
         indexes = [
             models.Index(fields=["applied_at"]),
+            models.Index(fields=["user", "deleted_at"]),
         ]
 
 
@@ -101,7 +107,7 @@ class JobBookmark(BaseModel):
         db_table = "job_bookmark"
         unique_together = ("user", "job")
         indexes = [
-            models.Index(fields=["user", "bookmarked_at"]),
+            models.Index(fields=["user", "deleted_at", "bookmarked_at"]),
         ]
 
 
@@ -0,0 +1,155 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class JobLimitOffsetPagination(LimitOffsetPagination):
+    """
+    count=false 로 요청하면 전체 COUNT(*) 쿼리를 생략합니다.
+    이 경우 limit + 1 개를 조회하여 다음 페이지 존재 여부만 판단합니다.
+    """
+
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.count_query_param) != "false":
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        self.count = None
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    def get_next_link(self):
+        if self.count is None and not self.has_next:
+            return None
+        if self.count is None:
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(
+                url, self.offset_query_param, self.offset + self.limit
+            )
+        return super().get_next_link()
+
+
+class JobCursorPagination(BasePagination):
+    """
+    (정렬 기준값, id) 를 커서로 사용하는 keyset 페이지네이션입니다.
+    OFFSET 스캔과 COUNT(*) 없이 다음 페이지를 조회하므로 무한 스크롤에 사용합니다.
+    """
+
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+    default_limit = 20
+    max_limit = 100
+
+    # order_by 파라미터 -> 내림차순 keyset 컬럼 (Job.Meta.indexes 의 복합 인덱스와 동일)
+    ORDERINGS = {
+        "recently": ("posted_at", "id"),
+        "recommended": ("bookmark_count", "id"),
+    }
+    DEFAULT_ORDERING = "recently"
+    # 커서의 정수 값이 DB 정수 범위(BigAutoField)를 넘으면 조회 중 오류가 나므로 미리 거릅니다.
+    MAX_INTEGER = 2**63 - 1
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+
+        order_by = request.query_params.get("order_by")
+        field, id_field = self.ORDERINGS.get(
+            order_by, self.ORDERINGS[self.DEFAULT_ORDERING]
+        )
+        self.field = field
+
+        queryset = queryset.order_by(f"-{field}", f"-{id_field}")
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            value, last_id = cursor
+            queryset = queryset.filter(
+                Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": last_id})
+            )
+
+        results = list(queryset[: self.limit + 1])
+        self.has_next = len(results) > self.limit
+        self.page = results[: self.limit]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        last = self.page[-1]
+        value = getattr(last, self.field)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        cursor = base64.urlsafe_b64encode(json.dumps([value, last.id]).encode())
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor.decode())
+
+    def get_previous_link(self):
+        return None
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            value, last_id = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if self.field == "posted_at":
+                value = parse_datetime(value)
+                if value is None:
+                    raise ValueError
+            elif self.field == "bookmark_count":
+                value = self.to_bounded_int(value)
+            return value, self.to_bounded_int(last_id)
+        except (TypeError, ValueError):
+            raise NotFound("Invalid cursor")
+
+    def to_bounded_int(self, value) -> int:
+        value = int(value)
+        if not 0 <= value <= self.MAX_INTEGER:
+            raise ValueError
+        return value
@@ -0,0 +1,259 @@
+import math
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.search.tokenizer import tokenize
+
+
+class JobSearchIndex:
+    """
+    채용 중인 활성 채용공고(is_hiring, deleted_at IS NULL)에 대한 프로세스 내 역색인입니다.
+    term 마다 정렬된 job id 배열과 term frequency 배열(array)을 posting list 로 유지하고,
+    BM25 로 점수를 계산합니다. category/industry 필터는 색인 안에서 적용합니다.
+    """
+
+    # JobSearchService.FULLTEXT_COLUMNS 와 동일한 컬럼을 색인합니다.
+    INDEXED_FIELDS = ("title", "description", "company_name")
+    FILTER_FIELDS = ("category", "industry")
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._doc_terms: dict[int, tuple[str, ...]] = {}
+        self._doc_lengths: dict[int, int] = {}
+        self._doc_filters: dict[int, tuple[str, str]] = {}
+        self._total_length = 0
+        self._built = False
+        self._synced_at = None
+        self._checked_at = 0.0
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def build(self):
+        """
+        DB 의 채용 중인 활성 채용공고로 색인을 새로 만듭니다.
+        """
+        synced_at = timezone.now()
+        queryset = (
+            Job.live.filter(is_hiring=True)
+            .only("id", *self.INDEXED_FIELDS, *self.FILTER_FIELDS)
+            .order_by("id")
+        )
+
+        with self._lock:
+            self._clear()
+            for job in queryset.iterator(chunk_size=2000):
+                self._add(job)
+            self._built = True
+            self._synced_at = synced_at
+            self._checked_at = time.monotonic()
+
+    def ensure_ready(self):
+        """
+        색인이 없으면 만들고, 동기화 주기가 지났으면 다른 프로세스에서 변경된 채용공고를 반영합니다.
+        """
+        if not self._built:
+            self.build()
+            return
+
+        interval = settings.JOB_SEARCH_INDEX_SYNC_INTERVAL
+        if time.monotonic() - self._checked_at >= interval:
+            self.sync()
+
+    def sync(self):
+        """
+        마지막 동기화 이후 updated_at 이 바뀐 채용공고만 색인에 반영합니다.
+        updated_at 은 커밋보다 먼저 찍히므로 (expire_jobs 의 고정된 now, 승인 chunk 트랜잭션 등)
+        JOB_SEARCH_INDEX_SYNC_MARGIN 초만큼 앞에서부터 다시 읽습니다. 다시 반영해도 결과는 같습니다.
+        """
+        synced_at = timezone.now()
+        since = self._synced_at - timedelta(
+            seconds=settings.JOB_SEARCH_INDEX_SYNC_MARGIN
+        )
+        queryset = Job.objects.filter(updated_at__gte=since).only(
+            "id", "deleted_at", "is_hiring", *self.INDEXED_FIELDS, *self.FILTER_FIELDS
+        )
+
+        with self._lock:
+            for job in queryset.iterator(chunk_size=2000):
+                self._upsert(job)
+            self._synced_at = synced_at
+            self._checked_at = time.monotonic()
+
+    def reset(self):
+        """
+        색인을 비우고 다음 ensure_ready() 에서 다시 만들도록 합니다.
+        """
+        with self._lock:
+            self._clear()
+            self._synced_at = None
+
+    def update_job(self, job: Job):
+        """
+        저장된 채용공고를 색인에 반영합니다. 색인이 아직 만들어지지 않았다면 무시합니다.
+        """
+        if not self._built:
+            return
+        with self._lock:
+            self._upsert(job)
+
+    def remove_job(self, job_id: int):
+        if not self._built:
+            return
+        with self._lock:
+            self._remove(job_id)
+
+    def search(
+        self,
+        query: str,
+        limit: int = None,
+        category: str = None,
+        industry: str = None,
+    ) -> list[tuple[int, float]]:
+        """
+        모든 검색어 토큰을 포함하는 채용공고를 BM25 점수 순으로 반환합니다.
+        :param query: 검색어
+        :param limit: 최대 결과 개수 (category/industry 필터를 적용한 뒤 자릅니다)
+        :param category: 채용공고 카테고리
+        :param industry: 채용공고 산업
+        :return: (job id, 점수) 목록
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            postings = [self._postings.get(term) for term in terms]
+            if any(posting is None for posting in postings):
+                return []
+
+            postings.sort(key=lambda posting: len(posting[0]))
+            candidates = set(postings[0][0])
+            for doc_ids, _ in postings[1:]:
+                candidates.intersection_update(doc_ids)
+                if not candidates:
+                    return []
+
+            if category or industry:
+                candidates = {
+                    doc_id
+                    for doc_id in candidates
+                    if (not category or self._doc_filters[doc_id][0] == category)
+                    and (not industry or self._doc_filters[doc_id][1] == industry)
+                }
+
+            doc_count = len(self._doc_lengths)
+            average_length = self._total_length / doc_count
+            scores = dict.fromkeys(candidates, 0.0)
+            for doc_ids, term_frequencies in postings:
+                idf = math.log(
+                    1 + (doc_count - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5)
+                )
+                for doc_id in candidates:
+                    tf = term_frequencies[bisect_left(doc_ids, doc_id)]
+                    norm = self.BM25_K1 * (
+                        1
+                        - self.BM25_B
+                        + self.BM25_B * self._doc_lengths[doc_id] / average_length
+                    )
+                    scores[doc_id] += idf * tf * (self.BM25_K1 + 1) / (tf + norm)
+
+        results = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return results[:limit] if limit else results
+
+    def memory_usage(self) -> dict:
+        """
+        색인이 사용하는 메모리(바이트)를 대략적으로 계산합니다.
+        """
+        with self._lock:
+            postings_bytes = sum(
+                sys.getsizeof(doc_ids) + sys.getsizeof(term_frequencies)
+                for doc_ids, term_frequencies in self._postings.values()
+            )
+            terms_bytes = sys.getsizeof(self._postings) + sum(
+                sys.getsizeof(term) for term in self._postings
+            )
+            documents_bytes = (
+                sys.getsizeof(self._doc_terms)
+                + sum(sys.getsizeof(terms) for terms in self._doc_terms.values())
+                + sys.getsizeof(self._doc_lengths)
+                + sys.getsizeof(self._doc_filters)
+            )
+            return {
+                "documents": len(self._doc_lengths),
+                "terms": len(self._postings),
+                "postings": sum(len(doc_ids) for doc_ids, _ in self._postings.values()),
+                "postings_bytes": postings_bytes,
+                "terms_bytes": terms_bytes,
+                "documents_bytes": documents_bytes,
+                "total_bytes": postings_bytes + terms_bytes + documents_bytes,
+            }
+
+    def _clear(self):
+        self._postings = {}
+        self._doc_terms = {}
+        self._doc_lengths = {}
+        self._doc_filters = {}
+        self._total_length = 0
+        self._built = False
+
+    def _upsert(self, job: Job):
+        self._remove(job.id)
+        if job.deleted_at is None and job.is_hiring:
+            self._add(job)
+
+    def _add(self, job: Job):
+        text = " ".join(getattr(job, field) or "" for field in self.INDEXED_FIELDS)
+        term_counts = Counter(tokenize(text))
+
+        for term, count in term_counts.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array("q"), array("I"))
+            doc_ids, term_frequencies = posting
+
+            if not doc_ids or doc_ids[-1] < job.id:
+                doc_ids.append(job.id)
+                term_frequencies.append(count)
+            else:
+                position = bisect_left(doc_ids, job.id)
+                doc_ids.insert(position, job.id)
+                term_frequencies.insert(position, count)
+
+        length = sum(term_counts.values())
+        self._doc_terms[job.id] = tuple(term_counts)
+        self._doc_lengths[job.id] = length
+        self._doc_filters[job.id] = (job.category, job.industry)
+        self._total_length += length
+
+    def _remove(self, job_id: int):
+        terms = self._doc_terms.pop(job_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            doc_ids, term_frequencies = self._postings[term]
+            position = bisect_left(doc_ids, job_id)
+            del doc_ids[position]
+            del term_frequencies[position]
+            if not doc_ids:
+                del self._postings[term]
+
+        self._total_length -= self._doc_lengths.pop(job_id)
+        del self._doc_filters[job_id]
+
+
+job_search_index = JobSearchIndex()
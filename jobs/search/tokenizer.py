@@ -0,0 +1,36 @@
+import re
+import unicodedata
+
+WORD_PATTERN = re.compile(r"\w+")
+HANGUL_PATTERN = re.compile(r"[가-힣]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    검색용 토큰 목록을 만듭니다.
+    한글 구간은 띄어쓰기/조사와 무관하게 매칭되도록 bigram 으로 나누고,
+    그 외 단어(영문, 숫자)는 소문자 단어 단위로 사용합니다.
+    :param text: 원문
+    :return: 토큰 목록 (중복 포함)
+    """
+    if not text:
+        return []
+
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens = []
+    for word in WORD_PATTERN.findall(text):
+        position = 0
+        for match in HANGUL_PATTERN.finditer(word):
+            if match.start() > position:
+                tokens.append(word[position : match.start()])
+            tokens.extend(_bigrams(match.group()))
+            position = match.end()
+        if position < len(word):
+            tokens.append(word[position:])
+    return tokens
+
+
+def _bigrams(word: str) -> list[str]:
+    if len(word) == 1:
+        return [word]
+    return [word[idx : idx + 2] for idx in range(len(word) - 1)]
@@ -24,6 +24,14 @@ class JobSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "posted_at"]
 
 
+class JobWithUserStatusSerializer(JobSerializer):
+    is_bookmarked = serializers.BooleanField(read_only=True)
+    has_applied = serializers.BooleanField(read_only=True)
+
+    class Meta(JobSerializer.Meta):
+        fields = JobSerializer.Meta.fields + ["is_bookmarked", "has_applied"]
+
+
 class AdminJobPostingSerializer(serializers.ModelSerializer):
     class Meta:
         model = Job
@@ -0,0 +1,40 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from jobs.models import Job, JobBookmark
+
+
+class JobBookmarkService:
+    """
+    북마크 생성/삭제와 Job.bookmark_count 갱신을 하나의 트랜잭션에서 처리합니다.
+    """
+
+    @staticmethod
+    @transaction.atomic
+    def create_bookmark(user, job: Job) -> JobBookmark:
+        bookmark, created = JobBookmark.objects.get_or_create(user=user, job=job)
+        if not created:
+            # unique_together(user, job) 이므로 삭제된 북마크는 되살립니다.
+            # 이미 살아 있는 북마크(중복 요청)는 되살리지도, 카운트를 올리지도 않습니다.
+            now = timezone.now()
+            revived = JobBookmark.objects.filter(
+                pk=bookmark.pk, deleted_at__isnull=False
+            ).update(deleted_at=None, bookmarked_at=now, updated_at=now)
+            if not revived:
+                return bookmark
+            bookmark.refresh_from_db()
+
+        Job.objects.filter(id=job.id).update(bookmark_count=F("bookmark_count") + 1)
+        return bookmark
+
+    @staticmethod
+    @transaction.atomic
+    def delete_bookmark(user, job: Job) -> int:
+        deleted_count = JobBookmark.live.filter(user=user, job=job).soft_delete()
+
+        if deleted_count:
+            Job.objects.filter(id=job.id).update(
+                bookmark_count=F("bookmark_count") - deleted_count
+            )
+        return deleted_count
@@ -0,0 +1,76 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+
+from common.cache_counters import CacheHitCounter, incr_counter
+
+
+class JobListCacheService:
+    """
+    공개 채용공고 목록 응답(직렬화된 페이지)을 캐시합니다.
+    키는 (category, industry) 필터 조합별 버전을 포함하며,
+    채용공고가 변경되면 해당 공고가 포함될 수 있는 필터 조합의 버전을 올려 무효화합니다.
+    """
+
+    KEY_PREFIX = "jobs:list"
+    GLOBAL_VERSION_KEY = f"{KEY_PREFIX}:version"
+    ANY = "*"
+    counter = CacheHitCounter(KEY_PREFIX)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return settings.JOB_LIST_CACHE_TIMEOUT > 0
+
+    @classmethod
+    def get_key(cls, request) -> str:
+        category = request.query_params.get("category") or cls.ANY
+        industry = request.query_params.get("industry") or cls.ANY
+        filter_set_key = cls._filter_set_version_key(category, industry)
+
+        versions = cache.get_many([cls.GLOBAL_VERSION_KEY, filter_set_key])
+        params = urlencode(sorted(request.query_params.items()))
+        # next/previous 링크가 절대 URL 이므로 host 도 키에 포함합니다.
+        digest = hashlib.md5(f"{request.get_host()}?{params}".encode()).hexdigest()
+
+        return (
+            f"{cls.KEY_PREFIX}:{category}:{industry}"
+            f":v{versions.get(cls.GLOBAL_VERSION_KEY, 0)}"
+            f".{versions.get(filter_set_key, 0)}:{digest}"
+        )
+
+    @classmethod
+    def get(cls, key: str):
+        data = cache.get(key)
+        cls.counter.record(hit=data is not None)
+        return data
+
+    @classmethod
+    def set(cls, key: str, data):
+        cache.set(key, data, timeout=settings.JOB_LIST_CACHE_TIMEOUT)
+
+    @classmethod
+    def invalidate_filter_set(cls, category: str, industry: str):
+        """
+        해당 category/industry 의 채용공고가 나타날 수 있는 모든 필터 조합의 버전을 올립니다.
+        """
+        for category_key in (category, cls.ANY):
+            for industry_key in (industry, cls.ANY):
+                incr_counter(cls._filter_set_version_key(category_key, industry_key))
+
+    @classmethod
+    def invalidate_all(cls):
+        incr_counter(cls.GLOBAL_VERSION_KEY)
+
+    @classmethod
+    def stats(cls) -> dict:
+        return cls.counter.stats()
+
+    @classmethod
+    def reset_stats(cls):
+        cls.counter.reset()
+
+    @classmethod
+    def _filter_set_version_key(cls, category: str, industry: str) -> str:
+        return f"{cls.KEY_PREFIX}:version:{category}:{industry}"
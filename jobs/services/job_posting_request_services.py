@@ -0,0 +1,118 @@
+from typing import Callable, Iterable, Optional
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from jobs.models import Job, JobPostingRequest
+from jobs.services.job_cache_services import JobListCacheService
+
+
+class JobPostingApprovalService:
+    """
+    대기중인 채용공고 요청을 chunk 단위로 일괄 승인합니다.
+    chunk 마다 하나의 트랜잭션에서 Job 을 bulk_create 하고 요청을 bulk_update 합니다.
+    bulk_create 가 생성된 id 를 돌려주지 않는 DB(MySQL)에서는 Job.source_request_id 로
+    생성된 Job 을 다시 조회하여 id 를 채웁니다.
+    """
+
+    APPROVED_COMMENT = "관리자에 의해 승인되었습니다."
+    UPDATE_FIELDS = [
+        "status",
+        "reviewed_by",
+        "reviewed_at",
+        "created_job",
+        "review_comment",
+        "updated_at",
+    ]
+
+    def __init__(
+        self,
+        reviewer,
+        chunk_size: int = 500,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        :param reviewer: 승인하는 관리자
+        :param chunk_size: 한 트랜잭션에서 처리할 요청 수
+        :param progress_callback: chunk 처리 후 (처리한 수, 전체 수) 로 호출됩니다.
+        """
+        self.reviewer = reviewer
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+
+    def approve(self, request_ids: Iterable[int]) -> int:
+        """
+        :param request_ids: 승인할 요청 id 목록 (대기중이 아닌 요청은 무시합니다)
+        :return: 승인된 요청 수
+        """
+        pending_ids = list(
+            JobPostingRequest.objects.filter(
+                id__in=list(request_ids), status=JobPostingRequest.StatusEnum.PENDING
+            )
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        approved_count = 0
+        for idx in range(0, len(pending_ids), self.chunk_size):
+            approved_count += self._approve_chunk(
+                pending_ids[idx : idx + self.chunk_size]
+            )
+            if self.progress_callback:
+                self.progress_callback(approved_count, len(pending_ids))
+        return approved_count
+
+    @transaction.atomic
+    def _approve_chunk(self, request_ids: list[int]) -> int:
+        posting_requests = list(
+            JobPostingRequest.objects.select_for_update()
+            .filter(id__in=request_ids, status=JobPostingRequest.StatusEnum.PENDING)
+            .order_by("id")
+        )
+        jobs = [
+            Job(
+                title=posting_request.title,
+                description=posting_request.description,
+                company_name=posting_request.company_name,
+                location=posting_request.location,
+                requirements=posting_request.requirements,
+                salary_range=posting_request.salary_range,
+                category=posting_request.category,
+                industry=posting_request.industry,
+                created_by_id=posting_request.requested_by_id,
+                source_request_id=posting_request.id,
+            )
+            for posting_request in posting_requests
+        ]
+        self._create_jobs(jobs)
+        if jobs:
+            # bulk_create 는 post_save 시그널을 보내지 않으므로 chunk 마다 목록 캐시를 한 번 무효화합니다.
+            transaction.on_commit(JobListCacheService.invalidate_all)
+
+        now = timezone.now()
+        for posting_request, job in zip(posting_requests, jobs):
+            posting_request.status = JobPostingRequest.StatusEnum.APPROVED
+            posting_request.reviewed_by = self.reviewer
+            posting_request.reviewed_at = now
+            posting_request.created_job = job
+            posting_request.review_comment = self.APPROVED_COMMENT
+            posting_request.updated_at = now
+
+        JobPostingRequest.objects.bulk_update(posting_requests, self.UPDATE_FIELDS)
+        return len(posting_requests)
+
+    @staticmethod
+    def _create_jobs(jobs: list[Job]):
+        Job.objects.bulk_create(jobs)
+        if connection.features.can_return_rows_from_bulk_insert:
+            return
+
+        # MySQL 은 bulk_create 로 생성된 id 를 돌려주지 않으므로 요청 id 로 다시 조회합니다.
+        # 요청 행은 select_for_update 로 잠겨 있으므로 다른 승인과 겹치지 않습니다.
+        job_ids = dict(
+            Job.objects.filter(
+                source_request_id__in=[job.source_request_id for job in jobs]
+            ).values_list("source_request_id", "id")
+        )
+        for job in jobs:
+            job.id = job_ids[job.source_request_id]
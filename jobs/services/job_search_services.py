@@ -1,10 +1,23 @@
-from django.db.models import Count, Q
-from django.utils import timezone
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.fields import FloatField
+
+from jobs.search.inverted_index import job_search_index
 
 
 class JobSearchService:
+    # jobs/migrations/0007_job_fulltext_idx.py 의 FULLTEXT 인덱스 컬럼과 동일해야 합니다.
+    FULLTEXT_COLUMNS = ("title", "description", "company_name")
+    # MySQL ngram_token_size (기본값 2). 이보다 짧은 단어는 ngram 토큰이 만들어지지 않습니다.
+    NGRAM_TOKEN_SIZE = 2
+
     def __init__(self, queryset):
         self.queryset = queryset
+        self.is_scored = False
+        # inverted_index 검색 결과 (job id, 점수) 목록
+        self.index_results = None
 
     def filter_jobs(
         self,
@@ -13,13 +26,9 @@ class JobSearchService:
         industry: str = "",
         order_by: str = "",
     ):
-        self.queryset = self.queryset.filter(deleted_at__isnull=True)
-        self.queryset = self.queryset.filter(expired_at__gte=timezone.now())
-
-        if search:
-            self.queryset = self.queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+        # 마감된 채용공고는 expire_jobs 작업이 is_hiring=False 로 바꿉니다.
+        # (is_hiring, deleted_at, posted_at) 복합 인덱스를 사용합니다.
+        self.queryset = self.queryset.filter(is_hiring=True, deleted_at__isnull=True)
 
         if category:
             self.queryset = self.queryset.filter(category=category)
@@ -27,15 +36,137 @@ class JobSearchService:
         if industry:
             self.queryset = self.queryset.filter(industry=industry)
 
+        if search:
+            self.search_jobs(search, category, industry)
+            # 관련도 순 정렬(IndexSearchResults)이 아니면 역색인 결과로 queryset 을 거릅니다.
+            uses_relevance = not order_by or order_by == "relevance"
+            if self.index_results is not None and not uses_relevance:
+                self.queryset = self.queryset.filter(
+                    id__in=[job_id for job_id, _ in self.index_results]
+                )
+
         if order_by:
             if order_by == "recently":
-                self.queryset = self.queryset.order_by("-posted_at")
+                self.queryset = self.queryset.order_by("-posted_at", "-id")
             if order_by == "recommended":
                 self.get_recommended_count_of_jobs()
-                self.queryset = self.queryset.order_by("-recommended_count")
+                self.queryset = self.queryset.order_by("-recommended_count", "-id")
+            if order_by == "relevance" and self.is_scored:
+                self.order_by_relevance()
+        elif self.is_scored:
+            self.order_by_relevance()
 
         return self.queryset
 
+    def search_jobs(self, search: str, category: str = "", industry: str = ""):
+        """
+        검색어로 채용공고를 필터링합니다.
+        JOB_SEARCH_ENGINE 이 inverted_index 이면 프로세스 내 역색인에서 후보 id 를 가져오고,
+        MySQL 에서는 ngram FULLTEXT 인덱스로 MATCH ... AGAINST 구문 검색을 합니다.
+        두 경우 모두 관련도 순으로 정렬할 수 있으며, 그 외 DB 와 ngram 토큰이 없는 짧은 검색어(한 글자)는
+        부분 문자열 검색을 합니다.
+        :param search: 검색어
+        :param category: 역색인 검색에 함께 적용할 카테고리
+        :param industry: 역색인 검색에 함께 적용할 산업
+        """
+        if settings.JOB_SEARCH_ENGINE == "inverted_index":
+            self.search_jobs_by_index(search, category, industry)
+        elif self.use_fulltext_search() and self.has_ngram_tokens(search):
+            table = self.queryset.model._meta.db_table
+            columns = ", ".join(f"{table}.{column}" for column in self.FULLTEXT_COLUMNS)
+            # NATURAL LANGUAGE MODE 는 ngram 토큰의 OR 라서 바이그램 하나만 같아도 결과에 포함됩니다.
+            # 따옴표로 감싼 BOOLEAN MODE 검색은 ngram 구문 검색이 되어 부분 문자열 검색과 같은 결과가 나옵니다.
+            self.queryset = self.queryset.annotate(
+                search_score=RawSQL(
+                    f"MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)",
+                    (self.get_fulltext_phrase(search),),
+                    output_field=FloatField(),
+                )
+            ).filter(search_score__gt=0)
+            self.is_scored = True
+        else:
+            self.queryset = self.queryset.filter(
+                Q(title__icontains=search)
+                | Q(description__icontains=search)
+                | Q(company_name__icontains=search)
+            )
+
+    def search_jobs_by_index(self, search: str, category: str = "", industry: str = ""):
+        # 색인에는 채용 중인 채용공고만 있고 category/industry 도 색인 안에서 거르므로
+        # 결과를 자르지 않아도 필터 후 결과가 빠지지 않습니다.
+        job_search_index.ensure_ready()
+        self.index_results = job_search_index.search(
+            search, category=category or None, industry=industry or None
+        )
+        self.is_scored = True
+
+    def order_by_relevance(self):
+        if self.index_results is None:
+            self.queryset = self.queryset.order_by("-search_score", "-id")
+        else:
+            self.queryset = IndexSearchResults(self.queryset, self.index_results)
+
+    @staticmethod
+    def get_fulltext_phrase(search: str) -> str:
+        """
+        검색어를 BOOLEAN MODE 의 구문 검색("...")으로 만듭니다.
+        따옴표 안에서는 +, -, * 등의 연산자가 적용되지 않으므로 따옴표만 제거합니다.
+        """
+        return '"' + " ".join(search.replace('"', " ").split()) + '"'
+
+    @classmethod
+    def has_ngram_tokens(cls, search: str) -> bool:
+        return any(
+            len(word) >= cls.NGRAM_TOKEN_SIZE
+            for word in search.replace('"', " ").split()
+        )
+
+    @staticmethod
+    def use_fulltext_search() -> bool:
+        return connection.vendor == "mysql"
+
     def get_recommended_count_of_jobs(self):
         # TODO: 추천 로직 고도화
-        self.queryset = self.queryset.annotate(recommended_count=Count("bookmarks"))
+        self.queryset = self.queryset.annotate(recommended_count=F("bookmark_count"))
+
+
+class IndexSearchResults:
+    """
+    역색인 검색 결과를 관련도 순으로 페이지 단위로 조회합니다.
+    전체 개수와 정렬은 검색 결과 목록으로 계산하고, DB 에서는 페이지에 포함된 채용공고만 조회합니다.
+    페이지네이션 클래스가 사용하는 count() 와 슬라이싱을 지원합니다.
+    """
+
+    def __init__(self, queryset, results: list[tuple[int, float]]):
+        """
+        :param queryset: 채용공고 queryset (select_related 등이 적용된 상태)
+        :param results: 관련도 순 (job id, 점수) 목록
+        """
+        self.queryset = queryset
+        self.results = results
+
+    def count(self) -> int:
+        return len(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __getitem__(self, item: slice) -> list:
+        page = self.results[item]
+        jobs = self.queryset.in_bulk([job_id for job_id, _ in page])
+        # 색인 동기화 전에 마감/삭제된 채용공고는 페이지에서 제외됩니다.
+        ordered = []
+        for job_id, score in page:
+            job = jobs.get(job_id)
+            if job is not None:
+                job.search_score = score
+                ordered.append(job)
+        return ordered
+
+    def order_by(self, *fields):
+        """
+        다른 정렬이 필요한 경우(커서 페이지네이션 등) 검색 결과로 필터링한 queryset 을 반환합니다.
+        """
+        return self.queryset.filter(
+            id__in=[job_id for job_id, _ in self.results]
+        ).order_by(*fields)
@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from jobs.models import Job
+from jobs.search.inverted_index import job_search_index
+from jobs.services.job_cache_services import JobListCacheService
+
+
+@receiver(post_init, sender=Job)
+def remember_job_filter_set(sender, instance: Job, **kwargs):
+    # category/industry 가 바뀐 경우 이전 필터 조합의 캐시도 무효화하기 위해 저장해 둡니다.
+    # 지연 로딩(only/defer)된 필드는 조회하지 않도록 __dict__ 에서 읽습니다.
+    instance._loaded_filter_set = (
+        instance.__dict__.get("category"),
+        instance.__dict__.get("industry"),
+    )
+
+
+@receiver(post_save, sender=Job)
+def update_job_search_index(sender, instance: Job, **kwargs):
+    # deleted_at 이 설정된 저장(soft delete)은 색인에서 제거됩니다.
+    job_search_index.update_job(instance)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_list_cache(sender, instance: Job, **kwargs):
+    filter_sets = {instance._loaded_filter_set, (instance.category, instance.industry)}
+    for category, industry in filter_sets:
+        if category is None or industry is None:
+            JobListCacheService.invalidate_all()
+            continue
+        JobListCacheService.invalidate_filter_set(category, industry)
+    instance._loaded_filter_set = (instance.category, instance.industry)
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_search_index(sender, instance: Job, **kwargs):
+    job_search_index.remove_job(instance.id)
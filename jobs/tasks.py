@@ -0,0 +1,64 @@
+from typing import List
+
+from celery import shared_task
+from django.utils import timezone
+
+from authentication.models import AuthUser
+from jobs.models import Job
+from jobs.services.job_cache_services import JobListCacheService
+from jobs.services.job_posting_request_services import \
+    JobPostingApprovalService
+
+
+@shared_task(bind=True)
+def approve_job_posting_requests(
+    self, request_ids: List[int], reviewer_id: int, chunk_size: int = 500
+) -> int:
+    """
+    채용공고 요청을 일괄 승인합니다. 진행 상황은 PROGRESS 상태로 보고합니다.
+    :param request_ids: 승인할 요청 id 목록
+    :param reviewer_id: 승인하는 관리자 id
+    :param chunk_size: 한 트랜잭션에서 처리할 요청 수
+    :return: 승인된 요청 수
+    """
+
+    def report_progress(processed: int, total: int):
+        self.update_state(
+            state="PROGRESS", meta={"processed": processed, "total": total}
+        )
+
+    service = JobPostingApprovalService(
+        reviewer=AuthUser.objects.get(id=reviewer_id),
+        chunk_size=chunk_size,
+        progress_callback=report_progress,
+    )
+    return service.approve(request_ids)
+
+
+@shared_task
+def expire_jobs(chunk_size: int = 1000) -> int:
+    """
+    마감일(expired_at)이 지난 채용공고의 is_hiring 을 False 로 바꿉니다.
+    한 번에 많은 행을 잠그지 않도록 chunk 단위로 업데이트합니다.
+    :param chunk_size: 한 번에 업데이트할 채용공고 수
+    :return: 마감 처리된 채용공고 수
+    """
+    now = timezone.now()
+    expired_count = 0
+
+    while True:
+        job_ids = list(
+            Job.objects.filter(is_hiring=True, expired_at__lt=now).values_list(
+                "id", flat=True
+            )[:chunk_size]
+        )
+        if not job_ids:
+            break
+        expired_count += Job.objects.filter(id__in=job_ids).update(
+            is_hiring=False, updated_at=now
+        )
+
+    if expired_count:
+        # update() 는 post_save 시그널을 보내지 않으므로 목록 캐시를 직접 무효화합니다.
+        JobListCacheService.invalidate_all()
+    return expired_count
@@ -1,14 +1,31 @@
+import base64
 import datetime
+import io
+import json
 import random
+from unittest.mock import patch
 
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from rest_framework import status
+from rest_framework.request import Request
 from rest_framework.reverse import reverse
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from authentication.models import AuthUser
-from jobs.models import Job, JobBookmark
+from jobs.models import Job, JobPostingRequest
+from jobs.paginations import JobLimitOffsetPagination
+from jobs.search.inverted_index import job_search_index
+from jobs.search.tokenizer import tokenize
+from jobs.services.job_bookmark_services import JobBookmarkService
+from jobs.services.job_cache_services import JobListCacheService
+from jobs.services.job_posting_request_services import \
+    JobPostingApprovalService
+from jobs.services.job_search_services import JobSearchService
+from jobs.tasks import approve_job_posting_requests, expire_jobs
 
 
 class JobsTest(APITestCase):
@@ -55,9 +72,10 @@ class JobsTest(APITestCase):
                     social_provider="email",
                     locale="ko-KR",
                 )
-                JobBookmark.objects.create(user_id=user.id, job_id=job.id)
+                JobBookmarkService.create_bookmark(user, job)
 
-            if rand_int > self.most_bookmarked_job_count:
+            # 북마크 수가 같으면 최근 채용공고(id 가 큰 순)가 먼저 정렬됩니다.
+            if rand_int >= self.most_bookmarked_job_count:
                 self.most_bookmarked_job_count = rand_int
                 self.most_bookmarked_job = job
 
@@ -118,6 +136,124 @@ class JobsTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["id"], self.most_recent_job.id)
 
+    def test_search_jobs_by_company_name(self):
+        self.authenticate()
+
+        response = self.client.get("/jobs/jobs?limit=20&search=Google", follow=True)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 10)
+
+        response = self.client.get("/jobs/jobs?limit=20&search=Amazon", follow=True)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_get_jobs_cursor_pagination(self):
+        self.authenticate()
+
+        for order_by in ["recently", "recommended"]:
+            job_ids = []
+            url = f"/jobs/jobs/?pagination=cursor&limit=3&order_by={order_by}"
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotIn("count", response.data)
+                job_ids += [job["id"] for job in response.data["results"]]
+                url = response.data["next"]
+
+            self.assertEqual(len(job_ids), 11)
+            self.assertEqual(len(set(job_ids)), 11)
+            if order_by == "recommended":
+                self.assertEqual(job_ids[0], self.most_bookmarked_job.id)
+
+        response = self.client.get("/jobs/jobs/?pagination=cursor&cursor=invalid")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # 조작된 추천순 cursor 도 500 이 아닌 404 를 반환합니다.
+        for value, last_id in [("many", 1), ([1], 1), (None, 1), (1, 2**64)]:
+            cursor = base64.urlsafe_b64encode(json.dumps([value, last_id]).encode())
+            response = self.client.get(
+                "/jobs/jobs/?pagination=cursor&order_by=recommended"
+                f"&cursor={cursor.decode()}"
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_jobs_without_count(self):
+        self.authenticate()
+
+        response = self.client.get("/jobs/jobs/?limit=6&count=false")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["count"])
+        self.assertEqual(len(response.data["results"]), 6)
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertIsNone(response.data["next"])
+
+    def test_get_jobs_cache(self):
+        url = "/jobs/jobs/?limit=20&category=part_time"
+        self.authenticate()
+        JobListCacheService.reset_stats()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], 5)
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(JobListCacheService.stats()["hits"], 1)
+        self.assertEqual(JobListCacheService.stats()["misses"], 1)
+
+        job = Job.objects.filter(category="part_time").first()
+        job.category = "full_time"
+        job.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(JobListCacheService.stats()["misses"], 2)
+
+    def test_get_jobs_with_user_status(self):
+        self.authenticate()
+        JobBookmarkService.create_bookmark(self.user, self.most_recent_job)
+        self.client.post(
+            reverse("jobs:job-application-list"), {"job_id": self.most_recent_job.id}
+        )
+
+        with self.assertNumQueries(3):  # 인증 사용자 조회, COUNT, 목록
+            response = self.client.get(
+                "/jobs/jobs/?limit=20&order_by=recently&with_status=true"
+            )
+        results = {job["id"]: job for job in response.data["results"]}
+        self.assertTrue(results[self.most_recent_job.id]["is_bookmarked"])
+        self.assertTrue(results[self.most_recent_job.id]["has_applied"])
+        self.assertEqual(
+            sum(job["is_bookmarked"] or job["has_applied"] for job in results.values()),
+            1,
+        )
+
+        response = self.client.get(
+            f"/jobs/jobs/{self.most_recent_job.id}/?with_status=true"
+        )
+        self.assertTrue(response.data["is_bookmarked"])
+
+        response = self.client.get(f"/jobs/jobs/{self.most_recent_job.id}/")
+        self.assertNotIn("is_bookmarked", response.data)
+
+    def test_expire_jobs(self):
+        self.authenticate()
+        expired_jobs = list(Job.objects.filter(category="part_time")[:3])
+        Job.objects.filter(id__in=[job.id for job in expired_jobs]).update(
+            expired_at=timezone.now() - datetime.timedelta(days=1)
+        )
+
+        self.assertEqual(expire_jobs(chunk_size=2), 3)
+        self.assertEqual(Job.objects.filter(is_hiring=False).count(), 3)
+        self.assertEqual(expire_jobs(), 0)
+
+        response = self.client.get("/jobs/jobs/?limit=20&category=part_time")
+        self.assertEqual(response.data["count"], 2)
+
+        # 마감일이 없는 채용공고는 계속 노출됩니다.
+        response = self.client.get("/jobs/jobs/?limit=20&search=company")
+        self.assertEqual(response.data["results"][0]["id"], self.job.id)
+
     def test_my_bookmarked_jobs_success(self):
         url = reverse("jobs:job-bookmark-list")
         self.authenticate()
@@ -144,6 +280,44 @@ class JobsTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 0)
 
+    def test_my_bookmarked_jobs_pagination(self):
+        url = reverse("jobs:job-bookmark-list")
+        self.authenticate()
+
+        jobs = list(Job.objects.order_by("id")[:3])
+        for job in jobs:
+            JobBookmarkService.create_bookmark(self.user, job)
+        jobs[0].deleted_at = timezone.now()
+        jobs[0].save()
+
+        response = self.client.get(url, {"limit": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["results"][0]["id"], jobs[2].id)
+
+        response = self.client.get(url, {"ids_only": "true"})
+        self.assertEqual(response.data, [jobs[2].id, jobs[1].id])
+
+        response = self.client.get(
+            url, {"ids_only": "true", "job_ids": f"{jobs[1].id},{self.job.id}"}
+        )
+        self.assertEqual(response.data, [jobs[1].id])
+
+    def test_bookmark_count_with_duplicate_create(self):
+        def bookmark_count():
+            return Job.objects.get(id=self.job.id).bookmark_count
+
+        JobBookmarkService.create_bookmark(self.user, self.job)
+        JobBookmarkService.create_bookmark(self.user, self.job)  # 중복 요청
+        self.assertEqual(bookmark_count(), 1)
+
+        JobBookmarkService.delete_bookmark(self.user, self.job)
+        self.assertEqual(bookmark_count(), 0)
+
+        bookmark = JobBookmarkService.create_bookmark(self.user, self.job)
+        self.assertIsNone(bookmark.deleted_at)
+        self.assertEqual(bookmark_count(), 1)
+
     def test_my_bookmarked_jobs_fail(self):
         url = reverse("jobs:job-bookmark-list")
 
@@ -156,6 +330,34 @@ class JobsTest(APITestCase):
         response = self.client.delete(url + f"?job_id={self.job.id}")
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_bookmark_count(self):
+        url = reverse("jobs:job-bookmark-list")
+        detail_url = reverse("jobs:job-bookmark-detail", kwargs={"pk": 1})
+        self.authenticate()
+
+        self.client.post(url, {"job_id": self.job.id})
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.bookmark_count, 1)
+
+        self.client.delete(detail_url, {"job_id": self.job.id})
+        self.client.delete(detail_url, {"job_id": self.job.id})
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.bookmark_count, 0)
+
+        response = self.client.post(url, {"job_id": self.job.id})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.bookmark_count, 1)
+
+        Job.objects.update(bookmark_count=0)
+        call_command("reconcile_job_bookmark_counts", stdout=io.StringIO())
+        self.job.refresh_from_db()
+        self.most_bookmarked_job.refresh_from_db()
+        self.assertEqual(self.job.bookmark_count, 1)
+        self.assertEqual(
+            self.most_bookmarked_job.bookmark_count, self.most_bookmarked_job_count
+        )
+
     def test_my_job_applications_success(self):
         url = reverse("jobs:job-application-list")
         self.authenticate()
@@ -172,6 +374,224 @@ class JobsTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+        url = reverse("jobs:job-application-detail", kwargs={"pk": self.job.id})
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def authenticate(self):
         token = RefreshToken.for_user(self.user)
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token.access_token}")
+
+
+class JobSearchIndexTest(TestCase):
+    def setUp(self):
+        self.backend_job = self.create_job(
+            "백엔드 개발자", "Django REST API 개발", "카리어"
+        )
+        self.frontend_job = self.create_job("프론트엔드 개발자", "React 개발", "카리어")
+        self.designer_job = self.create_job("디자이너", "UI 디자인", "Google")
+        # 모듈 수준의 색인을 다른 테스트와 공유하지 않도록 테스트마다 다시 만듭니다.
+        job_search_index.reset()
+        self.addCleanup(job_search_index.reset)
+        job_search_index.build()
+
+    def create_job(self, title, description, company_name):
+        return Job.objects.create(
+            title=title,
+            description=description,
+            company_name=company_name,
+            location="Seoul",
+            expired_at=timezone.now() + datetime.timedelta(days=30),
+        )
+
+    def search_ids(self, query):
+        return [job_id for job_id, _ in job_search_index.search(query)]
+
+    def test_tokenize_korean_bigrams(self):
+        self.assertEqual(tokenize("백엔드 Django"), ["백엔", "엔드", "django"])
+
+    def test_search(self):
+        self.assertEqual(self.search_ids("django"), [self.backend_job.id])
+        self.assertEqual(
+            set(self.search_ids("개발자")),
+            {self.backend_job.id, self.frontend_job.id},
+        )
+        self.assertEqual(self.search_ids("프론트엔드"), [self.frontend_job.id])
+        self.assertEqual(self.search_ids("python"), [])
+
+    def test_incremental_update(self):
+        self.designer_job.title = "Django 디자이너"
+        self.designer_job.save()
+        self.assertEqual(
+            set(self.search_ids("django")),
+            {self.backend_job.id, self.designer_job.id},
+        )
+
+        self.backend_job.deleted_at = timezone.now()
+        self.backend_job.save()
+        self.assertEqual(self.search_ids("django"), [self.designer_job.id])
+
+        self.frontend_job.delete()
+        self.assertEqual(self.search_ids("react"), [])
+        self.assertEqual(job_search_index.memory_usage()["documents"], 1)
+
+    def test_sync_reads_late_commits(self):
+        # 동기화 이후에 커밋되었지만 updated_at 은 그 전에 찍힌 변경입니다.
+        Job.objects.filter(id=self.designer_job.id).update(
+            title="Django 디자이너",
+            updated_at=job_search_index._synced_at - datetime.timedelta(seconds=10),
+        )
+        job_search_index.sync()
+        self.assertEqual(
+            set(self.search_ids("django")),
+            {self.backend_job.id, self.designer_job.id},
+        )
+
+    @override_settings(JOB_SEARCH_ENGINE="inverted_index")
+    def test_search_service_uses_index(self):
+        results = JobSearchService(Job.objects.all()).filter_jobs(search="개발자")
+        self.assertEqual(results.count(), 2)
+        self.assertEqual(
+            [job.id for job in results[0:10]],
+            [job_id for job_id, _ in job_search_index.search("개발자")],
+        )
+
+    @override_settings(JOB_SEARCH_ENGINE="inverted_index")
+    def test_search_service_unknown_order_by_keeps_filter(self):
+        results = JobSearchService(Job.objects.all()).filter_jobs(
+            search="프론트엔드", order_by="popular"
+        )
+        self.assertEqual([job.id for job in results], [self.frontend_job.id])
+
+    @override_settings(JOB_SEARCH_ENGINE="inverted_index")
+    def test_index_filters_before_limit(self):
+        self.frontend_job.category = Job.CategoryEnum.CONTRACT
+        self.frontend_job.save()
+        closed_job = self.create_job("개발자", "개발자 개발자", "카리어")
+        closed_job.is_hiring = False
+        closed_job.save()
+
+        # 마감된 채용공고는 색인에 없고, 카테고리는 자르기 전에 적용됩니다.
+        self.assertEqual(
+            set(self.search_ids("개발자")), {self.backend_job.id, self.frontend_job.id}
+        )
+        self.assertEqual(
+            [
+                job_id
+                for job_id, _ in job_search_index.search(
+                    "개발자", limit=1, category=Job.CategoryEnum.CONTRACT
+                )
+            ],
+            [self.frontend_job.id],
+        )
+
+        results = JobSearchService(Job.objects.all()).filter_jobs(
+            search="개발자", category=Job.CategoryEnum.CONTRACT
+        )
+        paginator = JobLimitOffsetPagination()
+        page = paginator.paginate_queryset(
+            results, Request(APIRequestFactory().get("/jobs/jobs?limit=1"))
+        )
+        self.assertEqual(paginator.count, 1)
+        self.assertEqual([job.id for job in page], [self.frontend_job.id])
+
+    def test_fulltext_search_uses_phrase(self):
+        with patch.object(JobSearchService, "use_fulltext_search", return_value=True):
+            queryset = JobSearchService(Job.objects.all()).filter_jobs(
+                search='백엔드 "개발자"'
+            )
+        sql, params = queryset.query.sql_with_params()
+        self.assertIn("IN BOOLEAN MODE", sql)
+        self.assertIn('"백엔드 개발자"', params)
+
+    def test_fulltext_search_short_term_uses_icontains(self):
+        # 한 글자 검색어는 ngram 토큰이 없어 구문 검색 결과가 비므로 부분 문자열 검색을 합니다.
+        with patch.object(JobSearchService, "use_fulltext_search", return_value=True):
+            queryset = JobSearchService(Job.objects.all()).filter_jobs(search="개")
+        sql, _ = queryset.query.sql_with_params()
+        self.assertNotIn("MATCH", sql)
+        self.assertEqual(set(queryset), {self.backend_job, self.frontend_job})
+
+
+class JobPostingApprovalTest(TestCase):
+    def setUp(self):
+        self.admin = AuthUser.objects.create_user(
+            username="admin",
+            email="admin@gmail.com",
+            password="password",
+            is_staff=True,
+        )
+        self.requester = AuthUser.objects.create_user(
+            username="requester", email="requester@gmail.com", password="password"
+        )
+        self.posting_requests = [
+            JobPostingRequest.objects.create(
+                title=f"title{idx}",
+                description="description",
+                company_name="company",
+                location="Seoul",
+                requested_by=self.requester,
+            )
+            for idx in range(5)
+        ]
+        self.posting_requests[0].status = JobPostingRequest.StatusEnum.REJECTED
+        self.posting_requests[0].save()
+
+    def test_approve(self):
+        progress = []
+        service = JobPostingApprovalService(
+            reviewer=self.admin,
+            chunk_size=2,
+            progress_callback=lambda processed, total: progress.append(
+                (processed, total)
+            ),
+        )
+
+        approved_count = service.approve(
+            [posting_request.id for posting_request in self.posting_requests]
+        )
+        self.assertEqual(approved_count, 4)
+        self.assertEqual(progress, [(2, 4), (4, 4)])
+
+        for posting_request in self.posting_requests[1:]:
+            posting_request.refresh_from_db()
+            self.assertEqual(
+                posting_request.status, JobPostingRequest.StatusEnum.APPROVED
+            )
+            self.assertEqual(posting_request.reviewed_by, self.admin)
+            self.assertEqual(posting_request.created_job.title, posting_request.title)
+            self.assertEqual(posting_request.created_job.created_by, self.requester)
+        self.assertEqual(Job.objects.count(), 4)
+
+    def test_approve_without_returning_bulk_insert(self):
+        # MySQL 처럼 bulk_create 가 id 를 돌려주지 않아도 한 번에 INSERT 합니다.
+        service = JobPostingApprovalService(reviewer=self.admin, chunk_size=2)
+        with patch.object(
+            type(connection.features), "can_return_rows_from_bulk_insert", False
+        ), patch.object(
+            JobListCacheService, "invalidate_all"
+        ) as invalidate_all, self.captureOnCommitCallbacks(
+            execute=True
+        ):
+            approved_count = service.approve(
+                [posting_request.id for posting_request in self.posting_requests]
+            )
+
+        self.assertEqual(approved_count, 4)
+        self.assertEqual(invalidate_all.call_count, 2)  # chunk 마다 한 번
+        for posting_request in self.posting_requests[1:]:
+            posting_request.refresh_from_db()
+            self.assertEqual(posting_request.created_job.title, posting_request.title)
+            self.assertEqual(
+                posting_request.created_job.source_request_id, posting_request.id
+            )
+
+    def test_approve_task(self):
+        result = approve_job_posting_requests.delay(
+            [posting_request.id for posting_request in self.posting_requests],
+            self.admin.id,
+        )
+        self.assertEqual(result.get(), 4)
+        self.assertEqual(Job.objects.count(), 4)
@@ -1,27 +1,44 @@
 from django.db import transaction
-from django.utils import timezone
+from django.db.models import Exists, OuterRef
 from rest_framework import status, viewsets
+from rest_framework.exceptions import NotFound
 from rest_framework.mixins import (CreateModelMixin, DestroyModelMixin,
                                    ListModelMixin, RetrieveModelMixin)
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from common.errors import OBJECT_DOES_NOT_EXIST
 from common.permissions import IsStaffUser
-from common.utils import get_object_or_404_response
 from jobs.models import Job, JobApplication, JobBookmark, JobPostingRequest
+from jobs.paginations import JobCursorPagination, JobLimitOffsetPagination
 from jobs.serializers import (AdminJobPostingSerializer,
                               JobApplicationSerializer, JobBookmarkSerializer,
-                              JobPostingRequestSerializer, JobSerializer)
+                              JobPostingRequestSerializer, JobSerializer,
+                              JobWithUserStatusSerializer)
+from jobs.services.job_bookmark_services import JobBookmarkService
+from jobs.services.job_cache_services import JobListCacheService
 from jobs.services.job_search_services import JobSearchService
 
 
 class JobViewSet(viewsets.GenericViewSet, RetrieveModelMixin, ListModelMixin):
-    pagination_class = LimitOffsetPagination
+    pagination_class = JobLimitOffsetPagination
+
+    @property
+    def paginator(self):
+        # pagination=cursor 로 요청하면 keyset 페이지네이션을 사용합니다.
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("pagination") == "cursor":
+                self._paginator = JobCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_queryset(self):
-        return Job.objects.filter(deleted_at__isnull=True)
+        queryset = Job.live.all()
+        if self.with_user_status():
+            queryset = self.annotate_user_status(queryset)
+        return queryset
 
     def get_serializer_class(self):
         if self.request.user.is_staff:
@@ -29,6 +46,26 @@ class JobViewSet(viewsets.GenericViewSet, RetrieveModelMixin, ListModelMixin):
                 return AdminJobPostingSerializer
         return JobSerializer
 
+    def get_read_serializer_class(self):
+        if self.with_user_status():
+            return JobWithUserStatusSerializer
+        return JobSerializer
+
+    def with_user_status(self) -> bool:
+        # with_status=true 로 요청하면 현재 사용자의 북마크/지원 여부를 함께 반환합니다.
+        return self.request.query_params.get("with_status") == "true"
+
+    def annotate_user_status(self, queryset):
+        user = self.request.user
+        return queryset.annotate(
+            is_bookmarked=Exists(
+                JobBookmark.live.filter(user=user, job=OuterRef("pk"))
+            ),
+            has_applied=Exists(
+                JobApplication.live.filter(user=user, job=OuterRef("pk"))
+            ),
+        )
+
     def get_permission_classes(self):
         if self.action not in SAFE_METHODS:
             return [IsStaffUser]
@@ -36,10 +73,24 @@ class JobViewSet(viewsets.GenericViewSet, RetrieveModelMixin, ListModelMixin):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        serializer = JobSerializer(instance)
+        serializer = self.get_read_serializer_class()(instance)
         return Response(serializer.data)
 
     def list(self, request, *args, **kwargs):
+        # 사용자별 정보가 포함된 응답은 공용 캐시에 저장하지 않습니다.
+        if not JobListCacheService.is_enabled() or self.with_user_status():
+            return self.get_list_response(request)
+
+        cache_key = JobListCacheService.get_key(request)
+        data = JobListCacheService.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = self.get_list_response(request)
+        JobListCacheService.set(cache_key, response.data)
+        return response
+
+    def get_list_response(self, request):
         service = JobSearchService(self.get_queryset())
         search = request.query_params.get("search")
         category = request.query_params.get("category")
@@ -49,7 +100,7 @@ class JobViewSet(viewsets.GenericViewSet, RetrieveModelMixin, ListModelMixin):
         queryset = service.filter_jobs(search, category, industry, order_by)
         queryset = self.paginate_queryset(queryset)
 
-        serializer = JobSerializer(queryset, many=True)
+        serializer = self.get_read_serializer_class()(queryset, many=True)
         return self.get_paginated_response(serializer.data)
 
 
@@ -66,37 +117,61 @@ class JobBookmarkViewSet(
 ):
     queryset = JobBookmark.objects.all()
     serializer_class = JobBookmarkSerializer
+    pagination_class = JobLimitOffsetPagination
 
     def list(self, request: Request, *args, **kwargs):
+        """
+        북마크한 채용공고를 최근 북마크 순으로 반환합니다.
+        limit 을 지정하면 페이지네이션하고, ids_only=true 이면 job id 목록만 반환합니다.
+        job_ids=1,2,3 으로 확인할 채용공고를 제한할 수 있습니다.
+        """
         user = self.request.user
-        bookmarks = user.bookmarks.filter(deleted_at__isnull=True)
-        jobs = Job.objects.filter(bookmarks__in=bookmarks)
-        serializer = JobSerializer(jobs, many=True)
-        return Response(serializer.data)
+        bookmarks = JobBookmark.live.filter(
+            user=user, job__deleted_at__isnull=True
+        ).order_by("-bookmarked_at")
+
+        job_ids = request.query_params.get("job_ids")
+        if job_ids:
+            bookmarks = bookmarks.filter(
+                job_id__in=[job_id for job_id in job_ids.split(",") if job_id.isdigit()]
+            )
+
+        if request.query_params.get("ids_only") == "true":
+            queryset = bookmarks.values_list("job_id", flat=True)
+        else:
+            queryset = bookmarks.select_related("job")
+
+        page = self.paginate_queryset(queryset)
+        results = list(queryset) if page is None else page
+
+        if request.query_params.get("ids_only") == "true":
+            data = list(results)
+        else:
+            data = JobSerializer([bookmark.job for bookmark in results], many=True).data
+
+        if page is None:
+            return Response(data)
+        return self.get_paginated_response(data)
 
     @transaction.atomic
     def create(self, request: Request, *args, **kwargs):
         user = self.request.user
         job = Job.objects.get(id=request.data["job_id"])
 
-        if JobBookmark.objects.filter(
-            user=user, job=job, deleted_at__isnull=True
-        ).exists():
+        if JobBookmark.live.filter(user=user, job=job).exists():
             return Response(
                 {"detail": "이미 북마크한 채용공고입니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        serializer = JobBookmarkSerializer(data={"user": user.id, "job": job.id})
-        serializer.is_valid(raise_exception=True)
-        serializer.save(user=user, job=job)
+        JobBookmarkService.create_bookmark(user, job)
         return Response(status=status.HTTP_201_CREATED)
 
     @transaction.atomic
     def destroy(self, request: Request, *args, **kwargs):
         user = self.request.user
         job = Job.objects.get(id=request.data["job_id"])
-        JobBookmark.objects.filter(user=user, job=job).update(deleted_at=timezone.now())
+        JobBookmarkService.delete_bookmark(user, job)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -108,7 +183,7 @@ class JobApplicationViewSet(
 
     def list(self, request: Request, *args, **kwargs):
         user = self.request.user
-        applications = user.applications.filter(deleted_at__isnull=True)
+        applications = JobApplication.live.filter(user=user)
         serializer = JobApplicationSerializer(applications, many=True)
         return Response(serializer.data)
 
@@ -117,7 +192,7 @@ class JobApplicationViewSet(
         user = self.request.user
         job = Job.objects.get(id=request.data["job_id"])
 
-        if user.applications.filter(job=job, deleted_at__isnull=True).exists():
+        if JobApplication.live.filter(user=user, job=job).exists():
             return Response(
                 {"detail": "이미 지원한 채용공고입니다."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -134,8 +209,7 @@ class JobApplicationViewSet(
 
         pk = request.parser_context["kwargs"]["pk"]
         job = Job.objects.get(id=pk)
-        application = get_object_or_404_response(JobApplication, user=user, job=job)
-        application.deleted_at = timezone.now()
-        application.save()
+        if not JobApplication.live.filter(user=user, job=job).soft_delete():
+            raise NotFound(f"{OBJECT_DOES_NOT_EXIST}: cls name: JobApplication")
 
         return Response(status=status.HTTP_204_NO_CONTENT)
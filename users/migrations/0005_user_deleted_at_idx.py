@@ -0,0 +1,27 @@
+# Generated by Django 5.1.7 on 2026-10-17 14:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0004_alter_usercareerexperience_created_at_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="usercareerexperience",
+            index=models.Index(
+                fields=["user", "deleted_at"], name="user_career_user_id_b6f082_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usereducation",
+            index=models.Index(
+                fields=["user", "deleted_at"], name="user_educat_user_id_667bbd_idx"
+            ),
+        ),
+    ]
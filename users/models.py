@@ -66,6 +66,9 @@ class UserCareerExperience(BaseModel):
 
     class Meta:
         db_table = "user_career_experience"
+        indexes = [
+            models.Index(fields=["user", "deleted_at"]),
+        ]
 
 
 class UserEducation(BaseModel):
@@ -96,3 +99,6 @@ class UserEducation(BaseModel):
 
     class Meta:
         db_table = "user_education"
+        indexes = [
+            models.Index(fields=["user", "deleted_at"]),
+        ]
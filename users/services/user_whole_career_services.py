@@ -1,5 +1,3 @@
-from django.utils import timezone
-
 from authentication.models import AuthUser
 from common.utils import get_object_or_404_response
 from users.models import UserCareerExperience, UserEducation, UserProfile
@@ -14,12 +12,8 @@ class UserWholeCareerServices:
     def get_user_whole_career(self):
         user = AuthUser.objects.get(id=self.user_id)
         user_profile = get_object_or_404_response(UserProfile, user=user)
-        user_carrier_experiences = UserCareerExperience.objects.filter(
-            user=user, deleted_at__isnull=True
-        )
-        user_educations = UserEducation.objects.filter(
-            user=user, deleted_at__isnull=True
-        )
+        user_carrier_experiences = UserCareerExperience.live.filter(user=user)
+        user_educations = UserEducation.live.filter(user=user)
 
         user_profile_serializer = UserProfileSerializer(user_profile)
         user_carrier_serializer = UserCareerExperienceSerializer(
@@ -40,12 +34,8 @@ class UserWholeCareerServices:
     def update_user_whole_career(self, request_data):
         user = AuthUser.objects.get(id=self.user_id)
         user_profile = get_object_or_404_response(UserProfile, user=user)
-        user_carrier_experiences = UserCareerExperience.objects.filter(
-            user=user, deleted_at__isnull=True
-        )
-        user_educations = UserEducation.objects.filter(
-            user=user, deleted_at__isnull=True
-        )
+        user_carrier_experiences = UserCareerExperience.live.filter(user=user)
+        user_educations = UserEducation.live.filter(user=user)
 
         user_profile_serializer = UserProfileSerializer(
             user_profile, data=request_data.get("profile")
@@ -53,10 +43,8 @@ class UserWholeCareerServices:
         user_profile_serializer.is_valid(raise_exception=True)
         user_profile_serializer.save()
 
-        if user_carrier_experiences.exists():
-            user_carrier_experiences.update(deleted_at=timezone.now())
-        if user_educations.exists():
-            user_educations.update(deleted_at=timezone.now())
+        user_carrier_experiences.soft_delete()
+        user_educations.soft_delete()
 
         user_carrier_serializer = UserCareerExperienceSerializer(
             data=request_data.get("career_experiences"), many=True